@@ -0,0 +1,375 @@
+"""
+Benchmark dos caminhos críticos do sistema: inicialização, leitura, filtro, Treeview, carrinho e PDF.
+
+Gera planilhas sintéticas de fornecedores (reprodutíveis pela semente), mede cada
+etapa algumas vezes e grava os resultados em JSON para comparação entre execuções.
+
+Uso:
+    python benchmarks/benchmark.py
+    python benchmarks/benchmark.py --linhas 10000 100000 1000000 --formatos xlsx csv
+    python benchmarks/benchmark.py --comparar benchmarks/resultados/anterior.json
+    python benchmarks/benchmark.py --alvo-inicializacao 0.5
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Permite importar os módulos da aplicação (src/) sem instalação
+DIR_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+DIR_SRC = os.path.join(os.path.dirname(DIR_BENCHMARKS), 'src')
+sys.path.insert(0, DIR_SRC)
+
+from database import carregar_dados, ler_cabecalhos, filtrar_dados  # noqa: E402
+from pdf_generator import montar_pdf  # noqa: E402
+
+DIR_DADOS = os.path.join(DIR_BENCHMARKS, 'dados')
+DIR_RESULTADOS = os.path.join(DIR_BENCHMARKS, 'resultados')
+
+# Nomes de coluna usados nas planilhas sintéticas (como nas planilhas reais dos fornecedores)
+COL_DESCRICAO = 'Descrição'
+COL_PRECO = 'Preço'
+
+# Vocabulário para montar descrições parecidas com as de um catálogo de informática
+CATEGORIAS = ['SSD', 'HD', 'Memória', 'Placa de Vídeo', 'Processador', 'Fonte',
+              'Gabinete', 'Monitor', 'Teclado', 'Mouse', 'Placa Mãe', 'Cabo HDMI']
+MARCAS = ['Kingston', 'Samsung', 'Corsair', 'Gigabyte', 'Asus', 'Intel', 'AMD',
+          'Logitech', 'Redragon', 'Seagate', 'WD', 'Crucial', 'Husky', 'Pichau']
+MODELOS = ['A400', 'EVO', 'Vengeance', 'Fury', 'Ryzen 5', 'Core i5', 'RTX 4060',
+           'Blue', 'MX500', 'G203', 'Kumara', 'Prime', 'Aorus', 'Barracuda']
+ESPECIFICACOES = ['240GB', '480GB', '1TB', '2TB', '8GB DDR4', '16GB DDR5', '650W',
+                  '24 Pol', '27 Pol', 'ABNT2', 'RGB', 'SATA III', 'NVMe M.2', '3200MHz']
+
+# Filtros medidos (vazio = sem filtro, o caminho mais pesado do Treeview)
+FILTROS = ['', 'ssd', 'kingston 480', 'placa video rtx', 'xyz inexistente']
+
+# Meta de tempo (em segundos) entre iniciar o Python e a janela principal aparecer
+ALVO_INICIALIZACAO_S = 0.5
+
+# Executado em um processo novo a cada medição (nada importado antes, como ao abrir o programa).
+# Imprime: início do processo, tempo do "import main" e instante em que a janela apareceu
+SCRIPT_INICIALIZACAO = """
+import os, sys, time
+inicio = time.perf_counter()
+sys.path.insert(0, {dir_src!r})
+import tkinter as tk
+import main
+importado = time.perf_counter() - inicio
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print(importado, -1)
+else:
+    app = main.App(root)
+    root.update()
+    print(importado, time.time())
+sys.stdout.flush()
+os._exit(0)  # Sai sem esperar o pré-carregamento em segundo plano
+"""
+
+
+def gerar_catalogo(linhas, semente=42):
+    """Gera um DataFrame sintético de catálogo de fornecedor."""
+    rng = np.random.default_rng(semente)
+    partes = [
+        np.array(CATEGORIAS)[rng.integers(0, len(CATEGORIAS), linhas)],
+        np.array(MARCAS)[rng.integers(0, len(MARCAS), linhas)],
+        np.array(MODELOS)[rng.integers(0, len(MODELOS), linhas)],
+        np.array(ESPECIFICACOES)[rng.integers(0, len(ESPECIFICACOES), linhas)],
+    ]
+    codigos = rng.integers(100000, 999999, linhas).astype(str)
+    descricoes = pd.Series(partes[0])
+    for parte in partes[1:]:
+        descricoes = descricoes + ' ' + parte
+    descricoes = descricoes + ' - Ref ' + codigos
+
+    precos = np.round(rng.lognormal(mean=5, sigma=1, size=linhas), 2)
+    # Algumas linhas sujas, como nas planilhas reais (preço vazio ou texto)
+    sujas = rng.random(linhas) < 0.01
+    precos = precos.astype(object)
+    precos[sujas] = 'consultar'
+
+    return pd.DataFrame({
+        'Código': codigos,
+        COL_DESCRICAO: descricoes,
+        COL_PRECO: precos,
+        'Estoque': rng.integers(0, 500, linhas),
+    })
+
+
+def obter_planilha(linhas, formato, semente=42):
+    """
+    Retorna o caminho de uma planilha sintética, gerando-a apenas se ainda não existir.
+
+    Gerar um .xlsx grande leva minutos, então os arquivos ficam em cache em benchmarks/dados/.
+    """
+    os.makedirs(DIR_DADOS, exist_ok=True)
+    caminho = os.path.join(DIR_DADOS, f'catalogo_{linhas}_{semente}.{formato}')
+    if not os.path.exists(caminho):
+        print(f"Gerando {caminho}...")
+        df = gerar_catalogo(linhas, semente)
+        if formato == 'csv':
+            df.to_csv(caminho, index=False, sep=';')
+        else:
+            df.to_excel(caminho, index=False)
+    return caminho
+
+
+def medir(funcao, repeticoes):
+    """Executa a função várias vezes e retorna os tempos (em segundos) e o último resultado."""
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return tempos, resultado
+
+
+def registrar(resultados, etapa, linhas, formato, tempos, **extras):
+    """Adiciona uma medição à lista de resultados e imprime um resumo."""
+    registro = {
+        'etapa': etapa,
+        'linhas': linhas,
+        'formato': formato,
+        'mediana_s': statistics.median(tempos),
+        'min_s': min(tempos),
+        'max_s': max(tempos),
+        'repeticoes': len(tempos),
+    }
+    registro.update(extras)
+    resultados.append(registro)
+    detalhe = ' '.join(f'{k}={v!r}' for k, v in extras.items())
+    print(f"  {etapa:<24} {linhas:>9} {formato:<5} mediana {registro['mediana_s']:.4f}s {detalhe}")
+
+
+def criar_app_oculto(dir_sessao):
+    """
+    Cria a aplicação com a janela oculta, para medir o Treeview e o carrinho.
+
+    Args:
+        dir_sessao: Pasta de sessão vazia (a sessão real do usuário não é restaurada)
+
+    Returns:
+        tuple: (root, app) ou (None, None) se não houver display disponível
+    """
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Aviso: sem display disponível, etapas de interface ignoradas ({e}).")
+        return None, None
+    root.withdraw()
+    os.environ['SESSAO_DIR'] = dir_sessao
+    from main import App
+    return root, App(root)
+
+
+def medir_interface(app, df, linhas, formato, repeticoes, resultados):
+    """Mede o preenchimento do Treeview (atualizar_tabela) e o adicionar_selecionados."""
+    # Mesmo caminho da carga no App: o preço de venda é calculado junto
+    app.df = df.copy()
+    app.regras_preco.precificar(app.df)
+    app._limpar_carrinho()
+
+    for filtro in FILTROS:
+        app.entry_filtro.delete(0, 'end')
+        app.entry_filtro.insert(0, filtro)
+        tempos, _ = medir(app.atualizar_tabela, repeticoes)
+        registrar(resultados, 'treeview', linhas, formato, tempos, filtro=filtro,
+                  itens=len(app.tree_principal.get_children()))
+
+    # Adiciona ao carrinho 1.000 itens (ou todos, se houver menos)
+    app.entry_filtro.delete(0, 'end')
+    tempos = []
+    for _ in range(repeticoes):
+        # Carrinho vazio de verdade (dados, máscara e total): toda repetição parte do mesmo estado
+        app._limpar_carrinho()
+        app.atualizar_tabela()
+        app.tree_principal.selection_set(app.tree_principal.get_children()[:1000])
+        inicio = time.perf_counter()
+        app.adicionar_selecionados()
+        tempos.append(time.perf_counter() - inicio)
+    registrar(resultados, 'adicionar_selecionados', linhas, formato, tempos,
+              itens=len(app.itens_selecionados_dados))
+
+
+def medir_inicializacao(repeticoes, resultados, alvo, dir_sessao):
+    """
+    Mede a inicialização em processos novos: o "import main" e o tempo até a janela
+    aparecer (inclui a partida do interpretador). Sem display, mede só a importação.
+
+    Args:
+        dir_sessao: Pasta de sessão vazia, para a medida não incluir a restauração da
+            sessão real do usuário (nem a releitura da planilha dela)
+
+    Returns:
+        bool: True se a abertura da janela ficou dentro do alvo (ou não pôde ser medida)
+    """
+    script = SCRIPT_INICIALIZACAO.format(dir_src=DIR_SRC)
+    # Sem catálogo externo e sem sessão anterior: mede só a abertura da janela
+    ambiente = dict(os.environ, CATALOGO_SERVIDOR='', CATALOGO_SQLITE='', SESSAO_DIR=dir_sessao)
+    tempos_importacao = []
+    tempos_janela = []
+    for _ in range(repeticoes):
+        partida = time.time()
+        saida = subprocess.run(
+            [sys.executable, '-c', script], capture_output=True, text=True, env=ambiente, check=True
+        ).stdout.split()
+        tempos_importacao.append(float(saida[-2]))
+        if float(saida[-1]) >= 0:
+            tempos_janela.append(float(saida[-1]) - partida)
+
+    registrar(resultados, 'importar_main', 0, '-', tempos_importacao)
+    if not tempos_janela:
+        print("  Aviso: sem display disponível, tempo até a janela não medido.")
+        return True
+    registrar(resultados, 'abrir_janela', 0, '-', tempos_janela, alvo_s=alvo)
+    dentro = statistics.median(tempos_janela) <= alvo
+    if not dentro:
+        print(f"  <-- ACIMA DO ALVO de {alvo:.2f}s")
+    return dentro
+
+
+def medir_pdf(df, itens_pdf, repeticoes, resultados):
+    """Mede a montagem do PDF (montar_pdf, o núcleo do gerar_pdf) sem diálogos."""
+    caminho_pdf = os.path.join(DIR_DADOS, 'benchmark.pdf')
+    amostra = df.head(itens_pdf)
+    itens = [
+        (descricao, f'R$ {preco:.2f}', float(preco))
+        for descricao, preco in zip(amostra[COL_DESCRICAO], amostra[COL_PRECO])
+    ]
+    tempos, _ = medir(lambda: montar_pdf(caminho_pdf, itens), repeticoes)
+    registrar(resultados, 'gerar_pdf', len(itens), '-', tempos,
+              bytes=os.path.getsize(caminho_pdf))
+
+
+def comparar(atual, caminho_anterior, tolerancia, minimo_absoluto):
+    """
+    Compara com uma execução anterior e aponta regressões acima da tolerância.
+
+    Variações menores que minimo_absoluto (em segundos) são tratadas como ruído.
+
+    Returns:
+        int: Quantidade de regressões encontradas
+    """
+    with open(caminho_anterior, encoding='utf-8') as f:
+        anterior = json.load(f)
+
+    def chave(r):
+        return (r['etapa'], r['linhas'], r['formato'], r.get('filtro'))
+
+    base = {chave(r): r for r in anterior['resultados']}
+    regressoes = 0
+    print(f"\nComparação com {caminho_anterior}:")
+    for r in atual['resultados']:
+        b = base.get(chave(r))
+        if not b or not b['mediana_s']:
+            continue
+        variacao = (r['mediana_s'] - b['mediana_s']) / b['mediana_s']
+        marcador = ''
+        if variacao > tolerancia and r['mediana_s'] - b['mediana_s'] > minimo_absoluto:
+            marcador = '  <-- REGRESSÃO'
+            regressoes += 1
+        filtro = f" filtro={r['filtro']!r}" if 'filtro' in r else ''
+        print(f"  {r['etapa']:<24} {r['linhas']:>9} {r['formato']:<5}{filtro} "
+              f"{b['mediana_s']:.4f}s -> {r['mediana_s']:.4f}s ({variacao:+.1%}){marcador}")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, nargs='+', default=[10000, 100000],
+                        help='Tamanhos de planilha a gerar (ex.: 10000 100000 1000000)')
+    parser.add_argument('--formatos', nargs='+', default=['xlsx', 'csv'], choices=['xlsx', 'csv'])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--itens-pdf', type=int, default=1000, help='Quantidade de linhas do PDF medido')
+    parser.add_argument('--sem-interface', action='store_true', help='Não mede o Treeview nem o carrinho')
+    parser.add_argument('--saida', help='Arquivo JSON de saída (padrão: benchmarks/resultados/<data>.json)')
+    parser.add_argument('--comparar', help='JSON de uma execução anterior para comparação')
+    parser.add_argument('--tolerancia', type=float, default=0.10,
+                        help='Variação máxima aceita antes de apontar regressão (padrão: 10%%)')
+    parser.add_argument('--minimo-absoluto', type=float, default=0.005,
+                        help='Diferença mínima em segundos para apontar regressão (padrão: 0.005)')
+    parser.add_argument('--alvo-inicializacao', type=float, default=ALVO_INICIALIZACAO_S,
+                        help='Tempo máximo até a janela aparecer, em segundos (padrão: %(default)s)')
+    args = parser.parse_args()
+
+    resultados = []
+    # Sessão descartável: os tempos não dependem da sessão salva na máquina
+    sessao_temporaria = tempfile.TemporaryDirectory()
+    print("Inicialização")
+    inicializacao_ok = medir_inicializacao(
+        args.repeticoes, resultados, args.alvo_inicializacao, sessao_temporaria.name
+    )
+
+    root, app = (None, None) if args.sem_interface else criar_app_oculto(sessao_temporaria.name)
+    df_maior = None
+
+    for linhas in args.linhas:
+        for formato in args.formatos:
+            caminho = obter_planilha(linhas, formato, args.semente)
+            print(f"\n{os.path.basename(caminho)}")
+
+            tempos, _ = medir(lambda: ler_cabecalhos(caminho), args.repeticoes)
+            registrar(resultados, 'ler_cabecalhos', linhas, formato, tempos)
+
+            tempos, df = medir(lambda: carregar_dados(caminho, COL_DESCRICAO, COL_PRECO), args.repeticoes)
+            registrar(resultados, 'carregar_dados', linhas, formato, tempos, validas=len(df))
+
+            for filtro in FILTROS[1:]:
+                tempos, df_filtrado = medir(lambda: filtrar_dados(df, filtro), args.repeticoes)
+                registrar(resultados, 'filtrar_dados', linhas, formato, tempos,
+                          filtro=filtro, itens=len(df_filtrado))
+
+            if app is not None:
+                medir_interface(app, df, linhas, formato, args.repeticoes, resultados)
+
+            if df_maior is None or len(df) > len(df_maior):
+                df_maior = df
+
+    if df_maior is not None:
+        print()
+        medir_pdf(df_maior, args.itens_pdf, args.repeticoes, resultados)
+
+    if root is not None:
+        root.destroy()
+    sessao_temporaria.cleanup()
+
+    saida = {
+        'metadados': {
+            'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'semente': args.semente,
+            'repeticoes': args.repeticoes,
+        },
+        'resultados': resultados,
+    }
+
+    caminho_saida = args.saida
+    if not caminho_saida:
+        os.makedirs(DIR_RESULTADOS, exist_ok=True)
+        caminho_saida = os.path.join(DIR_RESULTADOS, time.strftime('%Y%m%d_%H%M%S') + '.json')
+    with open(caminho_saida, 'w', encoding='utf-8') as f:
+        json.dump(saida, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados gravados em {caminho_saida}")
+
+    regressoes = comparar(saida, args.comparar, args.tolerancia, args.minimo_absoluto) if args.comparar else 0
+    if regressoes or not inicializacao_ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+import sqlite3
+import os
+import time
+
+import pandas as pd
+
+from database import carregar_dados, normalizar_codigos, parece_codigo
+from desempenho import medir, cronometrado
+
+# Máximo de linhas devolvidas por consulta (o Treeview não precisa de mais que isso)
+LIMITE_RESULTADOS = 1000
+
+# Linhas gravadas por lote durante a importação
+TAMANHO_LOTE_IMPORTACAO = 50000
+
+_ESQUEMA = """
+CREATE TABLE itens (
+    id INTEGER PRIMARY KEY,
+    descricao TEXT NOT NULL,
+    preco REAL NOT NULL,
+    codigo TEXT,            -- Código (EAN/SKU) como está na planilha
+    codigo_busca TEXT,      -- O mesmo código normalizado (normalizar_codigos), para a busca exata
+    aba TEXT                -- Aba de origem (categoria das margens por categoria)
+);
+CREATE INDEX idx_itens_preco ON itens (preco);
+CREATE INDEX idx_itens_codigo ON itens (codigo_busca);
+
+-- Índice FTS5 com tokenizador trigram: permite buscar trechos no meio das
+-- palavras ("480" em "480GB") com LIKE indexado, como o filtro do App
+CREATE VIRTUAL TABLE itens_fts USING fts5(
+    descricao, content='itens', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TABLE metadados (
+    chave TEXT PRIMARY KEY,
+    valor TEXT
+);
+"""
+
+
+@cronometrado('importar_sqlite')
+def importar_planilha(caminho_arquivo: str, nome_col_descricao: str, nome_col_preco: str,
+                      caminho_catalogo: str, abas: list = None, nome_col_codigo: str = None) -> int:
+    """
+    Importa a planilha (via carregar_dados) para um catálogo SQLite com índice FTS5.
+
+    O arquivo de catálogo é recriado do zero. Depois de importado, ele pode ser aberto
+    instantaneamente com CatalogoSQLite, sem ler a planilha novamente.
+
+    Args:
+        caminho_arquivo (str): Planilha de origem (Excel/CSV).
+        nome_col_descricao (str): Coluna de descrição na planilha.
+        nome_col_preco (str): Coluna de preço na planilha.
+        caminho_catalogo (str): Arquivo .db a ser criado.
+        abas (list): Abas do Excel a importar (padrão: só a primeira).
+        nome_col_codigo (str): Coluna de código (EAN/SKU) na planilha, opcional.
+
+    Returns:
+        int: Quantidade de linhas importadas.
+
+    Raises:
+        Exception: Em caso de falha na leitura da planilha ou na gravação do catálogo.
+    """
+    df = carregar_dados(caminho_arquivo, nome_col_descricao, nome_col_preco, abas, nome_col_codigo)
+
+    # Grava em um arquivo temporário e só substitui o catálogo no final,
+    # para não deixar um catálogo pela metade se algo falhar
+    caminho_temporario = caminho_catalogo + '.tmp'
+    if os.path.exists(caminho_temporario):
+        os.remove(caminho_temporario)
+
+    try:
+        conexao = sqlite3.connect(caminho_temporario)
+        try:
+            conexao.executescript(_ESQUEMA)
+            ids = df.index.tolist()
+            descricoes = df['Descrição'].astype(str).tolist()
+            precos = df['Preço'].astype(float).tolist()
+            vazios = [None] * len(ids)
+            if 'Código' in df.columns:
+                preenchidos = df['Código'].notna()
+                codigos = df['Código'].astype(object).where(preenchidos, None).tolist()
+                codigos_busca = normalizar_codigos(df['Código']).astype(object).where(preenchidos, None).tolist()
+            else:
+                codigos = codigos_busca = vazios
+            abas_itens = df['Aba'].astype(str).tolist() if 'Aba' in df.columns else vazios
+            for inicio in range(0, len(ids), TAMANHO_LOTE_IMPORTACAO):
+                fim = inicio + TAMANHO_LOTE_IMPORTACAO
+                conexao.executemany(
+                    "INSERT INTO itens (id, descricao, preco, codigo, codigo_busca, aba) VALUES (?, ?, ?, ?, ?, ?)",
+                    zip(ids[inicio:fim], descricoes[inicio:fim], precos[inicio:fim], 
+                        codigos[inicio:fim], codigos_busca[inicio:fim], abas_itens[inicio:fim])
+                )
+            # Constrói o índice FTS de uma vez (bem mais rápido que linha a linha)
+            conexao.execute("INSERT INTO itens_fts (itens_fts) VALUES ('rebuild')")
+
+            estatisticas = os.stat(caminho_arquivo)
+            conexao.executemany("INSERT INTO metadados (chave, valor) VALUES (?, ?)", [
+                ('arquivo_origem', os.path.abspath(caminho_arquivo)),
+                ('tamanho_origem', str(estatisticas.st_size)),
+                ('modificado_origem', str(estatisticas.st_mtime)),
+                ('coluna_descricao', nome_col_descricao),
+                ('coluna_preco', nome_col_preco),
+                ('coluna_codigo', nome_col_codigo or ''),
+                ('abas', ';'.join(abas or [])),
+                ('importado_em', time.strftime('%Y-%m-%dT%H:%M:%S')),
+            ])
+            conexao.commit()
+        finally:
+            conexao.close()
+        os.replace(caminho_temporario, caminho_catalogo)
+    except BaseException as e:
+        # Qualquer falha (inclusive Ctrl+C) remove o temporário antes de propagar
+        if os.path.exists(caminho_temporario):
+            os.remove(caminho_temporario)
+        if isinstance(e, sqlite3.OperationalError):
+            raise Exception(f"Falha ao gravar o catálogo SQLite (o SQLite precisa ter suporte a FTS5): {e}")
+        raise
+
+    return len(df)
+
+
+def _padrao_like(filtro: str) -> str:
+    """
+    Converte o filtro do usuário no padrão LIKE equivalente ao filtro fuzzy do App
+    (palavras na ordem, em qualquer posição): "ssd kin" -> "%ssd%kin%".
+
+    Os curingas do LIKE ('%' e '_') digitados pelo usuário viram separadores de palavra,
+    pois uma cláusula ESCAPE impediria o SQLite de usar o índice trigram.
+    """
+    palavras = filtro.replace('%', ' ').replace('_', ' ').split()
+    return '%' + '%'.join(palavras) + '%'
+
+
+class CatalogoSQLite:
+    """
+    Catálogo servido direto do disco a partir de um arquivo importado por importar_planilha.
+
+    Tem a mesma busca paginada do ClienteCatalogo (buscar), então o App pode usar
+    qualquer um dos dois como fonte externa de catálogo.
+    """
+
+    def __init__(self, caminho_catalogo: str):
+        if not os.path.exists(caminho_catalogo):
+            raise FileNotFoundError(caminho_catalogo)
+        self.caminho_catalogo = caminho_catalogo
+        # Somente leitura: o catálogo só é alterado por uma nova importação
+        self._conexao = sqlite3.connect(f"file:{caminho_catalogo}?mode=ro", uri=True)
+        self.metadados = dict(self._conexao.execute("SELECT chave, valor FROM metadados"))
+        # Catálogos importados antes das colunas de código e aba não as têm
+        colunas = {linha[1] for linha in self._conexao.execute("PRAGMA table_info(itens)")}
+        self.tem_codigo = bool(self.metadados.get('coluna_codigo')) and 'codigo_busca' in colunas
+        self.tem_aba = 'aba' in colunas and bool(self.metadados.get('abas'))
+        self._colunas = ['id', 'Descrição', 'Preço']
+        self._selecao = "i.id, i.descricao, i.preco"
+        if self.tem_codigo:
+            self._colunas.append('Código')
+            self._selecao += ", i.codigo"
+        if self.tem_aba:
+            self._colunas.append('Aba')
+            self._selecao += ", i.aba"
+
+    def buscar(self, filtro='', preco_min=None, preco_max=None, limite=LIMITE_RESULTADOS, offset=0):
+        """
+        Consulta o catálogo com o filtro fuzzy e a faixa de preço, usando o índice FTS5.
+        Um filtro com cara de código (EAN/SKU) que case exatamente com algum código é
+        respondido pelo índice de códigos, só com esses itens (como no App).
+
+        Returns:
+            tuple: (DataFrame com 'Descrição' e 'Preço' (e 'Código'/'Aba', se importados)
+            indexado pelo id, total de resultados)
+        """
+        with medir('sqlite_buscar'):
+            condicoes = []
+            parametros = []
+            if self.tem_codigo and parece_codigo(filtro):
+                codigo = normalizar_codigos(pd.Series([filtro])).iloc[0]
+                achou = self._conexao.execute(
+                    "SELECT 1 FROM itens WHERE codigo_busca = ? LIMIT 1", (codigo,)
+                ).fetchone()
+                if achou:
+                    filtro = ''
+                    condicoes.append("i.codigo_busca = ?")
+                    parametros.append(codigo)
+            if filtro.strip():
+                origem = "itens_fts f JOIN itens i ON i.id = f.rowid"
+                condicoes.append("f.descricao LIKE ?")
+                parametros.append(_padrao_like(filtro))
+            else:
+                origem = "itens i"
+            if preco_min is not None:
+                condicoes.append("i.preco >= ?")
+                parametros.append(preco_min)
+            if preco_max is not None:
+                condicoes.append("i.preco <= ?")
+                parametros.append(preco_max)
+            onde = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+
+            total = self._conexao.execute(
+                f"SELECT COUNT(*) FROM {origem} {onde}", parametros
+            ).fetchone()[0]
+            linhas = self._conexao.execute(
+                f"SELECT {self._selecao} FROM {origem} {onde} ORDER BY i.id LIMIT ? OFFSET ?",
+                parametros + [limite, offset]
+            ).fetchall()
+            return self._para_dataframe(linhas), total
+
+    def obter(self, ids):
+        """Busca os itens pelos ids (consulta direta pela chave primária)."""
+        ids = [int(i) for i in ids]
+        marcadores = ','.join('?' * len(ids))
+        linhas = self._conexao.execute(
+            f"SELECT {self._selecao} FROM itens i WHERE i.id IN ({marcadores})", ids
+        ).fetchall() if ids else []
+        return self._para_dataframe(linhas)
+
+    def total_itens(self):
+        """Quantidade total de itens no catálogo."""
+        return self._conexao.execute("SELECT COUNT(*) FROM itens").fetchone()[0]
+
+    def fechar(self):
+        self._conexao.close()
+
+    def _para_dataframe(self, linhas):
+        df = pd.DataFrame(linhas, columns=self._colunas)
+        return df.set_index('id')
@@ -0,0 +1,214 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import time
+import os
+
+from database import (
+    carregar_dados, comparar_catalogos,
+    SITUACAO_NOVO, SITUACAO_REMOVIDO, SITUACAO_AUMENTOU, SITUACAO_BAIXOU
+)
+from pdf_generator import montar_pdf_comparacao, abrir_pdf_automaticamente
+
+# Máximo de linhas exibidas na janela (as exportações sempre levam o relatório inteiro)
+LIMITE_LINHAS_VISUALIZACAO = 5000
+
+COLUNAS = ('Situação', 'Descrição', 'Preço Anterior', 'Preço Novo', 'Variação (%)')
+TODAS = 'Todas'
+
+
+def _resumo(relatorio):
+    """Monta a linha de resumo do relatório (quantidade por situação)."""
+    contagem = relatorio['Situação'].value_counts()
+    return (
+        f"{contagem.get(SITUACAO_AUMENTOU, 0)} mais caro(s), "
+        f"{contagem.get(SITUACAO_BAIXOU, 0)} mais barato(s), "
+        f"{contagem.get(SITUACAO_NOVO, 0)} novo(s), "
+        f"{contagem.get(SITUACAO_REMOVIDO, 0)} removido(s)"
+    )
+
+
+def abrir_comparacao(app):
+    """
+    Compara duas versões da planilha do fornecedor e exibe o relatório.
+
+    As duas versões são lidas como a carga da tela principal: mesmas colunas de Descrição,
+    Preço e Código e mesmas abas selecionadas.
+
+    Args:
+        app: Instância da aplicação principal
+    """
+    descricao_col = app.nome_coluna_descricao.get().strip()
+    preco_col = app.nome_coluna_preco.get().strip()
+    if not descricao_col or not preco_col:
+        messagebox.showwarning(
+            "Aviso",
+            "Selecione uma planilha e as colunas de Descrição e Preço antes de comparar."
+        )
+        return
+
+    tipos = (
+        ("Arquivos Excel", "*.xlsx *.xls"),
+        ("Arquivos CSV", "*.csv"),
+        ("Todos os Arquivos", "*.*")
+    )
+    caminho_antigo = filedialog.askopenfilename(title="Selecione a versão ANTERIOR da planilha", filetypes=tipos)
+    if not caminho_antigo:
+        return
+    caminho_novo = filedialog.askopenfilename(
+        title="Selecione a versão NOVA da planilha",
+        initialfile=os.path.basename(app.caminho_arquivo.get()),
+        filetypes=tipos
+    )
+    if not caminho_novo:
+        return
+
+    try:
+        # Mostra cursor de espera
+        app.root.config(cursor="watch")
+        app.root.update()
+
+        abas = app.abas_para_carregar()
+        codigo_col = app.coluna_codigo()
+        df_antigo = carregar_dados(caminho_antigo, descricao_col, preco_col, abas, codigo_col)
+        df_novo = carregar_dados(caminho_novo, descricao_col, preco_col, abas, codigo_col)
+        relatorio = comparar_catalogos(df_antigo, df_novo)
+    except Exception as e:
+        messagebox.showerror(
+            "Erro na Comparação",
+            f"Não foi possível comparar as planilhas:\n{str(e)}"
+        )
+        return
+    finally:
+        # Restaura cursor normal
+        app.root.config(cursor="")
+
+    _janela_relatorio(app, relatorio, os.path.basename(caminho_antigo), os.path.basename(caminho_novo))
+
+
+def _janela_relatorio(app, relatorio, nome_antigo, nome_novo):
+    """Cria a janela com o relatório ordenável e os botões de exportação."""
+    janela = tk.Toplevel(app.root)
+    janela.title(f"Comparação de Preços: {nome_antigo} → {nome_novo}")
+    janela.minsize(900, 500)
+    janela.grid_columnconfigure(0, weight=1)
+    janela.grid_rowconfigure(1, weight=1)
+
+    resumo = _resumo(relatorio)
+    estado = {'coluna': 'Variação (%)', 'crescente': False}
+
+    # --- Topo: resumo e filtro por situação ---
+    frame_topo = tk.Frame(janela)
+    frame_topo.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
+    frame_topo.grid_columnconfigure(0, weight=1)
+
+    tk.Label(frame_topo, text=resumo, font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky="w")
+    tk.Label(frame_topo, text="Mostrar:").grid(row=0, column=1, padx=(10, 5))
+    situacao = tk.StringVar(value=TODAS)
+    combo_situacao = ttk.Combobox(
+        frame_topo,
+        textvariable=situacao,
+        state="readonly",
+        width=12,
+        values=(TODAS, SITUACAO_AUMENTOU, SITUACAO_BAIXOU, SITUACAO_NOVO, SITUACAO_REMOVIDO)
+    )
+    combo_situacao.grid(row=0, column=2)
+
+    # --- Tabela ---
+    tree = ttk.Treeview(janela, columns=COLUNAS, show="headings", style='Treeview')
+    tree.grid(row=1, column=0, sticky="nsew", padx=(10, 0))
+    scroll = ttk.Scrollbar(janela, orient="vertical", command=tree.yview)
+    tree.configure(yscroll=scroll.set)
+    scroll.grid(row=1, column=1, sticky="ns", padx=(0, 10))
+
+    tree.column('Situação', anchor='w', width=90)
+    tree.column('Descrição', anchor='w', width=420)
+    for coluna in COLUNAS[2:]:
+        tree.column(coluna, anchor='e', width=110)
+
+    label_rodape = tk.Label(janela, text="", fg="gray")
+    label_rodape.grid(row=2, column=0, sticky="w", padx=10)
+
+    def visivel():
+        """Relatório com o filtro de situação e a ordenação atuais."""
+        dados = relatorio
+        if situacao.get() != TODAS:
+            dados = dados[dados['Situação'] == situacao.get()]
+        return dados.sort_values(
+            estado['coluna'], ascending=estado['crescente'], na_position='last', kind='stable'
+        )
+
+    def preencher(*_):
+        tree.delete(*tree.get_children())
+        dados = visivel()
+        exibidos = dados.head(LIMITE_LINHAS_VISUALIZACAO)
+        for situacao_item, descricao, anterior, novo, variacao in zip(
+            exibidos['Situação'], exibidos['Descrição'], exibidos['Preço Anterior'],
+            exibidos['Preço Novo'], exibidos['Variação (%)']
+        ):
+            tree.insert('', 'end', values=(
+                situacao_item,
+                descricao,
+                '' if anterior != anterior else app._formatar_preco(anterior),  # NaN != NaN
+                '' if novo != novo else app._formatar_preco(novo),
+                '' if variacao != variacao else f"{variacao:+.1f}%".replace('.', ','),
+            ))
+        rodape = f"{len(dados)} item(ns)"
+        if len(dados) > LIMITE_LINHAS_VISUALIZACAO:
+            rodape += f" (exibindo os {LIMITE_LINHAS_VISUALIZACAO} primeiros; as exportações incluem todos)"
+        label_rodape.config(text=rodape)
+
+    def ordenar(coluna):
+        # Clicar de novo na mesma coluna inverte a ordem
+        if estado['coluna'] == coluna:
+            estado['crescente'] = not estado['crescente']
+        else:
+            estado['coluna'] = coluna
+            estado['crescente'] = coluna in ('Situação', 'Descrição')
+        preencher()
+
+    for coluna in COLUNAS:
+        tree.heading(coluna, text=coluna, command=lambda c=coluna: ordenar(c))
+    combo_situacao.bind("<<ComboboxSelected>>", preencher)
+
+    # --- Exportações ---
+    nome_base = f"Comparacao_Precos_{time.strftime('%Y%m%d_%H%M%S')}"
+
+    def exportar_csv():
+        caminho = filedialog.asksaveasfilename(
+            parent=janela,
+            defaultextension=".csv",
+            initialfile=nome_base + ".csv",
+            title="Exportar Comparação (CSV)",
+            filetypes=[("Arquivos CSV", "*.csv")]
+        )
+        if not caminho:
+            return
+        try:
+            # Separador ';' e vírgula decimal: abre direto no Excel em português
+            visivel().to_csv(caminho, sep=';', decimal=',', index=False, encoding='utf-8-sig')
+            messagebox.showinfo("Sucesso", f"Relatório exportado em:\n{caminho}", parent=janela)
+        except Exception as e:
+            messagebox.showerror("Erro", f"Não foi possível exportar o relatório:\n{str(e)}", parent=janela)
+
+    def exportar_pdf():
+        caminho = filedialog.asksaveasfilename(
+            parent=janela,
+            defaultextension=".pdf",
+            initialfile=nome_base + ".pdf",
+            title="Exportar Comparação (PDF)",
+            filetypes=[("Arquivos PDF", "*.pdf")]
+        )
+        if not caminho:
+            return
+        try:
+            montar_pdf_comparacao(caminho, visivel(), f"{nome_antigo} → {nome_novo}: {resumo}")
+            abrir_pdf_automaticamente(caminho)
+        except Exception as e:
+            messagebox.showerror("Erro", f"Não foi possível gerar o PDF:\n{str(e)}", parent=janela)
+
+    frame_botoes = tk.Frame(janela)
+    frame_botoes.grid(row=3, column=0, pady=10)
+    ttk.Button(frame_botoes, text="Exportar CSV", command=exportar_csv).grid(row=0, column=0, padx=5)
+    ttk.Button(frame_botoes, text="Exportar PDF", command=exportar_pdf).grid(row=0, column=1, padx=5)
+
+    preencher()
@@ -1,15 +1,73 @@
 import pandas as pd
+import numpy as np
 import warnings 
+import os
+import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from desempenho import cronometrado
 
 # Adiciona um filtro para ignorar a UserWarning específica do openpyxl
 warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl") 
 
-def ler_cabecalhos(caminho_arquivo: str) -> list:
+def _detectar_separador(caminho_arquivo: str) -> str:
+    """Detecta o separador do CSV pela primeira linha (planilhas em pt-BR costumam usar ';')."""
+    with open(caminho_arquivo, 'rb') as f:
+        primeira_linha = f.readline()
+    return ';' if primeira_linha.count(b';') > primeira_linha.count(b',') else ','
+
+
+def _eh_csv(caminho_arquivo: str) -> bool:
+    return os.path.splitext(caminho_arquivo)[1].lower() == '.csv'
+
+
+def _ler_planilha(caminho_arquivo: str, aba: str = None, **kwargs) -> pd.DataFrame:
+    """
+    Lê a planilha com o leitor adequado à extensão do arquivo (CSV ou Excel).
+    
+    Args:
+        caminho_arquivo (str): O caminho completo do arquivo.
+        aba (str): Aba do Excel a ler (padrão: a primeira). Ignorada no CSV.
+        **kwargs: Parâmetros repassados ao leitor do pandas (usecols, nrows, header...).
+        
+    Returns:
+        pd.DataFrame: O conteúdo lido.
+    """
+    if _eh_csv(caminho_arquivo):
+        sep = _detectar_separador(caminho_arquivo)
+        try:
+            return pd.read_csv(caminho_arquivo, sep=sep, **kwargs)
+        except UnicodeDecodeError:
+            # Arquivos exportados pelo Excel no Windows costumam vir em Latin-1
+            return pd.read_csv(caminho_arquivo, sep=sep, encoding='latin-1', **kwargs)
+    return pd.read_excel(caminho_arquivo, sheet_name=aba if aba is not None else 0, **kwargs)
+
+
+def listar_abas(caminho_arquivo: str) -> list:
+    """
+    Lista as abas de uma pasta de trabalho do Excel.
+    
+    Args:
+        caminho_arquivo (str): O caminho completo do arquivo.
+        
+    Returns:
+        list: Os nomes das abas, na ordem do arquivo (lista vazia para CSV).
+    """
+    if not caminho_arquivo or _eh_csv(caminho_arquivo):
+        return []
+    with pd.ExcelFile(caminho_arquivo) as pasta:
+        return [str(nome) for nome in pasta.sheet_names]
+
+
+@cronometrado('ler_cabecalhos')
+def ler_cabecalhos(caminho_arquivo: str, aba: str = None) -> list:
     """
     Lê apenas o cabeçalho do arquivo Excel para retornar os nomes das colunas.
     
     Args:
         caminho_arquivo (str): O caminho completo do arquivo Excel.
+        aba (str): Aba a ler (padrão: a primeira).
         
     Returns:
         list: Uma lista de strings contendo os nomes das colunas.
@@ -22,7 +80,7 @@ def ler_cabecalhos(caminho_arquivo: str) -> list:
 
     try:
         # Lê apenas a primeira linha (header=0) e usa nrows=0 para ler apenas a estrutura
-        df_header = pd.read_excel(caminho_arquivo, header=0, nrows=0)
+        df_header = _ler_planilha(caminho_arquivo, aba, header=0, nrows=0)
         # Limpa e retorna os nomes das colunas
         return [col.strip() for col in df_header.columns]
         
@@ -31,7 +89,9 @@ def ler_cabecalhos(caminho_arquivo: str) -> list:
         raise Exception(f"Falha ao ler o cabeçalho da planilha. Verifique o formato do arquivo: {e}")
 
 
-def carregar_dados(caminho_arquivo: str, nome_col_descricao: str, nome_col_preco: str) -> pd.DataFrame:
+@cronometrado('carregar_dados')
+def carregar_dados(caminho_arquivo: str, nome_col_descricao: str, nome_col_preco: str,
+                   abas: list = None, nome_col_codigo: str = None) -> pd.DataFrame:
     """
     Carrega, formata e valida os dados de Descrição e Preço de um arquivo Excel,
     usando nomes de colunas fornecidos pelo usuário.
@@ -43,9 +103,14 @@ def carregar_dados(caminho_arquivo: str, nome_col_descricao: str, nome_col_preco
         caminho_arquivo (str): O caminho completo do arquivo Excel.
         nome_col_descricao (str): O nome da coluna no arquivo que contém a descrição.
         nome_col_preco (str): O nome da coluna no arquivo que contém o preço.
+        abas (list): Abas a carregar (todas com as mesmas colunas). Se None, lê só a
+            primeira aba; se informado, o resultado ganha a coluna 'Aba' com a origem de cada linha.
+        nome_col_codigo (str): Coluna opcional com o código do produto (EAN, SKU), lida
+            como texto (sem perder zeros à esquerda) e renomeada para 'Código'.
         
     Returns:
-        pd.DataFrame: O DataFrame carregado com as colunas padronizadas 'Descrição' e 'Preço'.
+        pd.DataFrame: O DataFrame carregado com as colunas padronizadas 'Descrição' e 'Preço'
+        (e 'Código', se informada).
         
     Raises:
         Exception: Em caso de falha na leitura, formatação ou falta das colunas essenciais.
@@ -53,12 +118,21 @@ def carregar_dados(caminho_arquivo: str, nome_col_descricao: str, nome_col_preco
     
     if not caminho_arquivo:
         raise ValueError("O caminho do arquivo não pode ser vazio.")
+    
+    if abas is not None and len(abas) != 1:
+        return _carregar_abas(caminho_arquivo, nome_col_descricao, nome_col_preco, abas, nome_col_codigo)
         
     colunas_necessarias = [nome_col_descricao, nome_col_preco]
+    tipos = None
+    if nome_col_codigo:
+        colunas_necessarias.append(nome_col_codigo)
+        # Código como texto: EAN lido como número perderia os zeros à esquerda
+        tipos = {nome_col_codigo: str}
+    aba = abas[0] if abas else None
 
     try:
         # 1. Leitura da Planilha: Lê SOMENTE as colunas especificadas pelo usuário.
-        df = pd.read_excel(caminho_arquivo, usecols=colunas_necessarias, header=0)
+        df = _ler_planilha(caminho_arquivo, aba, usecols=colunas_necessarias, header=0, dtype=tipos)
         
         # 2. Limpeza de Cabeçalhos e Mapeamento
         df.columns = df.columns.str.strip()
@@ -79,6 +153,13 @@ def carregar_dados(caminho_arquivo: str, nome_col_descricao: str, nome_col_preco
             preco_col_strip: 'Preço'
         })
             
+        if nome_col_codigo:
+            codigo_col_strip = nome_col_codigo.strip()
+            if codigo_col_strip not in df.columns:
+                raise KeyError(f"A coluna de código '{nome_col_codigo}' não foi encontrada na planilha.")
+            df = df.rename(columns={codigo_col_strip: 'Código'})
+            df['Código'] = df['Código'].str.strip()
+            
         # 5. Formatação da Coluna de Preço
         # Converte a coluna 'Preço' para numérica (valores inválidos viram NaN).
         df['Preço'] = pd.to_numeric(df['Preço'], errors='coerce')
@@ -86,8 +167,560 @@ def carregar_dados(caminho_arquivo: str, nome_col_descricao: str, nome_col_preco
         # 6. Filtra linhas sem descrição ou preço válido
         df = df.dropna(subset=['Descrição', 'Preço'])
         
+        # 7. Identifica a aba de origem (categoria) quando as abas foram escolhidas
+        if aba is not None:
+            df['Aba'] = aba
+        
         return df
 
     except Exception as e:
         # Captura e relança o erro com uma mensagem amigável
-        raise Exception(f"Falha ao processar a planilha. Verifique se as colunas '{nome_col_descricao}' e '{nome_col_preco}' existem e se o arquivo está no formato correto (Excel/CSV): {e}")
\ No newline at end of file
+        origem = f" (aba '{aba}')" if aba is not None else ""
+        raise Exception(f"Falha ao processar a planilha{origem}. Verifique se as colunas '{nome_col_descricao}' e '{nome_col_preco}' existem e se o arquivo está no formato correto (Excel/CSV): {e}")
+
+
+def _carregar_aba(parametros: tuple) -> pd.DataFrame:
+    """Carrega uma única aba (executado em um processo separado)."""
+    caminho_arquivo, nome_col_descricao, nome_col_preco, nome_col_codigo, aba = parametros
+    return carregar_dados(caminho_arquivo, nome_col_descricao, nome_col_preco, [aba], nome_col_codigo)
+
+
+def _carregar_abas(caminho_arquivo: str, nome_col_descricao: str, nome_col_preco: str,
+                   abas: list, nome_col_codigo: str = None, max_processos: int = None) -> pd.DataFrame:
+    """
+    Carrega várias abas em paralelo, uma por processo, e as concatena na ordem informada.
+    
+    Cada processo abre o arquivo e interpreta apenas a sua aba, então o tempo total
+    acompanha a maior aba em vez da soma de todas.
+    """
+    if not abas:
+        raise ValueError("Nenhuma aba selecionada.")
+    
+    parametros = [
+        (caminho_arquivo, nome_col_descricao, nome_col_preco, nome_col_codigo, aba) for aba in abas
+    ]
+    max_processos = min(len(abas), max_processos or os.cpu_count() or 1)
+    # 'spawn': a interface já tem outras threads (downloads de imagens, recarga do arquivo),
+    # e um fork de um processo com várias threads pode herdar locks presos e travar o filho
+    with ProcessPoolExecutor(
+        max_workers=max_processos, mp_context=multiprocessing.get_context('spawn')
+    ) as executor:
+        partes = list(executor.map(_carregar_aba, parametros))
+    
+    df = pd.concat(partes, ignore_index=True)
+    # Categórica: o nome da aba não é repetido em cada uma das linhas
+    df['Aba'] = pd.Categorical(df['Aba'], categories=list(dict.fromkeys(abas)))
+    return df
+
+
+def filtrar_dados(df: pd.DataFrame, filtro: str, col_descricao: str = 'Descrição',
+                  excluir: np.ndarray = None) -> pd.DataFrame:
+    """
+    Aplica o filtro de busca da tela principal sobre o DataFrame.
+    
+    O filtro é "fuzzy": as palavras digitadas precisam aparecer na descrição
+    na mesma ordem, mas não necessariamente juntas.
+    
+    Args:
+        df (pd.DataFrame): O DataFrame carregado.
+        filtro (str): O texto digitado pelo usuário.
+        col_descricao (str): Nome da coluna de descrição.
+        excluir (np.ndarray): Máscara booleana alinhada às linhas do df com as linhas
+            a esconder independentemente do filtro (ex.: itens já no carrinho).
+        
+    Returns:
+        pd.DataFrame: As linhas que passam no filtro (o próprio df se o filtro for vazio
+        e nada for excluído).
+    """
+    mascara = mascara_filtro(df, filtro, col_descricao, excluir)
+    return df if mascara is None else df[mascara]
+
+
+@cronometrado('filtrar_dados')
+def mascara_filtro(df: pd.DataFrame, filtro: str, col_descricao: str = 'Descrição',
+                   excluir: np.ndarray = None) -> np.ndarray:
+    """
+    Máscara booleana (alinhada às linhas do df) do filtro de filtrar_dados.
+    A medição 'filtrar_dados' fica aqui, no caminho usado pelo App a cada tecla
+    (filtrar_dados passa por esta função e é medido junto).
+    
+    Returns:
+        np.ndarray: True nas linhas que passam no filtro, ou None se todas passam
+        (filtro vazio e nada a excluir).
+    """
+    filtro = filtro.lower().strip()
+    excluir = excluir if excluir is not None and excluir.any() else None
+    if not filtro:
+        return None if excluir is None else ~excluir
+    
+    pattern = '.*'.join(map(re.escape, filtro.split()))
+    mascara = df[col_descricao].str.contains(pattern, case=False, na=False).to_numpy(dtype=bool)
+    if excluir is not None:
+        mascara = mascara & ~excluir
+    return mascara
+
+
+class OrdensCatalogo:
+    """
+    Permutações de ordenação (argsort) das colunas de um catálogo, calculadas uma
+    única vez por coluna e reaproveitadas em todas as consultas.
+    
+    Ordenar um subconjunto filtrado vira uma coleta sobre a ordem já calculada
+    (O(n), sem nova ordenação) e a faixa de preço é respondida por busca binária
+    sobre os preços ordenados.
+    """
+    
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._ordens = {}
+        self._validos = {}
+        self._postos = {}
+        # Valores numéricos já na ordem da permutação (para a busca binária da faixa)
+        self._ordenados = {}
+    
+    def descartar(self, coluna: str):
+        """Esquece a ordem de uma coluna (ex.: os preços de venda foram recalculados)."""
+        self._ordens.pop(coluna, None)
+        self._validos.pop(coluna, None)
+        self._ordenados.pop(coluna, None)
+        self._postos.pop((coluna, False), None)
+        self._postos.pop((coluna, True), None)
+    
+    def ordem(self, coluna: str) -> np.ndarray:
+        """Posições das linhas em ordem crescente da coluna (texto sem diferenciar maiúsculas)."""
+        ordem = self._ordens.get(coluna)
+        if ordem is None:
+            valores = self.df[coluna]
+            if pd.api.types.is_numeric_dtype(valores):
+                valores = valores.to_numpy(dtype=float)
+                self._validos[coluna] = int(np.count_nonzero(~np.isnan(valores)))
+                # Estável: empates mantêm a ordem da planilha
+                ordem = np.argsort(valores, kind='stable')
+                self._ordenados[coluna] = valores[ordem]
+            else:
+                # Vazios medidos antes do astype(str): no pandas 2 ele transforma NaN em 'nan'
+                vazios = valores.isna().to_numpy()
+                valores = valores.astype(str).str.lower().to_numpy(dtype=object, copy=True)
+                valores[vazios] = ''
+                vazios = vazios | (valores == '')
+                ordem = np.argsort(valores.astype(str), kind='stable')
+                # Textos vazios (ex.: produto sem código) vão para o fim, como os NaN numéricos
+                ordem = np.concatenate([ordem[~vazios[ordem]], ordem[vazios[ordem]]])
+                self._validos[coluna] = len(valores) - int(np.count_nonzero(vazios))
+            self._ordens[coluna] = ordem
+        return ordem
+    
+    def _ordem_no_sentido(self, coluna: str, decrescente: bool) -> np.ndarray:
+        """Ordem crescente ou decrescente; os valores vazios (NaN) ficam sempre no fim."""
+        ordem = self.ordem(coluna)
+        if not decrescente:
+            return ordem
+        validos = self._validos[coluna]
+        return np.concatenate([ordem[:validos][::-1], ordem[validos:]])
+    
+    def posto(self, coluna: str, decrescente: bool = False) -> np.ndarray:
+        """Posição de exibição de cada linha (permutação inversa da ordem)."""
+        chave = (coluna, decrescente)
+        posto = self._postos.get(chave)
+        if posto is None:
+            ordem = self._ordem_no_sentido(coluna, decrescente)
+            posto = np.empty(len(ordem), dtype=np.int64)
+            posto[ordem] = np.arange(len(ordem))
+            self._postos[chave] = posto
+        return posto
+    
+    def ordenar(self, posicoes: np.ndarray, coluna: str, decrescente: bool = False) -> np.ndarray:
+        """
+        Ordena as posições de um subconjunto pela coluna, coletando-as da ordem em cache.
+        
+        Returns:
+            np.ndarray: As mesmas posições, na ordem de exibição
+        """
+        ordem = self._ordem_no_sentido(coluna, decrescente)
+        selecionadas = np.zeros(len(ordem), dtype=bool)
+        selecionadas[posicoes] = True
+        return ordem[selecionadas[ordem]]
+    
+    def mascara_faixa(self, coluna: str, minimo: float = None, maximo: float = None) -> np.ndarray:
+        """
+        Máscara das linhas com valor da coluna dentro de [minimo, maximo], por busca
+        binária nos valores ordenados (limites None ficam em aberto).
+        """
+        ordem = self.ordem(coluna)
+        # Ordenados uma única vez, junto com a ordem: cada consulta é só a busca binária
+        valores = self._ordenados[coluna]
+        # Os NaN ficam no fim da ordem e nunca entram na faixa
+        inicio = np.searchsorted(valores, minimo, 'left') if minimo is not None else 0
+        fim = np.searchsorted(valores, maximo if maximo is not None else np.inf, 'right')
+        mascara = np.zeros(len(ordem), dtype=bool)
+        mascara[ordem[inicio:fim]] = True
+        return mascara
+
+
+def normalizar_codigos(codigos: pd.Series) -> pd.Series:
+    """
+    Normaliza códigos de produto (EAN, SKU) para a busca exata.
+    
+    Ignora espaços e maiúsculas/minúsculas; nos códigos só de dígitos ignora também
+    os zeros à esquerda, então o EAN-13 "0789..." casa com o UPC-A "789..." lido pelo leitor.
+    
+    Args:
+        codigos (pd.Series): A coluna de códigos (valores vazios continuam vazios).
+        
+    Returns:
+        pd.Series: Os códigos normalizados, na mesma ordem.
+    """
+    # Vazios medidos antes do astype(str): no pandas 2 ele transforma NaN em 'nan' (e 'NAN'
+    # seria um código pesquisável)
+    preenchidos = codigos.notna()
+    codigos = codigos.astype(str).str.strip().str.upper()
+    com_espaco = codigos.str.contains(' ', regex=False, na=False).to_numpy()
+    if com_espaco.any():
+        codigos = codigos.copy()
+        codigos[com_espaco] = codigos[com_espaco].str.replace(r'\s+', '', regex=True)
+    # Só os códigos numéricos que começam com zero mudam (normalmente poucos)
+    com_zeros = np.flatnonzero(codigos.str.startswith('0', na=False).to_numpy())
+    com_zeros = com_zeros[codigos.iloc[com_zeros].str.isdigit().to_numpy(dtype=bool)]
+    if len(com_zeros):
+        originais = codigos.iloc[com_zeros]
+        sem_zeros = originais.str.lstrip('0')
+        codigos = codigos.copy()
+        # Um código só de zeros continua como veio
+        codigos.iloc[com_zeros] = sem_zeros.where(sem_zeros != '', originais).to_numpy()
+    return codigos.where(preenchidos)
+
+
+def _normalizar_codigo(texto: str) -> str:
+    """Mesma normalização do normalizar_codigos, para um único código digitado."""
+    codigo = ''.join(texto.split()).upper()
+    if codigo.startswith('0') and codigo.isdigit():
+        return codigo.lstrip('0') or codigo
+    return codigo
+
+
+# Entrada com cara de código: uma "palavra" só, com algum dígito e ao menos 4 caracteres
+PADRAO_CODIGO = re.compile(r'(?=.*\d)[0-9A-Za-z][0-9A-Za-z./-]{3,}')
+
+
+def parece_codigo(texto: str) -> bool:
+    """Indica se o texto digitado (ou lido pelo leitor de código de barras) parece um código."""
+    return PADRAO_CODIGO.fullmatch(texto.strip()) is not None
+
+
+class IndiceCodigos:
+    """
+    Índice de hash (dicionário) dos códigos de produto de um catálogo, montado
+    uma única vez na carga: a busca por um código exato é O(1), sem varrer as descrições.
+    
+    Um mesmo código pode aparecer em várias linhas (ex.: várias abas ou fornecedores);
+    a busca devolve todas elas.
+    """
+    
+    def __init__(self, df: pd.DataFrame, col_codigo: str = 'Código'):
+        self.df = df
+        if col_codigo not in df.columns:
+            self._grupos = {}
+            return
+        grupos, codigos = pd.factorize(normalizar_codigos(df[col_codigo]))
+        # Código -> número do grupo; as posições de cada grupo ficam contíguas em _posicoes
+        self._grupos = dict(zip(codigos.tolist(), range(len(codigos))))
+        self._posicoes = np.argsort(grupos, kind='stable')
+        self._inicios = np.searchsorted(grupos[self._posicoes], np.arange(len(codigos) + 1))
+    
+    def __len__(self):
+        return len(self._grupos)
+    
+    def buscar(self, texto: str) -> np.ndarray:
+        """
+        Busca o código exato digitado.
+        
+        Args:
+            texto (str): O texto do filtro.
+            
+        Returns:
+            np.ndarray: Posições (no df) das linhas com o código, ou None se o texto
+            não parece um código ou não está no catálogo.
+        """
+        if not self._grupos or not parece_codigo(texto):
+            return None
+        grupo = self._grupos.get(_normalizar_codigo(texto))
+        if grupo is None:
+            return None
+        return self._posicoes[self._inicios[grupo]:self._inicios[grupo + 1]]
+
+
+def chave_descricao(descricoes: pd.Series) -> np.ndarray:
+    """
+    Calcula uma chave (hash de 64 bits) da descrição normalizada de cada linha.
+    
+    A normalização ignora maiúsculas/minúsculas e espaços extras, então
+    "SSD  Kingston 480GB" e "ssd kingston 480gb" geram a mesma chave.
+    
+    Args:
+        descricoes (pd.Series): A coluna de descrições.
+        
+    Returns:
+        np.ndarray: Array uint64 com a chave de cada linha, na mesma ordem.
+    """
+    normalizada = descricoes.astype(str).str.lower().str.strip()
+    
+    # A regex é cara: só é aplicada às linhas que realmente têm espaços repetidos,
+    # tabulações ou quebras de linha (buscas literais são bem mais rápidas)
+    irregulares = np.zeros(len(normalizada), dtype=bool)
+    for trecho in ('  ', '\t', '\n', '\r'):
+        irregulares |= normalizada.str.contains(trecho, regex=False).to_numpy()
+    if irregulares.any():
+        normalizada = normalizada.copy()
+        normalizada[irregulares] = normalizada[irregulares].str.replace(r'\s+', ' ', regex=True)
+    
+    return pd.util.hash_pandas_object(normalizada, index=False).to_numpy()
+
+
+def _tabela_chaves(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Monta a tabela de junção (chave, ocorrência) de um catálogo.
+    
+    A ocorrência diferencia descrições repetidas na mesma planilha: a 1ª "SSD X"
+    da versão antiga casa com a 1ª "SSD X" da nova, a 2ª com a 2ª, e assim por diante.
+    """
+    chaves = chave_descricao(df['Descrição'])
+    return pd.DataFrame({
+        'chave': chaves,
+        'ocorrencia': pd.Series(chaves).groupby(chaves).cumcount().to_numpy(),
+        'rotulo': df.index,
+        'preco': df['Preço'].to_numpy(dtype=float),
+    })
+
+
+def diferenca_catalogo(df_atual: pd.DataFrame, df_novo: pd.DataFrame) -> dict:
+    """
+    Compara duas versões do catálogo pela chave da descrição normalizada.
+    
+    Args:
+        df_atual (pd.DataFrame): Catálogo em uso (índice = ids usados na interface).
+        df_novo (pd.DataFrame): Catálogo recém-lido da planilha atualizada.
+        
+    Returns:
+        dict: {
+            'inseridos': DataFrame com as linhas novas (índice ainda do df_novo),
+            'removidos': Index com os rótulos do df_atual que saíram da planilha,
+            'alterados': Series {rótulo do df_atual: novo preço} dos preços que mudaram
+        }
+    """
+    juncao = _tabela_chaves(df_atual).merge(
+        _tabela_chaves(df_novo), 
+        on=['chave', 'ocorrencia'], 
+        how='outer', 
+        suffixes=('_atual', '_novo'), 
+        indicator=True
+    )
+    
+    somente_atual = (juncao['_merge'] == 'left_only').to_numpy()
+    somente_novo = (juncao['_merge'] == 'right_only').to_numpy()
+    ambos = (juncao['_merge'] == 'both').to_numpy()
+    
+    em_ambos = juncao[ambos]
+    mudou = em_ambos['preco_atual'].to_numpy() != em_ambos['preco_novo'].to_numpy()
+    
+    # A junção externa converte os rótulos inteiros para float (por causa dos NaN):
+    # volta cada grupo ao tipo do índice original
+    rotulos_novos = juncao.loc[somente_novo, 'rotulo_novo'].astype(df_novo.index.dtype)
+    rotulos_removidos = juncao.loc[somente_atual, 'rotulo_atual'].astype(df_atual.index.dtype)
+    rotulos_alterados = em_ambos['rotulo_atual'].astype(df_atual.index.dtype).to_numpy()[mudou]
+    
+    return {
+        'inseridos': df_novo.loc[rotulos_novos.to_numpy()],
+        'removidos': pd.Index(rotulos_removidos.to_numpy()),
+        'alterados': pd.Series(em_ambos['preco_novo'].to_numpy()[mudou], index=rotulos_alterados),
+    }
+
+
+def aplicar_diferenca(df_atual: pd.DataFrame, diferenca: dict, primeiro_rotulo: int = None) -> tuple:
+    """
+    Aplica ao catálogo em uso as inserções, remoções e mudanças de preço.
+    
+    As linhas que continuam na planilha mantêm o mesmo rótulo (os ids da interface
+    e do carrinho continuam válidos); as inseridas recebem rótulos novos, após o maior atual.
+    
+    Args:
+        df_atual (pd.DataFrame): Catálogo em uso.
+        diferenca (dict): Resultado de diferenca_catalogo.
+        primeiro_rotulo (int): Rótulo da primeira linha inserida. Se None, usa o maior
+            rótulo do df_atual + 1 (informe um valor maior se houver ids ainda em uso fora do catálogo).
+        
+    Returns:
+        tuple: (novo DataFrame do catálogo, DataFrame das linhas inseridas já com os novos rótulos)
+    """
+    df = df_atual.drop(index=diferenca['removidos'])
+    
+    alterados = diferenca['alterados']
+    if not alterados.empty:
+        df.loc[alterados.index, 'Preço'] = alterados.to_numpy()
+    
+    inseridos = diferenca['inseridos']
+    if not inseridos.empty:
+        inicio = primeiro_rotulo
+        if inicio is None:
+            inicio = int(df_atual.index.max()) + 1 if len(df_atual) else 0
+        inseridos = inseridos.set_axis(pd.RangeIndex(inicio, inicio + len(inseridos)))
+        df = pd.concat([df, inseridos])
+    
+    return df, inseridos
+
+
+# Situações possíveis de um item no relatório de comparação
+SITUACAO_NOVO = 'Novo'
+SITUACAO_REMOVIDO = 'Removido'
+SITUACAO_AUMENTOU = 'Aumentou'
+SITUACAO_BAIXOU = 'Baixou'
+
+# Colunas do relatório de comparação
+COLUNAS_COMPARACAO = ['Situação', 'Descrição', 'Preço Anterior', 'Preço Novo', 'Variação (%)']
+
+
+@cronometrado('comparar_catalogos')
+def comparar_catalogos(df_antigo: pd.DataFrame, df_novo: pd.DataFrame) -> pd.DataFrame:
+    """
+    Gera o relatório de comparação entre duas versões da planilha do fornecedor.
+    
+    Os itens são casados pela chave da descrição normalizada (ver diferenca_catalogo)
+    e todas as contas são vetorizadas, sem laços por linha.
+    
+    Args:
+        df_antigo (pd.DataFrame): Versão anterior (resultado de carregar_dados).
+        df_novo (pd.DataFrame): Versão nova (resultado de carregar_dados).
+        
+    Returns:
+        pd.DataFrame: Colunas 'Situação', 'Descrição', 'Preço Anterior', 'Preço Novo'
+        e 'Variação (%)', com os itens novos, removidos e com preço alterado,
+        ordenado da maior para a menor variação.
+    """
+    diferenca = diferenca_catalogo(df_antigo, df_novo)
+    
+    inseridos = diferenca['inseridos']
+    removidos = df_antigo.loc[diferenca['removidos']]
+    alterados = diferenca['alterados']
+    preco_anterior = df_antigo.loc[alterados.index, 'Preço'].to_numpy(dtype=float)
+    preco_novo = alterados.to_numpy(dtype=float)
+    
+    # Variação percentual (indefinida quando o preço anterior era zero)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variacao = np.where(preco_anterior != 0, (preco_novo - preco_anterior) / preco_anterior * 100, np.nan)
+    
+    partes = [
+        pd.DataFrame({
+            'Situação': np.where(preco_novo > preco_anterior, SITUACAO_AUMENTOU, SITUACAO_BAIXOU),
+            'Descrição': df_antigo.loc[alterados.index, 'Descrição'].to_numpy(),
+            'Preço Anterior': preco_anterior,
+            'Preço Novo': preco_novo,
+            'Variação (%)': variacao,
+        }),
+        pd.DataFrame({
+            'Situação': SITUACAO_NOVO,
+            'Descrição': inseridos['Descrição'].to_numpy(),
+            'Preço Anterior': np.nan,
+            'Preço Novo': inseridos['Preço'].to_numpy(dtype=float),
+            'Variação (%)': np.nan,
+        }),
+        pd.DataFrame({
+            'Situação': SITUACAO_REMOVIDO,
+            'Descrição': removidos['Descrição'].to_numpy(),
+            'Preço Anterior': removidos['Preço'].to_numpy(dtype=float),
+            'Preço Novo': np.nan,
+            'Variação (%)': np.nan,
+        }),
+    ]
+    partes = [p for p in partes if not p.empty]
+    if not partes:
+        # Versões sem nenhuma diferença: relatório vazio (o concat não aceita lista vazia)
+        return pd.DataFrame(columns=COLUNAS_COMPARACAO)
+    
+    relatorio = pd.concat(partes, ignore_index=True)
+    return relatorio.sort_values('Variação (%)', ascending=False, na_position='last', ignore_index=True)
+
+
+def _carregar_fonte(fonte: tuple) -> pd.DataFrame:
+    """Carrega uma planilha de fornecedor (executado em um processo separado)."""
+    nome_fornecedor, caminho_arquivo, nome_col_descricao, nome_col_preco = fonte
+    try:
+        df = carregar_dados(caminho_arquivo, nome_col_descricao, nome_col_preco)
+    except Exception as e:
+        raise Exception(f"Fornecedor '{nome_fornecedor}': {e}")
+    return df[['Descrição', 'Preço']]
+
+
+@cronometrado('carregar_fornecedores')
+def carregar_fornecedores(fontes: list, max_processos: int = None) -> pd.DataFrame:
+    """
+    Carrega as planilhas de vários fornecedores em paralelo e as une em um único catálogo.
+    
+    Cada planilha é lida em um processo separado (a leitura do Excel é presa ao GIL,
+    então threads não ajudariam), cada uma com o seu próprio mapeamento de colunas.
+    
+    Args:
+        fontes (list): Lista de tuplas (fornecedor, caminho do arquivo, coluna de descrição,
+            coluna de preço), na ordem de preferência em caso de empate de preço.
+        max_processos (int): Limite de processos simultâneos (padrão: um por núcleo).
+        
+    Returns:
+        pd.DataFrame: Catálogo unificado com 'Descrição', 'Preço' e 'Fornecedor',
+        indexado de 0 a N-1.
+        
+    Raises:
+        Exception: Se alguma das planilhas não puder ser carregada (a mensagem indica o fornecedor).
+    """
+    if not fontes:
+        raise ValueError("Nenhum fornecedor informado.")
+    nomes = [fonte[0] for fonte in fontes]
+    if len(set(nomes)) != len(nomes):
+        raise ValueError("Há fornecedores com o mesmo nome na lista.")
+    
+    if len(fontes) == 1:
+        partes = [_carregar_fonte(fontes[0])]
+    else:
+        max_processos = min(len(fontes), max_processos or os.cpu_count() or 1)
+        # 'spawn' pelo mesmo motivo de _carregar_abas (fork de um processo com várias threads)
+        with ProcessPoolExecutor(
+            max_workers=max_processos, mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            # map preserva a ordem das fontes
+            partes = list(executor.map(_carregar_fonte, fontes))
+    
+    catalogo = pd.concat(partes, ignore_index=True)
+    # Categórica: o nome do fornecedor não é repetido em cada uma das linhas
+    catalogo['Fornecedor'] = pd.Categorical.from_codes(
+        np.repeat(np.arange(len(partes)), [len(p) for p in partes]), 
+        categories=nomes
+    )
+    return catalogo
+
+
+@cronometrado('melhores_ofertas')
+def melhores_ofertas(catalogo: pd.DataFrame) -> pd.DataFrame:
+    """
+    Monta o índice de menor preço por produto sobre o catálogo unificado.
+    
+    Os produtos são agrupados pela chave da descrição normalizada (ver chave_descricao),
+    então o mesmo item escrito com maiúsculas ou espaços diferentes em cada
+    fornecedor conta como um só. O índice é calculado uma única vez, na carga: o
+    filtro da tela roda sobre ele, sem percorrer as ofertas de todos os fornecedores.
+    
+    Args:
+        catalogo (pd.DataFrame): Resultado de carregar_fornecedores.
+        
+    Returns:
+        pd.DataFrame: Uma linha por produto com a oferta mais barata ('Descrição', 'Preço',
+        'Fornecedor') e a quantidade de ofertas encontradas ('Ofertas'). O índice é o
+        rótulo da oferta vencedora no catálogo unificado, na ordem original das planilhas.
+    """
+    chaves = chave_descricao(catalogo['Descrição'])
+    
+    # Ordena por produto e, dentro dele, por preço; o lexsort é estável, então no
+    # empate vence o fornecedor que veio antes na lista
+    ordem = np.lexsort((catalogo['Preço'].to_numpy(dtype=float), chaves))
+    chaves_ordenadas = chaves[ordem]
+    inicio_grupo = np.flatnonzero(np.r_[True, chaves_ordenadas[1:] != chaves_ordenadas[:-1]])
+    
+    melhores = catalogo.iloc[ordem[inicio_grupo]].copy()
+    melhores['Ofertas'] = np.diff(np.r_[inicio_grupo, len(ordem)])
+    return melhores.sort_index()
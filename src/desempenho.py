@@ -0,0 +1,282 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+import importlib
+import threading
+import json
+import time
+
+# Limites superiores (em ms) das faixas do histograma de latência.
+# A última faixa (acima de 10s) fica implícita.
+FAIXAS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class _Etapa:
+    """Estatísticas acumuladas de uma etapa medida (contagem, soma, extremos e histograma)."""
+
+    __slots__ = ('contagem', 'soma', 'minimo', 'maximo', 'histograma')
+
+    def __init__(self):
+        self.contagem = 0
+        self.soma = 0.0
+        self.minimo = float('inf')
+        self.maximo = 0.0
+        self.histograma = [0] * (len(FAIXAS_MS) + 1)
+
+    def adicionar(self, duracao_ms):
+        self.contagem += 1
+        self.soma += duracao_ms
+        if duracao_ms < self.minimo:
+            self.minimo = duracao_ms
+        if duracao_ms > self.maximo:
+            self.maximo = duracao_ms
+        self.histograma[bisect_left(FAIXAS_MS, duracao_ms)] += 1
+
+    def percentil(self, p):
+        """Estima o percentil p (0-100) pelo limite superior da faixa do histograma."""
+        if not self.contagem:
+            return 0.0
+        alvo = self.contagem * p / 100
+        acumulado = 0
+        for i, quantidade in enumerate(self.histograma):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                # A faixa aberta do fim é limitada pelo máximo observado
+                return min(FAIXAS_MS[i], self.maximo) if i < len(FAIXAS_MS) else self.maximo
+        return self.maximo
+
+
+# Registro global: as medições vêm da thread da interface e das threads de imagem
+_trava = threading.Lock()
+_etapas = {}
+_caches = {}
+
+
+def registrar_duracao(etapa, duracao_ms):
+    """Registra a duração (em ms) de uma execução da etapa."""
+    with _trava:
+        estatisticas = _etapas.get(etapa)
+        if estatisticas is None:
+            estatisticas = _etapas[etapa] = _Etapa()
+        estatisticas.adicionar(duracao_ms)
+
+
+@contextmanager
+def medir(etapa):
+    """
+    Mede o tempo do bloco e o acumula na etapa informada.
+
+    Uso:
+        with medir('carregar_dados'):
+            ...
+    """
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_duracao(etapa, (time.perf_counter() - inicio) * 1000)
+
+
+def cronometrado(etapa):
+    """Decorador equivalente a envolver a função inteira em medir(etapa)."""
+    def decorador(funcao):
+        @wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                registrar_duracao(etapa, (time.perf_counter() - inicio) * 1000)
+        return envoltorio
+    return decorador
+
+
+def registrar_cache(nome, acerto):
+    """Contabiliza um acerto (True) ou falha (False) do cache informado."""
+    with _trava:
+        contadores = _caches.setdefault(nome, [0, 0])
+        contadores[0 if acerto else 1] += 1
+
+
+def resumo():
+    """
+    Retorna um retrato das métricas coletadas até o momento.
+
+    Returns:
+        dict: {'etapas': {...}, 'caches': {...}} com valores em milissegundos
+    """
+    with _trava:
+        etapas = {}
+        for nome, e in _etapas.items():
+            etapas[nome] = {
+                'contagem': e.contagem,
+                'media_ms': e.soma / e.contagem if e.contagem else 0.0,
+                'p50_ms': e.percentil(50),
+                'p95_ms': e.percentil(95),
+                'min_ms': e.minimo if e.contagem else 0.0,
+                'max_ms': e.maximo,
+                'histograma': {
+                    (f'<={limite}ms' if i < len(FAIXAS_MS) else f'>{FAIXAS_MS[-1]}ms'): quantidade
+                    for i, (limite, quantidade) in enumerate(zip(FAIXAS_MS + (None,), e.histograma))
+                },
+            }
+        caches = {}
+        for nome, (acertos, falhas) in _caches.items():
+            total = acertos + falhas
+            caches[nome] = {
+                'acertos': acertos,
+                'falhas': falhas,
+                'taxa_acerto': acertos / total if total else 0.0,
+            }
+    return {'etapas': etapas, 'caches': caches}
+
+
+def exportar(caminho_arquivo):
+    """Grava o resumo das métricas em um arquivo JSON."""
+    dados = resumo()
+    dados['gerado_em'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    with open(caminho_arquivo, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+
+
+def zerar():
+    """Descarta todas as métricas coletadas."""
+    with _trava:
+        _etapas.clear()
+        _caches.clear()
+
+
+# ---------------- Importação Adiada ---------------- #
+
+class ModuloAdiado:
+    """
+    Módulo importado só no primeiro acesso a um atributo (ou pelo precarregar).
+
+    Deixa a janela aparecer antes de carregar as bibliotecas pesadas (pandas, ReportLab...):
+        pd = ModuloAdiado('pandas')
+        pd.DataFrame()    # o import acontece aqui, se ainda não aconteceu
+    O tempo de cada importação aparece no painel de diagnóstico ('importar <módulo>').
+    """
+
+    def __init__(self, nome):
+        self._nome = nome
+        self._modulo = None
+
+    def carregar(self):
+        """Importa o módulo (se ainda não foi importado) e o retorna."""
+        if self._modulo is None:
+            with medir(f'importar {self._nome}'):
+                self._modulo = importlib.import_module(self._nome)
+        return self._modulo
+
+    def __getattr__(self, atributo):
+        return getattr(self.carregar(), atributo)
+
+
+def precarregar(modulos):
+    """
+    Importa os módulos adiados em uma thread de fundo, na ordem informada.
+
+    Um uso antes do fim apenas espera a importação em andamento daquele módulo.
+
+    Returns:
+        threading.Thread: A thread iniciada
+    """
+    def carregar_todos():
+        for modulo in modulos:
+            try:
+                modulo.carregar()
+            except Exception as e:
+                # O erro aparece de novo (e é tratado) no primeiro uso do módulo
+                print(f"Aviso: não foi possível pré-carregar {modulo._nome}: {e}")
+
+    thread = threading.Thread(target=carregar_todos, daemon=True)
+    thread.start()
+    return thread
+
+
+# ---------------- Painel de Diagnóstico ---------------- #
+
+def abrir_painel_diagnostico(app):
+    """
+    Abre (ou traz para frente) a janela com as latências por etapa e as taxas de acerto dos caches.
+
+    Args:
+        app: Instância da aplicação principal
+    """
+    painel = getattr(app, 'janela_diagnostico', None)
+    if painel is not None and painel.winfo_exists():
+        painel.lift()
+        return
+
+    painel = tk.Toplevel(app.root)
+    painel.title("Diagnóstico de Desempenho")
+    painel.minsize(700, 400)
+    app.janela_diagnostico = painel
+
+    painel.grid_columnconfigure(0, weight=1)
+    painel.grid_rowconfigure(0, weight=3)
+    painel.grid_rowconfigure(1, weight=1)
+
+    # --- Tabela de etapas ---
+    colunas_etapas = ("Etapa", "Execuções", "Média (ms)", "p50 (ms)", "p95 (ms)", "Máx (ms)")
+    tree_etapas = ttk.Treeview(painel, columns=colunas_etapas, show="headings")
+    for coluna in colunas_etapas:
+        tree_etapas.heading(coluna, text=coluna)
+        tree_etapas.column(coluna, anchor='e', width=90)
+    tree_etapas.column("Etapa", anchor='w', width=200)
+    tree_etapas.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10, 5))
+
+    # --- Tabela de caches ---
+    colunas_caches = ("Cache", "Acertos", "Falhas", "Taxa de acerto")
+    tree_caches = ttk.Treeview(painel, columns=colunas_caches, show="headings", height=4)
+    for coluna in colunas_caches:
+        tree_caches.heading(coluna, text=coluna)
+        tree_caches.column(coluna, anchor='e', width=120)
+    tree_caches.column("Cache", anchor='w', width=200)
+    tree_caches.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
+
+    def atualizar():
+        dados = resumo()
+        tree_etapas.delete(*tree_etapas.get_children())
+        for nome, e in sorted(dados['etapas'].items()):
+            tree_etapas.insert('', 'end', values=(
+                nome, e['contagem'], f"{e['media_ms']:.1f}", f"{e['p50_ms']:.0f}",
+                f"{e['p95_ms']:.0f}", f"{e['max_ms']:.1f}"
+            ))
+        tree_caches.delete(*tree_caches.get_children())
+        for nome, c in sorted(dados['caches'].items()):
+            tree_caches.insert('', 'end', values=(
+                nome, c['acertos'], c['falhas'], f"{c['taxa_acerto']:.0%}"
+            ))
+
+    def exportar_arquivo():
+        caminho = filedialog.asksaveasfilename(
+            parent=painel,
+            defaultextension=".json",
+            initialfile=f"Diagnostico_{time.strftime('%Y%m%d_%H%M%S')}.json",
+            title="Exportar Diagnóstico",
+            filetypes=[("Arquivos JSON", "*.json")]
+        )
+        if not caminho:
+            return
+        try:
+            exportar(caminho)
+            messagebox.showinfo("Sucesso", f"Diagnóstico exportado em:\n{caminho}", parent=painel)
+        except Exception as e:
+            messagebox.showerror("Erro", f"Não foi possível exportar o diagnóstico:\n{str(e)}", parent=painel)
+
+    def zerar_metricas():
+        zerar()
+        atualizar()
+
+    # --- Botões ---
+    frame_botoes = tk.Frame(painel)
+    frame_botoes.grid(row=2, column=0, pady=(5, 10))
+    ttk.Button(frame_botoes, text="Atualizar", command=atualizar).grid(row=0, column=0, padx=5)
+    ttk.Button(frame_botoes, text="Exportar...", command=exportar_arquivo).grid(row=0, column=1, padx=5)
+    ttk.Button(frame_botoes, text="Zerar", command=zerar_metricas).grid(row=0, column=2, padx=5)
+
+    atualizar()
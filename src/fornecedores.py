@@ -0,0 +1,136 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import os
+
+from database import ler_cabecalhos
+
+
+def _coluna_padrao(colunas, nome):
+    """Coluna com o nome informado (sem diferenciar maiúsculas) ou a primeira da lista."""
+    return next((col for col in colunas if col.lower() == nome), colunas[0])
+
+
+def abrir_fornecedores(app):
+    """
+    Abre a janela para montar a lista de planilhas de fornecedores e carregá-las juntas.
+
+    Cada planilha tem o seu próprio mapeamento de colunas de Descrição e Preço.
+    A lista fica guardada em app.fontes_fornecedores para a próxima vez.
+
+    Args:
+        app: Instância da aplicação principal
+    """
+    janela = tk.Toplevel(app.root)
+    janela.title("Carregar Fornecedores")
+    janela.minsize(700, 400)
+    janela.grid_columnconfigure(0, weight=1)
+    janela.grid_rowconfigure(2, weight=1)
+
+    caminho = tk.StringVar()
+    fornecedor = tk.StringVar()
+    coluna_descricao = tk.StringVar()
+    coluna_preco = tk.StringVar()
+
+    # --- Arquivo ---
+    frame_arquivo = tk.Frame(janela)
+    frame_arquivo.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
+    frame_arquivo.grid_columnconfigure(1, weight=1)
+
+    tk.Label(frame_arquivo, text="Planilha:").grid(row=0, column=0, sticky="w", padx=(0, 5))
+    tk.Entry(
+        frame_arquivo, textvariable=caminho, state='readonly', bd=2, relief='sunken'
+    ).grid(row=0, column=1, sticky="ew", padx=5)
+
+    # --- Mapeamento das colunas ---
+    frame_colunas = tk.Frame(janela)
+    frame_colunas.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
+    frame_colunas.grid_columnconfigure(3, weight=1)
+    frame_colunas.grid_columnconfigure(5, weight=1)
+
+    tk.Label(frame_colunas, text="Fornecedor:").grid(row=0, column=0, sticky="w", padx=(0, 5))
+    tk.Entry(frame_colunas, textvariable=fornecedor, width=20).grid(row=0, column=1, padx=5)
+    tk.Label(frame_colunas, text="Descrição:").grid(row=0, column=2, sticky="w", padx=(10, 5))
+    combo_descricao = ttk.Combobox(frame_colunas, textvariable=coluna_descricao, state="readonly")
+    combo_descricao.grid(row=0, column=3, sticky="ew", padx=5)
+    tk.Label(frame_colunas, text="Preço:").grid(row=0, column=4, sticky="w", padx=(10, 5))
+    combo_preco = ttk.Combobox(frame_colunas, textvariable=coluna_preco, state="readonly")
+    combo_preco.grid(row=0, column=5, sticky="ew", padx=5)
+
+    # --- Lista de fornecedores ---
+    colunas_lista = ("Fornecedor", "Planilha", "Col. Descrição", "Col. Preço")
+    tree = ttk.Treeview(janela, columns=colunas_lista, show="headings", selectmode="browse")
+    for coluna in colunas_lista:
+        tree.heading(coluna, text=coluna)
+        tree.column(coluna, anchor='w', width=130)
+    tree.column("Planilha", width=280)
+    tree.grid(row=2, column=0, sticky="nsew", padx=10, pady=5)
+
+    def preencher_lista():
+        tree.delete(*tree.get_children())
+        for indice, (nome, arquivo, col_descricao, col_preco) in enumerate(app.fontes_fornecedores):
+            tree.insert('', 'end', iid=str(indice), values=(
+                nome, os.path.basename(arquivo), col_descricao, col_preco
+            ))
+
+    def escolher_planilha():
+        arquivo = filedialog.askopenfilename(
+            parent=janela,
+            title="Selecione a Planilha do Fornecedor",
+            filetypes=(
+                ("Arquivos Excel", "*.xlsx *.xls"),
+                ("Arquivos CSV", "*.csv"),
+                ("Todos os Arquivos", "*.*")
+            )
+        )
+        if not arquivo:
+            return
+        try:
+            colunas = ler_cabecalhos(arquivo)
+        except Exception as e:
+            messagebox.showerror("Erro de Análise", str(e), parent=janela)
+            return
+        if not colunas:
+            messagebox.showwarning("Aviso", "Nenhuma coluna encontrada na planilha.", parent=janela)
+            return
+
+        caminho.set(arquivo)
+        fornecedor.set(os.path.splitext(os.path.basename(arquivo))[0])
+        combo_descricao['values'] = colunas
+        combo_preco['values'] = colunas
+        coluna_descricao.set(_coluna_padrao(colunas, 'descrição'))
+        coluna_preco.set(_coluna_padrao(colunas, 'preço'))
+
+    def incluir():
+        nome = fornecedor.get().strip()
+        if not caminho.get() or not nome:
+            messagebox.showwarning("Aviso", "Escolha a planilha e informe o nome do fornecedor.", parent=janela)
+            return
+        if any(fonte[0] == nome for fonte in app.fontes_fornecedores):
+            messagebox.showwarning("Aviso", f"O fornecedor '{nome}' já está na lista.", parent=janela)
+            return
+        app.fontes_fornecedores.append((nome, caminho.get(), coluna_descricao.get(), coluna_preco.get()))
+        caminho.set("")
+        fornecedor.set("")
+        preencher_lista()
+
+    def remover():
+        for iid in tree.selection():
+            del app.fontes_fornecedores[int(iid)]
+        preencher_lista()
+
+    def carregar():
+        if not app.fontes_fornecedores:
+            messagebox.showwarning("Aviso", "Inclua ao menos uma planilha na lista.", parent=janela)
+            return
+        if app.carregar_fornecedores(list(app.fontes_fornecedores)):
+            janela.destroy()
+
+    ttk.Button(frame_arquivo, text="Escolher...", command=escolher_planilha).grid(row=0, column=2, padx=(5, 0))
+    ttk.Button(frame_colunas, text="Incluir", command=incluir).grid(row=0, column=6, padx=(5, 0))
+
+    frame_botoes = tk.Frame(janela)
+    frame_botoes.grid(row=3, column=0, pady=(5, 10))
+    ttk.Button(frame_botoes, text="Remover", command=remover).grid(row=0, column=0, padx=5)
+    ttk.Button(frame_botoes, text="Carregar Todos", command=carregar).grid(row=0, column=1, padx=5)
+
+    preencher_lista()
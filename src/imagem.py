@@ -4,6 +4,218 @@ from io import BytesIO
 from PIL import Image, ImageTk
 import re
 import tkinter as tk
+import os
+import json
+import time
+import queue
+from collections import deque
+from datetime import date
+import numpy as np
+
+from desempenho import medir, registrar_cache
+import sessao
+
+URL_BUSCA = "https://www.googleapis.com/customsearch/v1"
+
+
+def _inteiro_env(nome, padrao):
+    """Inteiro positivo do .env; ausente ou inválido, vale o padrão (com aviso se inválido)."""
+    texto = os.getenv(nome, '').strip()
+    if not texto:
+        return padrao
+    try:
+        valor = int(texto)
+    except ValueError:
+        valor = 0
+    if valor <= 0:
+        print(f"Aviso: {nome}={texto!r} inválido no .env; usando {padrao}.")
+        return padrao
+    return valor
+
+
+# Cota da Custom Search API: consultas por dia (a gratuita é de 100) e ritmo máximo por minuto
+COTA_DIARIA = _inteiro_env('GOOGLE_COTA_DIARIA', 100)
+CONSULTAS_POR_MINUTO = _inteiro_env('GOOGLE_CONSULTAS_MINUTO', 10)
+# Fração da cota diária guardada para os cliques: a busca antecipada não passa dela
+RESERVA_CLIQUES = 0.2
+
+# Imagens pedidas por busca (e botões da faixa de miniaturas)
+NUM_MINIATURAS = 5
+
+# Ordem de preferência dos formatos (os demais, como GIF e SVG, vão para o fim da fila)
+PREFERENCIA_MIME = {'image/jpeg': 0, 'image/png': 1, 'image/webp': 2}
+# Lado da imagem principal no painel: menores que isso ficam borradas
+LADO_PRINCIPAL = 300
+# Bits diferentes (de 64) até os quais dois dHashes são considerados a mesma foto
+LIMIAR_DUPLICADA = 6
+
+# Quem está pedindo a consulta: o usuário (clique) ou a busca antecipada em segundo plano
+PRIORIDADE_CLIQUE = 'clique'
+PRIORIDADE_ANTECIPADA = 'antecipada'
+
+
+class BuscaBloqueada(Exception):
+    """A consulta não foi feita (cota esgotada, ritmo alto ou disjuntor aberto); a mensagem é para o usuário."""
+
+
+class LimitadorCota:
+    """
+    Balde de fichas das consultas à Custom Search API.
+
+    O balde guarda até `por_minuto` fichas e ganha uma a cada 60/por_minuto segundos:
+    alguns cliques seguidos passam na hora, uma sequência longa é espaçada. Além do
+    balde, as consultas do dia são contadas contra a cota diária; a contagem fica em
+    arquivo para valer também depois de fechar o programa.
+
+    A busca antecipada não usa a reserva dos cliques e só consulta com pelo menos metade
+    do balde cheio, para nunca deixar um clique esperando.
+    """
+
+    def __init__(self, cota_diaria, por_minuto, reserva=RESERVA_CLIQUES, arquivo=None):
+        self.cota_diaria = cota_diaria
+        self.capacidade = float(por_minuto)
+        self.taxa = por_minuto / 60.0  # fichas por segundo
+        self.reserva = int(cota_diaria * reserva)
+        self.arquivo = arquivo
+        self.fichas = self.capacidade
+        self._reposto_em = time.monotonic()
+        self._trava = threading.Lock()
+        self.dia, self.usadas = self._ler_uso()
+
+    def _ler_uso(self):
+        """Retorna (dia, consultas usadas) gravados; em outro dia, a contagem recomeça."""
+        hoje = date.today().isoformat()
+        try:
+            with open(self.arquivo, encoding='utf-8') as f:
+                uso = json.load(f)
+            if uso.get('dia') == hoje:
+                return hoje, int(uso.get('usadas', 0))
+        except (TypeError, OSError, ValueError, AttributeError):
+            pass
+        return hoje, 0
+
+    def _gravar_uso(self):
+        if not self.arquivo:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.arquivo), exist_ok=True)
+            with open(self.arquivo, 'w', encoding='utf-8') as f:
+                json.dump({'dia': self.dia, 'usadas': self.usadas}, f)
+        except OSError as e:
+            print(f"Aviso: não foi possível gravar o uso da cota: {e}")
+
+    def _repor(self):
+        """Devolve ao balde as fichas do tempo passado e zera a contagem se o dia virou."""
+        agora = time.monotonic()
+        self.fichas = min(self.capacidade, self.fichas + (agora - self._reposto_em) * self.taxa)
+        self._reposto_em = agora
+        hoje = date.today().isoformat()
+        if hoje != self.dia:
+            self.dia, self.usadas = hoje, 0
+
+    def _fichas_minimas(self, prioridade):
+        return self.capacidade / 2 if prioridade == PRIORIDADE_ANTECIPADA else 1.0
+
+    def _sobra_do_dia(self, prioridade):
+        restantes = self.cota_diaria - self.usadas
+        return restantes - self.reserva if prioridade == PRIORIDADE_ANTECIPADA else restantes
+
+    def sobra_do_dia(self, prioridade=PRIORIDADE_CLIQUE):
+        """Consultas do dia que a prioridade informada ainda pode usar."""
+        with self._trava:
+            self._repor()
+            return self._sobra_do_dia(prioridade)
+
+    def motivo_bloqueio(self, prioridade=PRIORIDADE_CLIQUE):
+        """
+        Diz se uma consulta pode ser feita agora, sem gastar a ficha.
+
+        Returns:
+            str: Motivo para o usuário, ou None se a consulta está liberada
+        """
+        with self._trava:
+            self._repor()
+            if self._sobra_do_dia(prioridade) <= 0:
+                return "Cota diária de buscas esgotada"
+            if self.fichas < self._fichas_minimas(prioridade):
+                return f"Muitas buscas seguidas: aguarde {self.espera_s(prioridade):.0f} s"
+            return None
+
+    def espera_s(self, prioridade=PRIORIDADE_CLIQUE):
+        """Segundos até o balde ter fichas para a prioridade informada."""
+        return max(0.0, (self._fichas_minimas(prioridade) - self.fichas) / self.taxa)
+
+    def consumir(self, prioridade=PRIORIDADE_CLIQUE):
+        """
+        Gasta uma ficha e uma consulta do dia, se houver.
+
+        Returns:
+            bool: True se a consulta pode ser feita
+        """
+        with self._trava:
+            self._repor()
+            if self._sobra_do_dia(prioridade) <= 0 or self.fichas < self._fichas_minimas(prioridade):
+                return False
+            self.fichas -= 1
+            self.usadas += 1
+            self._gravar_uso()
+            return True
+
+    def esgotar(self):
+        """Marca a cota do dia como usada (a API avisou que ela acabou antes da conta local)."""
+        with self._trava:
+            self._repor()
+            self.usadas = max(self.usadas, self.cota_diaria)
+            self._gravar_uso()
+
+
+class Disjuntor:
+    """
+    Interrompe as consultas depois de `limite_falhas` erros seguidos da API (429 ou 5xx).
+
+    Aberto, ele bloqueia as consultas por `espera_s` segundos; depois deixa passar uma
+    nova tentativa. Se ela falhar, abre de novo pelo dobro do tempo (até `espera_max_s`);
+    um sucesso fecha o disjuntor.
+    """
+
+    def __init__(self, limite_falhas=3, espera_s=30.0, espera_max_s=900.0):
+        self.limite_falhas = limite_falhas
+        self.espera_inicial_s = espera_s
+        self.espera_max_s = espera_max_s
+        self.falhas = 0
+        self._espera_s = espera_s
+        self._aberto_ate = 0.0
+        self._trava = threading.Lock()
+
+    def segundos_restantes(self):
+        """Segundos até liberar as consultas (0 com o disjuntor fechado ou no fim da espera)."""
+        with self._trava:
+            if self.falhas < self.limite_falhas:
+                return 0.0
+            return max(0.0, self._aberto_ate - time.monotonic())
+
+    def registrar_sucesso(self):
+        with self._trava:
+            self.falhas = 0
+            self._espera_s = self.espera_inicial_s
+
+    def registrar_falha(self):
+        with self._trava:
+            self.falhas += 1
+            if self.falhas > self.limite_falhas:
+                # A tentativa depois da espera também falhou
+                self._espera_s = min(self._espera_s * 2, self.espera_max_s)
+            if self.falhas >= self.limite_falhas:
+                self._aberto_ate = time.monotonic() + self._espera_s
+
+
+# Compartilhados pelos cliques e pela busca antecipada
+cota = LimitadorCota(
+    COTA_DIARIA, CONSULTAS_POR_MINUTO, 
+    arquivo=os.path.join(sessao.diretorio_sessao(), 'cota_google.json')
+)
+disjuntor = Disjuntor()
+
 
 def formatar_descricao(descricao):
     """
@@ -21,6 +233,246 @@ def formatar_descricao(descricao):
     query = descricao_limpa.replace(" ", "+") 
     return query
 
+def _motivo_bloqueio(prioridade):
+    """Motivo para não consultar a API agora (disjuntor aberto ou cota), ou None."""
+    espera = disjuntor.segundos_restantes()
+    if espera:
+        return f"Buscas pausadas por erros da API (voltam em {espera:.0f} s)"
+    return cota.motivo_bloqueio(prioridade)
+
+
+def _consultar_api(app, descricao):
+    """
+    Faz a consulta de imagens na Custom Search API (a ficha da cota já deve ter sido gasta).
+    Erros 429 e 5xx alimentam o disjuntor; um 429 de cota diária esgota a cota local.
+
+    Returns:
+        dict: Resposta da API
+
+    Raises:
+        requests.HTTPError: Se a API responder com erro
+    """
+    # Garante que a query será limpa e formatada corretamente com '+'
+    query = formatar_descricao(descricao) + "+produto+computador+informatica"
+    params = {
+        "q": query,
+        "cx": app.CX,
+        "key": app.API_KEY,
+        "searchType": "image",
+        "num": NUM_MINIATURAS, # Pega 5 imagens
+        "imgType": "photo",
+        "imgSize": "medium",
+        "safe": "active"
+    }
+
+    with medir('imagem_busca'):
+        response = requests.get(URL_BUSCA, params=params, timeout=10)
+    if response.status_code == 429 or response.status_code >= 500:
+        if response.status_code == 429 and ('dailyLimitExceeded' in response.text or 'per day' in response.text):
+            cota.esgotar()
+        disjuntor.registrar_falha()
+    elif response.ok:
+        disjuntor.registrar_sucesso()
+    response.raise_for_status()
+    return response.json()
+
+
+def dhash(img, lado=8):
+    """
+    Hash perceptual por diferença (dHash): a imagem reduzida a (lado+1) x lado em tons
+    de cinza vira um bit por vizinho, 1 se o pixel à direita é mais claro. A mesma foto
+    em outro tamanho, formato ou compressão dá o mesmo hash (ou um muito próximo).
+
+    Args:
+        img (PIL.Image): Imagem já aberta
+        lado (int): Bits por linha (8 dá um hash de 64 bits)
+
+    Returns:
+        int: O hash
+    """
+    cinza = np.asarray(
+        img.convert('L').resize((lado + 1, lado), Image.Resampling.BILINEAR), dtype=np.int16
+    )
+    bits = cinza[:, 1:] > cinza[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+def distancia_hash(a, b):
+    """Número de bits diferentes entre dois hashes."""
+    return bin(a ^ b).count('1')
+
+
+def _ordenar_candidatos(itens):
+    """
+    Ordena os resultados da busca pelos metadados (formato, dimensões, tamanho e site),
+    antes de baixar qualquer um: vêm primeiro JPEG/PNG com tamanho suficiente para o
+    painel, sem proporção de banner, de sites ainda não vistos e com menos bytes.
+    Resultados com as mesmas dimensões e o mesmo tamanho em bytes (a mesma foto em
+    outro site) ficam só com o melhor.
+
+    Returns:
+        list: Os itens na ordem de download
+    """
+    def chave(posicao_item):
+        posicao, item = posicao_item
+        info = item.get('image') or {}
+        largura, altura = int(info.get('width') or 0), int(info.get('height') or 0)
+        pequena = min(largura, altura) < LADO_PRINCIPAL
+        banner = bool(largura and altura) and max(largura, altura) > 2 * min(largura, altura)
+        return (
+            PREFERENCIA_MIME.get(item.get('mime'), len(PREFERENCIA_MIME)), 
+            pequena or banner, 
+            int(info.get('byteSize') or 0) or float('inf'), 
+            posicao
+        )
+
+    ordenados = [item for _, item in sorted(enumerate(itens), key=chave)]
+    # Um site repetido vai para depois dos outros (a segunda foto dele costuma ser a mesma)
+    sites = set()
+    primeiros, repetidos = [], []
+    vistos = set()
+    for item in ordenados:
+        info = item.get('image') or {}
+        assinatura = (info.get('width'), info.get('height'), info.get('byteSize'))
+        if info.get('byteSize') and assinatura in vistos:
+            continue
+        vistos.add(assinatura)
+        site = item.get('displayLink')
+        (repetidos if site in sites else primeiros).append(item)
+        sites.add(site)
+    return primeiros + repetidos
+
+
+def _baixar_imagens(app, descricao):
+    """
+    Consulta a API, baixa as imagens do produto e as guarda nos caches do app.
+
+    Os candidatos são baixados na ordem de _ordenar_candidatos; depois de abertos, os
+    que têm o dHash próximo ao de uma imagem aceita são descartados. Os hashes aceitos e
+    os links duplicados (com o link original de cada um) ficam em app.cache_hashes_imagens,
+    que sobrevive ao "Atualizar Imagem": numa nova busca, os hashes das imagens que
+    voltaram entram na comparação desde o início, e um link já conhecido como duplicado
+    nem é baixado enquanto a sua original estiver nos resultados. Se a original falhar
+    no download, as duplicadas dela voltam para a fila.
+
+    Um produto sem nenhuma imagem válida fica em app.cache_sem_imagens: nem o clique
+    nem a busca antecipada o consultam de novo (só o "Atualizar Imagem").
+
+    Returns:
+        bool: True se alguma imagem válida foi encontrada
+    """
+    data = _consultar_api(app, descricao)
+    if "items" not in data:
+        app.cache_sem_imagens.add(descricao)
+        return False
+
+    conhecidos = app.cache_hashes_imagens.setdefault(descricao, {'hashes': {}, 'duplicadas': {}})
+    fila = deque(_ordenar_candidatos(data["items"]))
+    presentes = {item["link"] for item in fila}
+    # Hashes já conhecidos das imagens que voltaram na busca
+    hashes_aceitos = {url: h for url, h in conhecidos['hashes'].items() if url in presentes}
+    baixadas = set()
+    # Links pulados por serem iguais a uma original ainda não baixada nesta busca
+    dependentes = {}
+    miniaturas = []
+    dados_primeira_imagem = None
+    while fila:
+        item = fila.popleft()
+        img_url = item["link"]
+        original = conhecidos['duplicadas'].get(img_url)
+        if original in presentes and original != img_url:
+            # Já se sabe que é a mesma foto de outro link: não baixa de novo
+            dependentes.setdefault(original, []).append(item)
+            continue
+            
+        try:
+            # Tenta baixar os dados da imagem (timeout para não travar)
+            with medir('imagem_download'):
+                img_data = requests.get(img_url, timeout=5).content
+            
+            # Tenta abrir e redimensionar a imagem
+            img = Image.open(BytesIO(img_data))
+            # Ajusta para 100x100 para miniaturas
+            img.thumbnail((100, 100), Image.Resampling.LANCZOS)
+            
+            # A mesma foto em outro tamanho ou site fica de fora
+            with medir('imagem_hash'):
+                hash_img = dhash(img)
+            igual = next((
+                url for url, h in hashes_aceitos.items() 
+                if url != img_url and distancia_hash(hash_img, h) <= LIMIAR_DUPLICADA
+            ), None)
+            if igual is not None:
+                conhecidos['duplicadas'][img_url] = igual
+                if igual not in baixadas:
+                    dependentes.setdefault(igual, []).append(item)
+                continue
+            hashes_aceitos[img_url] = hash_img
+            conhecidos['hashes'][img_url] = hash_img
+            conhecidos['duplicadas'].pop(img_url, None)
+            baixadas.add(img_url)
+            
+            if dados_primeira_imagem is None:
+                # Guarda os bytes da primeira imagem válida para o display principal
+                dados_primeira_imagem = img_data
+            # PIL.Image precisa ser convertido para PhotoImage do Tkinter
+            img_tk = ImageTk.PhotoImage(img)
+            miniaturas.append((img_tk, img_url))
+
+        except Exception as img_e:
+            # Este bloco captura "cannot identify image file" e outros erros
+            print(f"Erro ao processar imagem de URL {img_url}: {img_e}")
+            # Sem a original, as iguais a ela deixam de ser duplicadas
+            presentes.discard(img_url)
+            hashes_aceitos.pop(img_url, None)
+            fila.extend(dependentes.pop(img_url, []))
+            continue
+
+    if not miniaturas:
+        app.cache_sem_imagens.add(descricao)
+        return False
+    app.cache_sem_imagens.discard(descricao)
+
+    # Processa a primeira imagem para o display principal (tamanho maior),
+    # reaproveitando os bytes já baixados
+    img_principal = Image.open(BytesIO(dados_primeira_imagem))
+    img_principal.thumbnail((LADO_PRINCIPAL, LADO_PRINCIPAL), Image.Resampling.LANCZOS) 
+    img_tk_principal = ImageTk.PhotoImage(img_principal)
+
+    app.cache_miniaturas[descricao] = miniaturas
+    app.cache_imagens[descricao] = img_tk_principal
+    # Bytes originais da imagem principal (usados pelas miniaturas do PDF)
+    app.cache_bytes_imagens[descricao] = dados_primeira_imagem
+    return True
+
+
+def atualizar_contador_cota(app):
+    """
+    Mostra as consultas usadas no dia e se as buscas estão pausadas (chamar na thread principal).
+    Com o disjuntor aberto, reagenda a si mesma a cada segundo para a contagem regressiva.
+    """
+    if app._id_contador_cota is not None:
+        app.root.after_cancel(app._id_contador_cota)
+        app._id_contador_cota = None
+    texto = f"Buscas hoje: {cota.usadas}/{cota.cota_diaria}"
+    restantes = cota.cota_diaria - cota.usadas
+    espera = disjuntor.segundos_restantes()
+    if espera:
+        texto += f" (pausadas por {espera:.0f} s)"
+        cor = "red"
+    elif restantes <= 0:
+        texto += " (esgotada: só imagens já carregadas)"
+        cor = "red"
+    elif restantes <= cota.reserva:
+        # Só os cliques ainda consultam a API
+        cor = "darkorange"
+    else:
+        cor = "gray"
+    app.label_cota.config(text=texto, fg=cor)
+    if espera:
+        app._id_contador_cota = app.root.after(1000, lambda: atualizar_contador_cota(app))
+
+
 def mostrar_imagem(app, force_update=False):
     selected_item = app.tree_principal.selection()
     if not selected_item:
@@ -28,81 +480,40 @@ def mostrar_imagem(app, force_update=False):
 
     descricao = app.tree_principal.item(selected_item[0], 'values')[0]
     
-    # Atualização de UI no thread principal: Label de carregamento
-    app.label_imagem.config(text="Carregando imagem...", image="", compound="center")
-
     # Verifica cache
-    if not force_update and descricao in app.cache_imagens:
+    em_cache = not force_update and descricao in app.cache_imagens
+    registrar_cache('imagens', em_cache)
+    if em_cache:
         # Atualização de UI no thread principal
         app.label_imagem.config(image=app.cache_imagens[descricao], text="")
         exibir_miniaturas(app, descricao)
         return
+    if not force_update and descricao in app.cache_sem_imagens:
+        # A busca já não achou imagens deste produto: não gasta outra consulta
+        app.label_imagem.config(text="Nenhuma imagem encontrada", image="", compound="center")
+        exibir_miniaturas(app, None)
+        return
+
+    # Sem cota (ou com a API falhando) nem chega a consultar: fica só com o cache
+    motivo = _motivo_bloqueio(PRIORIDADE_CLIQUE)
+    if motivo is None and not cota.consumir(PRIORIDADE_CLIQUE):
+        # Outra consulta levou a última ficha entre a verificação e o consumo
+        motivo = _motivo_bloqueio(PRIORIDADE_CLIQUE) or "Muitas buscas seguidas"
+    atualizar_contador_cota(app)
+    if motivo:
+        app.label_imagem.config(text=f"{motivo}.\nSó imagens já carregadas.", image="", compound="center")
+        return
+
+    # Atualização de UI no thread principal: Label de carregamento
+    app.label_imagem.config(text="Carregando imagem...", image="", compound="center")
 
     def buscar_imagens():
-        miniaturas = []
         try:
-            # Garante que a query será limpa e formatada corretamente com '+'
-            query = formatar_descricao(descricao) + "+produto+computador+informatica"
-            url = "https://www.googleapis.com/customsearch/v1"
-            params = {
-                "q": query,
-                "cx": app.CX,
-                "key": app.API_KEY,
-                "searchType": "image",
-                "num": 5, # Pega 5 imagens
-                "imgType": "photo",
-                "imgSize": "medium",
-                "safe": "active"
-            }
-
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if "items" not in data:
+            if not _baixar_imagens(app, descricao):
                 # Agenda mensagem de erro na thread principal
                 app.root.after(0, lambda: app.label_imagem.config(text="Nenhuma imagem encontrada", image="", compound="center"))
                 return
 
-            
-            url_primeira_imagem = None
-            for item in data["items"]:
-                img_url = item["link"]
-                if url_primeira_imagem is None:
-                    url_primeira_imagem = img_url # Salva a primeira URL para o display principal
-                    
-                try:
-                    # Tenta baixar os dados da imagem (timeout para não travar)
-                    img_data = requests.get(img_url, timeout=5).content
-                    
-                    # Tenta abrir e redimensionar a imagem
-                    img = Image.open(BytesIO(img_data))
-                    # Ajusta para 100x100 para miniaturas
-                    img.thumbnail((100, 100), Image.Resampling.LANCZOS)
-                    # PIL.Image precisa ser convertido para PhotoImage do Tkinter
-                    img_tk = ImageTk.PhotoImage(img)
-                    miniaturas.append((img_tk, img_url))
-
-                except Exception as img_e:
-                    # Este bloco captura "cannot identify image file" e outros erros
-                    print(f"Erro ao processar imagem de URL {img_url}: {img_e}")
-                    continue
-
-            if not miniaturas:
-                # Agenda mensagem de erro na thread principal
-                app.root.after(0, lambda: app.label_imagem.config(text="Nenhuma imagem encontrada", image="", compound="center"))
-                return
-
-            # Processa a primeira imagem para o display principal (tamanho maior)
-            img_data_principal = requests.get(url_primeira_imagem, timeout=5).content
-            img_principal = Image.open(BytesIO(img_data_principal))
-            img_principal.thumbnail((300, 300), Image.Resampling.LANCZOS) 
-            img_tk_principal = ImageTk.PhotoImage(img_principal)
-
-            # --- Atualizações de Cache e UI (Agendadas para a thread principal) ---
-            app.cache_miniaturas[descricao] = miniaturas
-            app.cache_imagens[descricao] = img_tk_principal
-            
             # Agendamento das atualizações de UI
             def atualizar_ui_sucesso():
                 # Exibe a imagem principal
@@ -117,41 +528,142 @@ def mostrar_imagem(app, force_update=False):
             print(f"Erro ao buscar imagens: {e}")
             # CORREÇÃO: Captura a variável de exceção 'e' no lambda usando default argument
             app.root.after(0, lambda error_e=e: app.label_imagem.config(text=f"Erro: {error_e}", image="", compound="center"))
+        finally:
+            # O erro pode ter aberto o disjuntor
+            app.root.after(0, lambda: atualizar_contador_cota(app))
 
     threading.Thread(target=buscar_imagens, daemon=True).start()
 
 
+# ---------------- Busca Antecipada ---------------- #
+
+_fila_antecipacao = queue.Queue()
+_na_fila = set()  # Descrições aguardando na fila (cada uma entra uma vez só)
+_antecipador = None
+
+
+def antecipar_imagens(app, descricoes):
+    """
+    Busca em segundo plano as imagens dos produtos informados (ex.: itens do carrinho,
+    para o PDF com imagens). Usa só a cota acima da reserva dos cliques: quando ela
+    acaba ou o disjuntor abre, o restante da fila é descartado. Produtos já na fila,
+    com imagem no cache ou cuja busca não achou imagens ficam de fora.
+
+    Args:
+        app: Instância da aplicação principal
+        descricoes: Descrições dos produtos
+    """
+    global _antecipador
+    if not app.API_KEY or not app.CX:
+        return
+    for descricao in descricoes:
+        if (descricao not in app.cache_bytes_imagens and descricao not in app.cache_sem_imagens 
+                and descricao not in _na_fila):
+            _na_fila.add(descricao)
+            _fila_antecipacao.put(descricao)
+    if _antecipador is None or not _antecipador.is_alive():
+        _antecipador = threading.Thread(target=_antecipar, args=(app,), daemon=True)
+        _antecipador.start()
+
+
+def _descartar_fila():
+    while True:
+        try:
+            _na_fila.discard(_fila_antecipacao.get_nowait())
+        except queue.Empty:
+            return
+
+
+def _antecipar(app):
+    """Consome a fila de busca antecipada, no ritmo que a cota permite."""
+    while True:
+        descricao = _fila_antecipacao.get()
+        _na_fila.discard(descricao)
+        if descricao in app.cache_bytes_imagens or descricao in app.cache_sem_imagens:
+            continue
+        
+        # Espera o balde encher; sem sobra no dia ou com o disjuntor aberto, desiste
+        while not cota.consumir(PRIORIDADE_ANTECIPADA):
+            if disjuntor.segundos_restantes() or cota.sobra_do_dia(PRIORIDADE_ANTECIPADA) <= 0:
+                _descartar_fila()
+                descricao = None
+                break
+            time.sleep(cota.espera_s(PRIORIDADE_ANTECIPADA) + 0.1)
+        if descricao is None:
+            continue
+        
+        try:
+            _baixar_imagens(app, descricao)
+        except Exception as e:
+            print(f"Erro ao antecipar imagens de {descricao}: {e}")
+        app.root.after(0, lambda: atualizar_contador_cota(app))
+
+
 def atualizar_imagem(app):
     selected_item = app.tree_principal.selection()
     if not selected_item:
         return
     descricao = app.tree_principal.item(selected_item[0], 'values')[0]
+    # Sem consulta possível, mantém as imagens que já estão no cache
+    motivo = _motivo_bloqueio(PRIORIDADE_CLIQUE)
+    if motivo:
+        atualizar_contador_cota(app)
+        app.label_imagem.config(text=f"{motivo}.\nSó imagens já carregadas.", image="", compound="center")
+        return
     # Limpa os caches para forçar nova busca
+    app.cache_sem_imagens.discard(descricao)
     if descricao in app.cache_imagens:
         del app.cache_imagens[descricao]
+    if descricao in app.cache_bytes_imagens:
+        del app.cache_bytes_imagens[descricao]
     if descricao in app.cache_miniaturas:
         del app.cache_miniaturas[descricao]
-        # Limpa o frame de miniaturas (UI update)
-        for widget in app.frame_miniaturas.winfo_children():
-            widget.destroy()
+        # Esvazia a faixa de miniaturas (UI update)
+        exibir_miniaturas(app, None)
             
     # Chama a função principal para iniciar a nova busca
     mostrar_imagem(app, force_update=True)
 
 
+def _criar_botoes_miniaturas(app):
+    """
+    Cria, uma única vez, os botões da faixa de miniaturas. Depois eles só trocam de
+    imagem: nada é destruído ou recriado ao navegar pela lista.
+    """
+    for idx in range(NUM_MINIATURAS):
+        # O clique amplia a miniatura do produto exibido na faixa no momento
+        btn = tk.Button(app.frame_miniaturas,
+                        command=lambda i=idx: selecionar_miniatura(app, app.descricao_miniaturas, i))
+        btn.image = None
+        app.botoes_miniaturas.append(btn)
+
+
 def exibir_miniaturas(app, descricao):
-    # Limpa miniaturas antigas
-    for widget in app.frame_miniaturas.winfo_children():
-        widget.destroy()
+    """
+    Mostra na faixa as miniaturas do produto (descricao None esvazia a faixa).
+    Os botões são reaproveitados: só os que mudam de imagem são reconfigurados.
+    """
+    if not app.botoes_miniaturas:
+        _criar_botoes_miniaturas(app)
 
-    miniaturas = app.cache_miniaturas.get(descricao, [])
+    miniaturas = app.cache_miniaturas.get(descricao, []) if descricao is not None else []
+    app.descricao_miniaturas = descricao
     # Garante que as miniaturas são exibidas na thread principal
-    for idx, (img_tk, _) in enumerate(miniaturas):
+    for idx, btn in enumerate(app.botoes_miniaturas):
+        img_tk = miniaturas[idx][0] if idx < len(miniaturas) else None
+        if btn.image is img_tk:
+            continue
         # É crucial que o botão mantenha uma referência à ImageTk.PhotoImage (por isso o btn.image = img_tk)
-        btn = tk.Button(app.frame_miniaturas, image=img_tk,
-                        command=lambda i=idx: selecionar_miniatura(app, descricao, i))
-        btn.image = img_tk 
+        btn.config(image=img_tk if img_tk is not None else "")
+        btn.image = img_tk
+
+    # As miniaturas ocupam sempre os primeiros botões: mostra ou esconde só o final da faixa
+    visiveis = min(len(miniaturas), len(app.botoes_miniaturas))
+    for btn in app.botoes_miniaturas[app.miniaturas_visiveis:visiveis]:
         btn.pack(side="left", padx=2)
+    for btn in app.botoes_miniaturas[visiveis:app.miniaturas_visiveis]:
+        btn.pack_forget()
+    app.miniaturas_visiveis = visiveis
 
 def selecionar_miniatura(app, descricao, idx):
     miniaturas = app.cache_miniaturas.get(descricao)
@@ -161,7 +673,8 @@ def selecionar_miniatura(app, descricao, idx):
         # Redimensionamento e exibição da imagem principal em thread
         def carregar_principal():
             try:
-                img_data = requests.get(img_url, timeout=5).content
+                with medir('imagem_download'):
+                    img_data = requests.get(img_url, timeout=5).content
                 img_principal = Image.open(BytesIO(img_data))
                 img_principal.thumbnail((300, 300), Image.Resampling.LANCZOS)
                 img_tk_principal = ImageTk.PhotoImage(img_principal)
@@ -170,6 +683,8 @@ def selecionar_miniatura(app, descricao, idx):
                 app.root.after(0, lambda: app.label_imagem.config(image=img_tk_principal, text=""))
                 # Manter a referência forte
                 app.cache_imagens[descricao] = img_tk_principal
+                # A imagem escolhida passa a ser a usada no PDF
+                app.cache_bytes_imagens[descricao] = img_data
                 
             except Exception as e:
                 print(f"Erro ao selecionar miniatura: {e}")
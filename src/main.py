@@ -1,15 +1,32 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import pandas as pd
 import os
 import webbrowser
-import re
+import threading
+import time
 import dotenv # <<< Importação carregamento do .env
 
-# Importa as funções dos outros módulos
-from database import carregar_dados, ler_cabecalhos
-from imagem import mostrar_imagem, atualizar_imagem
-from pdf_generator import gerar_pdf
+from desempenho import medir, abrir_painel_diagnostico, ModuloAdiado, precarregar
+import sessao
+
+# Bibliotecas pesadas (pandas, numpy, requests, PIL, ReportLab) e os módulos que dependem
+# delas são importados no primeiro uso ou em segundo plano, depois que a janela já apareceu
+pd = ModuloAdiado('pandas')
+np = ModuloAdiado('numpy')
+database = ModuloAdiado('database')
+precificacao = ModuloAdiado('precificacao')
+imagem = ModuloAdiado('imagem')
+pdf_generator = ModuloAdiado('pdf_generator')
+comparacao = ModuloAdiado('comparacao')
+fornecedores = ModuloAdiado('fornecedores')
+catalogo_sqlite = ModuloAdiado('catalogo_sqlite')
+servico_catalogo = ModuloAdiado('servico_catalogo')
+
+# Ordem do pré-carregamento: o necessário para abrir uma planilha vem primeiro
+MODULOS_PRECARREGADOS = (
+    pd, np, database, precificacao, imagem, pdf_generator, 
+    comparacao, fornecedores, catalogo_sqlite, servico_catalogo
+)
 
 # Carrega varíaveis de ambiente vindas do arquivo .env (se existir)
 dotenv.load_dotenv()
@@ -24,8 +41,25 @@ class App:
     # Constantes da aplicação
     COL_DESCRICAO = 'Descrição'
     COL_PRECO = 'Preço'
+    COL_PRECO_VENDA = 'Preço Venda'
+    COL_FORNECEDOR = 'Fornecedor'
+    COL_ABA = 'Aba'
+    COL_CODIGO = 'Código'
+    SEM_CODIGO = '(nenhuma)'
+    NOMES_COLUNA_CODIGO = ('código', 'codigo', 'cód', 'cod', 'ean', 'sku', 'código de barras')
     WINDOW_MIN_WIDTH = 1000
     WINDOW_MIN_HEIGHT = 600
+    INTERVALO_MONITORAMENTO_MS = 3000  # Verificação da planilha no modo monitorar
+    INTERVALO_LEITOR_MS = 80  # Espera entre teclas antes de buscar um código (leitor de código de barras)
+    TAMANHO_PAGINA_EXTERNA = 1000  # Linhas por página no catálogo externo (serviço ou SQLite)
+    TITULOS_COLUNAS = {
+        "Descrição": "Descrição", 
+        "Preço": "Preço", 
+        "Fornecedor": "Fornecedor", 
+        "Aba": "Categoria", 
+        "Custo": "Custo", 
+        "Código": "Código"
+    }
     
     def __init__(self, root):
         """
@@ -45,6 +79,16 @@ class App:
             print("  - GOOGLE_API_KEY")
             print("  - GOOGLE_CX")
         
+        # Catálogo externo (serviço compartilhado ou arquivo SQLite): quando definido,
+        # as buscas são respondidas por ele em vez do DataFrame carregado em memória
+        self.catalogo_externo = None
+        self.nome_catalogo_externo = ""
+        # Página de resultados do catálogo externo: início da página, total da busca e a
+        # busca (filtro, faixa) a que ela se refere; uma busca nova volta à primeira página
+        self.offset_externo = 0
+        self.total_externo = 0
+        self._consulta_externa = None
+        
         self.root = root
         self.root.title("Consulta de Preços")
         self.root.minsize(self.WINDOW_MIN_WIDTH, self.WINDOW_MIN_HEIGHT)
@@ -52,19 +96,72 @@ class App:
         # Cache de imagens
         self.cache_imagens = {}
         self.cache_miniaturas = {}
+        # Bytes originais das imagens principais (reaproveitados no PDF, sem novo download)
+        self.cache_bytes_imagens = {}
+        # dHash das imagens aceitas e links de fotos duplicadas, por produto (mantidos ao atualizar a imagem)
+        self.cache_hashes_imagens = {}
+        # Produtos cuja busca não achou imagens (não são consultados de novo, só com "Atualizar Imagem")
+        self.cache_sem_imagens = set()
 
         # --- Variáveis de Dados e Estado ---
-        self.df = pd.DataFrame() 
+        self._df = None  # Catálogo em uso (ver a propriedade df)
         self.caminho_arquivo = tk.StringVar()
         
+        # Regras de precificação: o preço de venda (coluna 'Preço Venda') é o exibido,
+        # somado no total e impresso no PDF; 'Preço' continua sendo o custo da planilha
+        self.regras_preco = precificacao.RegrasPreco()
+        
+        # Opção de incluir miniaturas dos produtos no PDF
+        self.incluir_miniaturas_pdf = tk.BooleanVar(value=False)
+        
         # Variáveis para os nomes das colunas (serão usadas pelos Comboboxes)
         self.nome_coluna_descricao = tk.StringVar(value="") 
         self.nome_coluna_preco = tk.StringVar(value="")
+        self.nome_coluna_codigo = tk.StringVar(value="")  # Opcional (EAN/SKU)
         self.colunas_disponiveis = []
         
-        # Dicionário para armazenar o preço numérico real dos itens selecionados
-        # Estrutura: {iid: {'preco': float, 'descricao': str, 'preco_formatado': str}}
+        # Abas da pasta de trabalho (Excel) e as escolhidas para carregar
+        self.abas_disponiveis = []
+        self.abas_selecionadas = []
+        
+        # Vários fornecedores: lista de (fornecedor, arquivo, col_descricao, col_preco)
+        # e o catálogo unificado com todas as ofertas. Nesse modo, self.df guarda apenas
+        # a oferta mais barata de cada produto (índice de melhores ofertas)
+        self.fontes_fornecedores = []
+        self.catalogo_fornecedores = None
+        
+        # Monitoramento da planilha: recarrega em segundo plano quando o arquivo muda
+        self.monitorar_arquivo = tk.BooleanVar(value=False)
+        self._arquivo_carregado = None      # (caminho, col_descricao, col_preco, abas, col_codigo) da última carga
+        self._assinatura_arquivo = None     # (data de modificação, tamanho) da última carga
+        self._assinatura_pendente = None    # Mudança vista, aguardando o arquivo estabilizar
+        self._recarga_em_andamento = False
+        self._id_verificacao = None
+        
+        # Sessão: o catálogo gravado no cache (não é regravado ao fechar se não mudou)
+        self._df_em_cache = None
+        
+        # Dicionário para armazenar o preço numérico real (de venda) dos itens selecionados
+        # Estrutura: {iid: {'preco': float, 'centavos': int, 'descricao': str, 'preco_formatado': str,
+        #                   'custo': float, 'categoria': aba ou None}}
+        # O custo e a categoria permitem reprecificar o item sem o catálogo (no externo, o
+        # self.df só tem a página atual)
         self.itens_selecionados_dados = {} 
+        # Total do carrinho em centavos inteiros, atualizado a cada item (soma exata, sem resomar tudo)
+        self.total_centavos = 0
+        # Máscara booleana alinhada às linhas de self.df: True = item no carrinho (fica fora da grade).
+        # None até o primeiro preenchimento da tabela
+        self.no_carrinho = None
+        
+        # Ordenação da grade pelo cabeçalho: (coluna da grade, decrescente) ou None (ordem da planilha).
+        # As permutações ficam em cache por catálogo (recriado quando self.df muda)
+        self.ordenacao = None
+        self._ordens_catalogo = None
+        
+        # Índice de hash dos códigos de produto (montado na carga, recriado quando self.df muda)
+        # e a busca adiada enquanto o leitor de código de barras ainda está digitando
+        self._indice_codigos = None
+        self._id_busca_codigo = None
         
         # --- Configuração de Estilos e Tema ---
         self.style = ttk.Style()
@@ -85,16 +182,78 @@ class App:
         # Componentes que precisam ser referenciados
         self.combo_descricao = None
         self.combo_preco = None
+        self.combo_codigo = None
         self.btn_carregar_dados = None
         self.entry_filtro = None
+        self.entry_preco_min = None
+        self.frame_paginacao = None
+        self.label_pagina = None
+        self.btn_pagina_anterior = None
+        self.btn_pagina_seguinte = None
+        self.entry_preco_max = None
         self.tree_principal = None
         self.tree_selecionados = None
         self.label_imagem = None
         self.frame_miniaturas = None
+        # Faixa de miniaturas: botões criados uma vez e reaproveitados (ver imagem.exibir_miniaturas)
+        self.botoes_miniaturas = []
+        self.miniaturas_visiveis = 0
+        self.descricao_miniaturas = None
+        self.label_cota = None
+        # Atualização periódica do contador de cota enquanto as buscas estão pausadas
+        self._id_contador_cota = None
         self.label_total_valor = None
+        self.label_monitoramento = None
+        self.label_abas = None
+        self.btn_abas = None
+        self.janela_diagnostico = None
         
         # Construir interface
         self.criar_interface()
+        
+        # A janela aparece primeiro; as bibliotecas pesadas e o catálogo do .env (ou a
+        # última sessão) vêm depois. Ao fechar, a sessão é salva
+        self.root.after_idle(self._apos_exibir_janela)
+        self.root.protocol("WM_DELETE_WINDOW", self.ao_fechar)
+
+    @property
+    def df(self):
+        """Catálogo em uso (um DataFrame vazio, criado só quando pedido, até a primeira carga)."""
+        if self._df is None:
+            self._df = pd.DataFrame()
+        return self._df
+
+    @df.setter
+    def df(self, df):
+        self._df = df
+
+    def _apos_exibir_janela(self):
+        """
+        Pré-carrega os módulos pesados em segundo plano e abre o catálogo externo do .env
+        (se houver) ou restaura a última sessão.
+        """
+        precarregar(MODULOS_PRECARREGADOS)
+        
+        url_servidor = os.getenv('CATALOGO_SERVIDOR', '')
+        caminho_sqlite = os.getenv('CATALOGO_SQLITE', '')
+        if url_servidor:
+            self._usar_catalogo_externo(
+                servico_catalogo.ClienteCatalogo(url_servidor, os.getenv('CATALOGO_NOME', '')),
+                f"Servidor {url_servidor}"
+            )
+        elif caminho_sqlite:
+            try:
+                self._usar_catalogo_externo(
+                    catalogo_sqlite.CatalogoSQLite(caminho_sqlite), 
+                    f"Catálogo {os.path.basename(caminho_sqlite)}"
+                )
+            except Exception as e:
+                print(f"Aviso: Não foi possível abrir o catálogo {caminho_sqlite}. Erro: {e}")
+        else:
+            self.restaurar_sessao()
+        
+        # Contador de cota já preenchido antes da primeira busca de imagem
+        imagem.atualizar_contador_cota(self)
     
     # ---------------- Funções de Carregamento ---------------- #
     
@@ -129,8 +288,15 @@ class App:
             self.root.config(cursor="watch")
             self.root.update()
             
-            # Tenta ler os cabeçalhos
-            self.colunas_disponiveis = ler_cabecalhos(caminho)
+            # Lista as abas (Excel); por padrão carrega só a primeira, como antes
+            self.abas_disponiveis = database.listar_abas(caminho)
+            self.abas_selecionadas = self.abas_disponiveis[:1]
+            self._atualizar_label_abas()
+            
+            # Tenta ler os cabeçalhos (da primeira aba escolhida)
+            self.colunas_disponiveis = database.ler_cabecalhos(
+                caminho, self.abas_selecionadas[0] if self.abas_selecionadas else None
+            )
             
             if not self.colunas_disponiveis:
                 messagebox.showwarning(
@@ -143,6 +309,7 @@ class App:
             # Popula os Comboboxes
             self.combo_descricao['values'] = self.colunas_disponiveis
             self.combo_preco['values'] = self.colunas_disponiveis
+            self.combo_codigo['values'] = [self.SEM_CODIGO] + self.colunas_disponiveis
             
             # Tenta pré-selecionar 'Descrição' e 'Preço' (case-insensitive)
             desc_match = next(
@@ -162,6 +329,13 @@ class App:
                 preco_match if preco_match else self.colunas_disponiveis[0]
             )
             
+            # Coluna de código é opcional: só pré-seleciona se o nome for conhecido
+            codigo_match = next(
+                (col for col in self.colunas_disponiveis if col.lower() in self.NOMES_COLUNA_CODIGO), 
+                None
+            )
+            self.nome_coluna_codigo.set(codigo_match if codigo_match else self.SEM_CODIGO)
+            
             # Habilita o botão de carregar dados
             self.btn_carregar_dados.config(state=tk.NORMAL)
 
@@ -181,16 +355,267 @@ class App:
             # Restaura cursor normal
             self.root.config(cursor="")
 
+    def abas_para_carregar(self):
+        """Abas a passar para o carregar_dados (None se o arquivo não tiver várias abas)."""
+        return list(self.abas_selecionadas) if len(self.abas_disponiveis) > 1 else None
+
+    def _atualizar_label_abas(self):
+        """Mostra quantas abas estão escolhidas e habilita o botão quando há mais de uma."""
+        if len(self.abas_disponiveis) > 1:
+            if len(self.abas_selecionadas) == 1:
+                texto = f"{self.abas_selecionadas[0]} (1 de {len(self.abas_disponiveis)})"
+            else:
+                texto = f"{len(self.abas_selecionadas)} de {len(self.abas_disponiveis)} abas"
+            self.label_abas.config(text=texto)
+            self.btn_abas.config(state=tk.NORMAL)
+        else:
+            self.label_abas.config(text="")
+            self.btn_abas.config(state=tk.DISABLED)
+
+    def escolher_abas(self):
+        """
+        Abre a lista de abas da pasta de trabalho para escolher quais carregar.
+        As abas escolhidas precisam ter as mesmas colunas de Descrição e Preço.
+        """
+        janela = tk.Toplevel(self.root)
+        janela.title("Escolher Abas")
+        janela.transient(self.root)
+        
+        tk.Label(janela, text="Abas a carregar (cada uma vira uma categoria):").pack(
+            padx=10, pady=(10, 5), anchor="w"
+        )
+        lista = tk.Listbox(janela, selectmode=tk.MULTIPLE, height=min(15, len(self.abas_disponiveis)))
+        lista.pack(fill=tk.BOTH, expand=True, padx=10)
+        for indice, aba in enumerate(self.abas_disponiveis):
+            lista.insert(tk.END, aba)
+            if aba in self.abas_selecionadas:
+                lista.selection_set(indice)
+        
+        def confirmar():
+            escolhidas = [self.abas_disponiveis[i] for i in lista.curselection()]
+            if not escolhidas:
+                messagebox.showwarning("Aviso", "Escolha ao menos uma aba.", parent=janela)
+                return
+            self.abas_selecionadas = escolhidas
+            self._atualizar_label_abas()
+            janela.destroy()
+        
+        frame_botoes = tk.Frame(janela)
+        frame_botoes.pack(pady=10)
+        ttk.Button(
+            frame_botoes, 
+            text="Todas", 
+            command=lambda: lista.selection_set(0, tk.END)
+        ).grid(row=0, column=0, padx=5)
+        ttk.Button(frame_botoes, text="OK", command=confirmar).grid(row=0, column=1, padx=5)
+
+    def _usar_catalogo_externo(self, catalogo, nome):
+        """
+        Passa a usar um catálogo externo (ClienteCatalogo ou CatalogoSQLite) como fonte das buscas.
+        
+        Args:
+            catalogo: Objeto com o método buscar(filtro, preco_min, preco_max, limite, offset)
+            nome: Texto exibido no título da janela
+        """
+        self.catalogo_externo = catalogo
+        self.nome_catalogo_externo = nome
+        self.catalogo_fornecedores = None
+        
+        # Os ids do catálogo anterior não valem para o novo: limpa o carrinho
+        self._limpar_carrinho()
+        
+        self.limpar_filtro()
+        self._ajustar_colunas_extras()
+
+    def abrir_catalogo(self):
+        """Abre um catálogo SQLite já importado (sem ler a planilha novamente)."""
+        caminho = filedialog.askopenfilename(
+            title="Abrir Catálogo Importado",
+            filetypes=(("Catálogo SQLite", "*.db"), ("Todos os Arquivos", "*.*"))
+        )
+        if not caminho:
+            return
+        
+        try:
+            self._usar_catalogo_externo(
+                catalogo_sqlite.CatalogoSQLite(caminho), f"Catálogo {os.path.basename(caminho)}"
+            )
+        except Exception as e:
+            messagebox.showerror(
+                "Erro ao Abrir Catálogo", 
+                f"Não foi possível abrir o catálogo:\n{str(e)}"
+            )
+
+    def importar_catalogo(self):
+        """
+        Importa a planilha e as colunas selecionadas para um catálogo SQLite
+        e passa a usá-lo. Nas próximas vezes basta abrir o catálogo.
+        """
+        caminho = self.caminho_arquivo.get()
+        descricao_col = self.nome_coluna_descricao.get().strip()
+        preco_col = self.nome_coluna_preco.get().strip()
+        
+        if not caminho or not descricao_col or not preco_col:
+            messagebox.showwarning(
+                "Aviso", 
+                "Selecione o arquivo e as colunas de Descrição e Preço."
+            )
+            return
+        
+        caminho_catalogo = filedialog.asksaveasfilename(
+            defaultextension=".db",
+            initialfile=os.path.splitext(os.path.basename(caminho))[0] + ".db",
+            title="Salvar Catálogo Importado",
+            filetypes=[("Catálogo SQLite", "*.db")]
+        )
+        if not caminho_catalogo:
+            return
+        
+        try:
+            # Mostra cursor de espera
+            self.root.config(cursor="watch")
+            self.root.update()
+            
+            total = catalogo_sqlite.importar_planilha(
+                caminho, descricao_col, preco_col, caminho_catalogo, 
+                self.abas_para_carregar(), self.coluna_codigo()
+            )
+            self._usar_catalogo_externo(
+                catalogo_sqlite.CatalogoSQLite(caminho_catalogo), 
+                f"Catálogo {os.path.basename(caminho_catalogo)}"
+            )
+            messagebox.showinfo(
+                "Sucesso", 
+                f"Catálogo importado com sucesso!\nTotal de {total} linhas."
+            )
+        except Exception as e:
+            messagebox.showerror(
+                "Erro ao Importar Catálogo", 
+                f"Não foi possível importar o catálogo:\n{str(e)}"
+            )
+        finally:
+            # Restaura cursor normal
+            self.root.config(cursor="")
+
+    def carregar_fornecedores(self, fontes):
+        """
+        Carrega as planilhas de vários fornecedores (em paralelo) e exibe, para cada
+        produto, a oferta mais barata e o fornecedor que a oferece.
+        
+        Args:
+            fontes: Lista de (fornecedor, arquivo, col_descricao, col_preco)
+            
+        Returns:
+            bool: True se o catálogo foi carregado
+        """
+        try:
+            # Mostra cursor de espera
+            self.root.config(cursor="watch")
+            self.root.update()
+            
+            catalogo = database.carregar_fornecedores(fontes)
+            self.df = database.melhores_ofertas(catalogo)
+            self.regras_preco.precificar(self.df)
+            self.catalogo_fornecedores = catalogo
+            
+            # O catálogo não vem de um arquivo só: sai do catálogo externo e do monitoramento
+            self._arquivo_carregado = None
+            self.catalogo_externo = None
+            self.root.title(f"Consulta de Preços - {len(fontes)} fornecedor(es)")
+            self._ajustar_colunas_extras()
+            
+            messagebox.showinfo(
+                "Sucesso", 
+                f"{len(fontes)} planilha(s) carregada(s) com sucesso!\n"
+                f"Total de {len(catalogo)} ofertas de {len(self.df)} produtos."
+            )
+            
+            # Limpa dados anteriores e exibe os novos dados
+            self._limpar_carrinho()
+            
+            self.limpar_filtro()
+            return True
+            
+        except Exception as e:
+            messagebox.showerror(
+                "Erro de Carregamento", 
+                f"Não foi possível carregar os fornecedores:\n{str(e)}"
+            )
+            return False
+        finally:
+            # Restaura cursor normal
+            self.root.config(cursor="")
+
+    def _ajustar_colunas_extras(self):
+        """
+        Mostra as colunas Código, Fornecedor e Aba nas duas tabelas apenas quando o catálogo
+        as tiver, e a coluna Custo quando há regras de preço ativas.
+        """
+        colunas = (("Código",) if self.COL_CODIGO in self.df.columns else ()) + ("Descrição", "Preço")
+        colunas += (("Custo",) if self.regras_preco.ativa() else ()) + tuple(
+            coluna for coluna in (self.COL_FORNECEDOR, self.COL_ABA) if coluna in self.df.columns
+        )
+        self.tree_principal.configure(displaycolumns=colunas)
+        self.tree_selecionados.configure(displaycolumns=colunas)
+
     def _resetar_comboboxes(self):
         """Helper para resetar os comboboxes em caso de erro."""
         self.colunas_disponiveis = []
+        self.abas_disponiveis = []
+        self.abas_selecionadas = []
+        if self.label_abas:
+            self._atualizar_label_abas()
         if self.combo_descricao:
             self.combo_descricao['values'] = []
             self.combo_preco['values'] = []
+            self.combo_codigo['values'] = []
         if self.btn_carregar_dados:
             self.btn_carregar_dados.config(state=tk.DISABLED)
         self.nome_coluna_descricao.set("")
         self.nome_coluna_preco.set("")
+        self.nome_coluna_codigo.set("")
+
+    def coluna_codigo(self):
+        """Coluna de código escolhida (None se nenhuma)."""
+        coluna = self.nome_coluna_codigo.get().strip()
+        return coluna if coluna and coluna != self.SEM_CODIGO else None
+
+    def _usar_planilha(self, df, arquivo_carregado, assinatura):
+        """
+        Passa a usar o catálogo lido de uma planilha (carga normal ou restauração da sessão).
+        O carrinho é esvaziado; a tabela fica para quem chamou.
+        
+        Args:
+            df: Catálogo lido pelo carregar_dados
+            arquivo_carregado: (caminho, col_descricao, col_preco, abas, col_codigo)
+            assinatura: Assinatura do arquivo tirada antes da leitura
+        """
+        self.df = df
+        self.regras_preco.precificar(self.df)
+        self._codigos()
+        self._arquivo_carregado = arquivo_carregado
+        self._assinatura_arquivo = assinatura
+        self._assinatura_pendente = None
+        
+        # Carregar uma planilha local sai do catálogo externo e do modo com vários fornecedores
+        if self.catalogo_externo is not None:
+            self.catalogo_externo = None
+            self.root.title("Consulta de Preços")
+        self.catalogo_fornecedores = None
+        self._ajustar_colunas_extras()
+        
+        # Limpa dados anteriores
+        self._limpar_carrinho()
+
+    def _descartar_planilha(self):
+        """
+        Esvazia o catálogo depois de uma carga que falhou. A planilha anterior deixa de
+        valer como carregada (nem o monitoramento nem a sessão devem usá-la).
+        """
+        self.df = pd.DataFrame()
+        self._arquivo_carregado = None
+        self._assinatura_arquivo = None
+        self._df_em_cache = None
 
     def carregar_planilha(self):
         """
@@ -213,39 +638,349 @@ class App:
             self.root.config(cursor="watch")
             self.root.update()
             
-            # Chama a função do database.py com o caminho e os nomes das colunas
-            self.df = carregar_dados(caminho, descricao_col, preco_col)
+            # Assinatura tirada antes da leitura: uma alteração durante a carga não se perde
+            assinatura = self._assinatura(caminho)
+            
+            # Chama a função do database.py com o caminho, os nomes das colunas e as abas
+            abas = self.abas_para_carregar()
+            codigo_col = self.coluna_codigo()
+            df = database.carregar_dados(caminho, descricao_col, preco_col, abas, codigo_col)
+            self._usar_planilha(df, (caminho, descricao_col, preco_col, abas, codigo_col), assinatura)
             
             messagebox.showinfo(
                 "Sucesso", 
                 f"Planilha carregada com sucesso!\nTotal de {len(self.df)} linhas."
             )
             
-            # Limpa dados anteriores e exibe os novos dados
-            self.itens_selecionados_dados.clear()
-            for item in self.tree_selecionados.get_children():
-                self.tree_selecionados.delete(item)
-            self.calcular_total()
-            
             self.limpar_filtro()
             self.atualizar_tabela()
 
         except FileNotFoundError:
             messagebox.showerror("Erro", "Arquivo não encontrado.")
-            self.df = pd.DataFrame()
+            self._descartar_planilha()
         except PermissionError:
             messagebox.showerror("Erro", "Sem permissão para ler o arquivo.")
-            self.df = pd.DataFrame()
+            self._descartar_planilha()
         except Exception as e:
             messagebox.showerror(
                 "Erro de Carregamento", 
                 f"Não foi possível carregar a planilha:\n{str(e)}"
             )
-            self.df = pd.DataFrame()
+            self._descartar_planilha()
+        finally:
+            # Restaura cursor normal
+            self.root.config(cursor="")
+
+    # ---------------- Monitoramento da Planilha ---------------- #
+    
+    @staticmethod
+    def _assinatura(caminho):
+        """Retorna (data de modificação, tamanho) do arquivo, ou None se não for possível ler."""
+        try:
+            estatisticas = os.stat(caminho)
+            return (estatisticas.st_mtime, estatisticas.st_size)
+        except OSError:
+            return None
+
+    def alternar_monitoramento(self):
+        """Liga ou desliga a verificação periódica da planilha carregada."""
+        if self._id_verificacao is not None:
+            self.root.after_cancel(self._id_verificacao)
+            self._id_verificacao = None
+        if self.monitorar_arquivo.get():
+            self._id_verificacao = self.root.after(
+                self.INTERVALO_MONITORAMENTO_MS, self._verificar_arquivo
+            )
+        else:
+            self.label_monitoramento.config(text="")
+
+    def _verificar_arquivo(self):
+        """Verifica se a planilha mudou e, se sim, dispara a recarga em segundo plano."""
+        self._id_verificacao = None
+        if not self.monitorar_arquivo.get():
+            return
+        
+        if (self._arquivo_carregado and self.catalogo_externo is None 
+                and not self._recarga_em_andamento):
+            assinatura = self._assinatura(self._arquivo_carregado[0])
+            if assinatura and assinatura != self._assinatura_arquivo:
+                # Só recarrega quando o arquivo parar de mudar entre duas verificações
+                # (o fornecedor pode estar no meio da gravação)
+                if assinatura == self._assinatura_pendente:
+                    self._iniciar_recarga(assinatura)
+                else:
+                    self._assinatura_pendente = assinatura
+        
+        self._id_verificacao = self.root.after(
+            self.INTERVALO_MONITORAMENTO_MS, self._verificar_arquivo
+        )
+
+    def _iniciar_recarga(self, assinatura):
+        """Relê a planilha e calcula a diferença em uma thread, sem travar a interface."""
+        self._recarga_em_andamento = True
+        self.label_monitoramento.config(text="Planilha alterada, recarregando...")
+        caminho, descricao_col, preco_col, abas, codigo_col = self._arquivo_carregado
+        df_base = self.df
+        
+        def recarregar():
+            try:
+                df_novo = database.carregar_dados(caminho, descricao_col, preco_col, abas, codigo_col)
+                diferenca = database.diferenca_catalogo(df_base, df_novo)
+                self.root.after(0, lambda: self._aplicar_recarga(diferenca, assinatura, df_base))
+            except Exception as e:
+                print(f"Erro ao recarregar a planilha: {e}")
+                
+                def falhou(erro=e):
+                    # Tenta de novo na próxima mudança do arquivo
+                    self._recarga_em_andamento = False
+                    self._assinatura_arquivo = assinatura
+                    self.label_monitoramento.config(text=f"Falha ao recarregar: {erro}")
+                self.root.after(0, falhou)
+        
+        threading.Thread(target=recarregar, daemon=True).start()
+
+    def _aplicar_recarga(self, diferenca, assinatura, df_base):
+        """
+        Aplica à grade e ao carrinho apenas o que mudou na planilha (thread principal).
+        Os itens do carrinho são mantidos, com os preços atualizados.
+        """
+        self._recarga_em_andamento = False
+        if self.df is not df_base:
+            # Outra planilha foi carregada enquanto a recarga acontecia
+            return
+        self._assinatura_arquivo = assinatura
+        self._assinatura_pendente = None
+        
+        # Rótulos novos não podem colidir com itens do carrinho que já saíram do catálogo
+        maior_rotulo = max(
+            [int(self.df.index.max()) if len(self.df) else -1] 
+            + [int(iid) for iid in self.itens_selecionados_dados]
+        )
+        self.df, inseridos = database.aplicar_diferenca(self.df, diferenca, maior_rotulo + 1)
+        self._sincronizar_mascara_carrinho()
+        self._codigos()
+        
+        # Preço de venda recalculado só para as linhas novas e as de custo alterado
+        self.regras_preco.precificar(self.df, diferenca['alterados'].index.append(inseridos.index))
+        vendas = self.df[self.COL_PRECO_VENDA]
+        
+        # 1. Remove da grade os itens que saíram da planilha
+        for rotulo in diferenca['removidos']:
+            if self.tree_principal.exists(str(rotulo)):
+                self.tree_principal.delete(str(rotulo))
+        
+        # Preço alterado com a grade ordenada por preço (ou com faixa de preço): as linhas
+        # mudam de posição ou entram/saem da faixa, então a grade é refeita
+        refazer_grade = len(diferenca['alterados']) and self._grade_depende_de(
+            self.COL_PRECO_VENDA, self.COL_PRECO
+        )
+        
+        # 2. Atualiza os preços alterados na grade e no carrinho
+        for rotulo, custo in diferenca['alterados'].items():
+            iid = str(rotulo)
+            preco = vendas[rotulo]
+            preco_formatado = self._formatar_preco(preco)
+            if not refazer_grade and self.tree_principal.exists(iid):
+                self.tree_principal.set(iid, "Preço", preco_formatado)
+                self.tree_principal.set(iid, "Custo", self._formatar_preco(custo))
+            if iid in self.itens_selecionados_dados:
+                self.itens_selecionados_dados[iid]['custo'] = float(custo)
+                self._atualizar_preco_item(iid, preco)
+                self.tree_selecionados.set(iid, "Custo", self._formatar_preco(custo))
+        
+        # 3. Acrescenta os itens novos que passam no filtro atual (na posição da ordenação)
+        if refazer_grade:
+            self.atualizar_tabela()
+        else:
+            self._inserir_na_tabela(self.df.index.get_indexer(inseridos.index))
+        
+        self._exibir_total()
+        self.label_monitoramento.config(
+            text=f"Atualizada às {time.strftime('%H:%M:%S')}: "
+                 f"{len(inseridos)} novo(s), {len(diferenca['removidos'])} removido(s), "
+                 f"{len(diferenca['alterados'])} preço(s) alterado(s)"
+        )
+
+    # ---------------- Sessão ---------------- #
+    
+    def _estado_sessao(self):
+        """Estado da tela a gravar na sessão (planilha, colunas, filtro, ordenação, regras e carrinho)."""
+        caminho, descricao_col, preco_col, abas, codigo_col = self._arquivo_carregado
+        # As colunas listadas nos comboboxes podem ser de outro arquivo, escolhido e não carregado
+        if self.caminho_arquivo.get() == caminho:
+            disponiveis = list(self.colunas_disponiveis)
+        else:
+            disponiveis = [col for col in (descricao_col, preco_col, codigo_col) if col]
+        regras = self.regras_preco
+        return {
+            'arquivo': caminho,
+            'assinatura': list(self._assinatura_arquivo) if self._assinatura_arquivo else None,
+            'colunas': {
+                'descricao': descricao_col, 
+                'preco': preco_col, 
+                'codigo': codigo_col, 
+                'disponiveis': disponiveis
+            },
+            'abas': abas,
+            'abas_disponiveis': list(self.abas_disponiveis) if abas else [],
+            'filtro': self.entry_filtro.get(),
+            'preco_min': self.entry_preco_min.get(),
+            'preco_max': self.entry_preco_max.get(),
+            'ordenacao': list(self.ordenacao) if self.ordenacao else None,
+            'monitorar': bool(self.monitorar_arquivo.get()),
+            'regras': {
+                'markup': regras.markup, 
+                'imposto': regras.imposto, 
+                'arredondar_90': regras.arredondar_90, 
+                'margens_categoria': regras.margens_categoria
+            },
+            # Na ordem da tabela; a descrição confere o item se a planilha mudar
+            'carrinho': [
+                {'rotulo': int(iid), 'descricao': str(self.itens_selecionados_dados[iid]['descricao'])}
+                for iid in self.tree_selecionados.get_children()
+            ],
+            'cache': sessao.ARQUIVO_CACHE,
+        }
+
+    def salvar_sessao(self):
+        """
+        Grava a sessão para a próxima abertura. O catálogo vai para o cache só se mudou
+        desde a última gravação; sem planilha carregada, a sessão anterior é mantida.
+        """
+        if self.catalogo_externo is not None or self.catalogo_fornecedores is not None:
+            # O catálogo em uso não veio de uma planilha: a sessão anterior não vale mais
+            sessao.apagar_sessao()
+            return
+        if self._arquivo_carregado is None:
+            return
+        if self.df.empty or not {self.COL_DESCRICAO, self.COL_PRECO} <= set(self.df.columns):
+            # Catálogo vazio não vai para o cache (a sessão anterior é mantida)
+            return
+        
+        novo = self.df if self.df is not self._df_em_cache else None
+        sessao.salvar_sessao(self._estado_sessao(), novo)
+        self._df_em_cache = self.df
+
+    def restaurar_sessao(self):
+        """
+        Reabre a planilha, as colunas, o filtro, a ordenação, as regras e o carrinho da
+        última sessão. Se a planilha não mudou, o catálogo vem do cache, sem ser relido.
+        """
+        estado = sessao.carregar_sessao()
+        if not estado:
+            return
+        
+        try:
+            caminho = estado['arquivo']
+            assinatura = self._assinatura(caminho)
+            if assinatura is None:
+                print(f"Aviso: planilha da última sessão não encontrada ({caminho}).")
+                return
+            # Mostra cursor de espera
+            self.root.config(cursor="watch")
+            self.root.update()
+            self._aplicar_sessao(estado, caminho, assinatura)
+        except Exception as e:
+            # Sessão incompleta ou de outro formato: começa do zero, sem meia restauração
+            print(f"Aviso: não foi possível restaurar a sessão: {e}")
+            self._descartar_planilha()
+            self._resetar_comboboxes()
+            self._limpar_carrinho()
+            self.atualizar_tabela()
         finally:
             # Restaura cursor normal
             self.root.config(cursor="")
 
+    def _aplicar_sessao(self, estado, caminho, assinatura):
+        """Passos da restauração da sessão (qualquer erro é tratado por restaurar_sessao)."""
+        self.regras_preco = precificacao.RegrasPreco(**estado['regras'])
+        colunas = estado['colunas']
+        abas = estado['abas']
+        arquivo_carregado = (caminho, colunas['descricao'], colunas['preco'], abas, colunas['codigo'])
+        
+        df = None
+        if estado['cache'] and estado['assinatura'] == list(assinatura):
+            df = sessao.carregar_cache()
+            if df is not None and (df.empty or not {self.COL_DESCRICAO, self.COL_PRECO} <= set(df.columns)):
+                # Cache sem catálogo utilizável: vale a planilha
+                df = None
+        if df is None:
+            # A planilha mudou desde a última sessão (ou o cache se perdeu): lê de novo
+            df = database.carregar_dados(*arquivo_carregado)
+            origem = "planilha relida"
+        else:
+            origem = "sem reler a planilha"
+        self._usar_planilha(df, arquivo_carregado, assinatura)
+        self._df_em_cache = df if origem == "sem reler a planilha" else None
+        
+        # Tela como estava: arquivo, colunas e abas
+        self.caminho_arquivo.set(caminho)
+        self.colunas_disponiveis = colunas['disponiveis']
+        self.combo_descricao['values'] = self.colunas_disponiveis
+        self.combo_preco['values'] = self.colunas_disponiveis
+        self.combo_codigo['values'] = [self.SEM_CODIGO] + self.colunas_disponiveis
+        self.nome_coluna_descricao.set(colunas['descricao'])
+        self.nome_coluna_preco.set(colunas['preco'])
+        self.nome_coluna_codigo.set(colunas['codigo'] or self.SEM_CODIGO)
+        self.abas_disponiveis = estado['abas_disponiveis']
+        self.abas_selecionadas = abas or self.abas_disponiveis[:1]
+        self._atualizar_label_abas()
+        self.btn_carregar_dados.config(state=tk.NORMAL)
+        
+        # Carrinho (antes de preencher a tabela, que já sai sem esses itens)
+        rotulos = self._rotulos_do_carrinho(estado['carrinho'])
+        self._adicionar_ao_carrinho([str(rotulo) for rotulo in rotulos], da_tabela=False)
+        
+        # Filtro, faixa de preço e ordenação
+        for entrada, texto in (
+            (self.entry_filtro, estado['filtro']), 
+            (self.entry_preco_min, estado['preco_min']), 
+            (self.entry_preco_max, estado['preco_max'])
+        ):
+            entrada.delete(0, tk.END)
+            entrada.insert(0, texto)
+        self.ordenacao = tuple(estado['ordenacao']) if estado['ordenacao'] else None
+        self._marcar_ordenacao()
+        self.atualizar_tabela()
+        
+        self.monitorar_arquivo.set(estado['monitorar'])
+        self.alternar_monitoramento()
+        
+        perdidos = len(estado['carrinho']) - len(rotulos)
+        self.label_monitoramento.config(
+            text=f"Sessão anterior restaurada ({origem}): {len(rotulos)} item(ns) no carrinho"
+                 + (f", {perdidos} não encontrado(s) na planilha" if perdidos else "")
+        )
+
+    def _rotulos_do_carrinho(self, itens):
+        """
+        Rótulos do self.df dos itens salvos no carrinho: o mesmo rótulo, se a descrição
+        confere; senão, a primeira linha com a mesma descrição (a planilha mudou).
+        Itens que saíram da planilha ficam de fora.
+        """
+        descricoes = self.df[self.COL_DESCRICAO]
+        por_descricao = None
+        rotulos = []
+        for item in itens:
+            rotulo = item['rotulo']
+            if not (rotulo in self.df.index and str(descricoes.at[rotulo]) == item['descricao']):
+                if por_descricao is None:
+                    # Primeira ocorrência de cada descrição (montado só se algum item mudou de lugar)
+                    por_descricao = dict(zip(descricoes[::-1].astype(str), self.df.index[::-1]))
+                rotulo = por_descricao.get(item['descricao'])
+            if rotulo is not None and rotulo not in rotulos:
+                rotulos.append(rotulo)
+        return rotulos
+
+    def ao_fechar(self):
+        """Salva a sessão e fecha a janela."""
+        try:
+            self.salvar_sessao()
+        except Exception as e:
+            # Um problema na sessão não pode impedir o programa de fechar
+            print(f"Aviso: não foi possível salvar a sessão: {e}")
+        self.root.destroy()
+
     # ---------------- Funções principais ---------------- #
     
     def atualizar_tabela(self, *_):
@@ -253,6 +988,16 @@ class App:
         Atualiza a tabela principal com os dados do DataFrame.
         Aplica o filtro de busca se houver texto no campo de filtro.
         """
+        with medir('atualizar_tabela'):
+            self._preencher_tabela()
+
+    def _preencher_tabela(self):
+        """Limpa e repopula a tabela principal (corpo do atualizar_tabela)."""
+        # Catálogo externo: a consulta já devolve as linhas filtradas (uma página delas)
+        if self.catalogo_externo is not None:
+            self._buscar_no_catalogo_externo()
+        self._atualizar_paginacao()
+        
         # Proteção: Se o DataFrame estiver vazio, limpa o grid e sai
         if self.df.empty:
             for item in self.tree_principal.get_children():
@@ -263,42 +1008,108 @@ class App:
         for item in self.tree_principal.get_children():
             self.tree_principal.delete(item)
 
-        # Aplica o filtro
-        filtro = self.entry_filtro.get().lower().strip()
-        df_filtrado = self.df
-
-        if filtro:
-            # Filtro fuzzy (busca por palavras soltas na ordem)
-            pattern = '.*'.join(map(re.escape, filtro.split()))
-            df_filtrado = self.df[
-                self.df[self.COL_DESCRICAO].str.contains(pattern, case=False, na=False)
-            ]
-
-        # Popula a tabela com os dados filtrados
-        for index, row in df_filtrado.iterrows():
-            # Obtém o preço numérico
-            preco_num = row[self.COL_PRECO]
-            
-            # Formatação segura do preço para exibição
-            preco_formatado = self._formatar_preco(preco_num)
-            
-            # Verifica se o item já foi selecionado (não adiciona novamente)
-            if str(index) not in self.itens_selecionados_dados:
-                self.tree_principal.insert(
-                    '', 'end', 
-                    iid=str(index),
-                    values=(row[self.COL_DESCRICAO], preco_formatado)
-                )
+        # Aplica o filtro fuzzy (busca por palavras soltas na ordem) e a faixa de preço,
+        # já sem os itens do carrinho, e depois a ordenação escolhida no cabeçalho
+        if self.no_carrinho is None or len(self.no_carrinho) != len(self.df):
+            self._sincronizar_mascara_carrinho()
+        df_filtrado = self.df.iloc[self._ordenar(self._filtrar_posicoes())]
+
+        # Popula a tabela com os dados filtrados (uma passada sobre as colunas)
+        for index, valores in zip(df_filtrado.index, self._valores_linhas(df_filtrado)):
+            self.tree_principal.insert('', 'end', iid=str(index), values=valores)
 
-        # Ajuste de largura da coluna de descrição
+        # Ajuste de largura da coluna de descrição (maior texto, calculado de forma vetorizada)
         if not df_filtrado.empty:
-            max_len = max(
-                (len(str(r[self.COL_DESCRICAO])) for _, r in df_filtrado.iterrows()), 
-                default=10
-            )
-            largura = min(500, max(200, max_len * 10))
+            max_len = df_filtrado[self.COL_DESCRICAO].astype(str).str.len().max()
+            largura = min(500, max(200, int(max_len) * 10))
             self.tree_principal.column("Descrição", anchor='w', width=largura)
 
+    def _valores_linhas(self, df):
+        """
+        Valores das linhas do catálogo para as tabelas (Descrição, Preço de venda, Fornecedor,
+        Aba, Custo, Código), lidos coluna a coluna com zip, sem montar uma Series por linha.
+        """
+        vazios = [''] * len(df)
+        
+        def coluna(nome):
+            return df[nome] if nome in df.columns else vazios
+        
+        vendas = df[self.COL_PRECO_VENDA] if self.COL_PRECO_VENDA in df.columns else df[self.COL_PRECO]
+        codigos = coluna(self.COL_CODIGO)
+        if self.COL_CODIGO in df.columns:
+            codigos = codigos.astype(object).where(codigos.notna(), '')
+        return zip(
+            df[self.COL_DESCRICAO], 
+            map(self._formatar_preco, vendas), 
+            coluna(self.COL_FORNECEDOR), 
+            coluna(self.COL_ABA), 
+            map(self._formatar_preco, df[self.COL_PRECO]), 
+            codigos
+        )
+
+    def _buscar_no_catalogo_externo(self):
+        """
+        Consulta o catálogo externo (serviço ou SQLite) com o filtro atual.
+        Nesse modo, self.df guarda apenas a página de resultados recebida.
+        """
+        try:
+            # A faixa do catálogo externo é sobre o custo: só vale para ele quando venda = custo
+            preco_min, preco_max = self._faixa_preco() if not self.regras_preco.ativa() else (None, None)
+            consulta = (self.entry_filtro.get(), preco_min, preco_max)
+            if consulta != self._consulta_externa:
+                # Busca nova: volta à primeira página
+                self.offset_externo = 0
+                self._consulta_externa = consulta
+            self.df, self.total_externo = self.catalogo_externo.buscar(
+                *consulta, limite=self.TAMANHO_PAGINA_EXTERNA, offset=self.offset_externo
+            )
+            self.regras_preco.precificar(self.df)
+            self._sincronizar_mascara_carrinho()
+            self.root.title(
+                f"Consulta de Preços - {self.nome_catalogo_externo} "
+                f"({len(self.df)} de {self.total_externo} itens)"
+            )
+        except Exception as e:
+            # Não abre diálogo: a consulta é disparada a cada tecla
+            print(f"Erro ao consultar o catálogo: {e}")
+            self.df = pd.DataFrame()
+            self.total_externo = 0
+            self._consulta_externa = None
+            self.root.title(f"Consulta de Preços - {self.nome_catalogo_externo} indisponível")
+
+    def _atualizar_paginacao(self):
+        """Mostra a página atual do catálogo externo e habilita Anterior/Próxima (fora dele, esconde)."""
+        if self.frame_paginacao is None:
+            return
+        if self.catalogo_externo is None:
+            self.frame_paginacao.grid_remove()
+            return
+        self.frame_paginacao.grid()
+        if self.total_externo:
+            inicio = self.offset_externo + 1
+            fim = min(self.offset_externo + self.TAMANHO_PAGINA_EXTERNA, self.total_externo)
+            self.label_pagina.config(text=f"{inicio}–{fim} de {self.total_externo}")
+        else:
+            self.label_pagina.config(text="Nenhum resultado")
+        self.btn_pagina_anterior.config(state=tk.NORMAL if self.offset_externo > 0 else tk.DISABLED)
+        proxima = self.offset_externo + self.TAMANHO_PAGINA_EXTERNA < self.total_externo
+        self.btn_pagina_seguinte.config(state=tk.NORMAL if proxima else tk.DISABLED)
+
+    def mudar_pagina(self, sentido):
+        """
+        Vai para a página anterior (-1) ou seguinte (+1) dos resultados do catálogo externo.
+        Os itens já no carrinho continuam nele.
+        """
+        if self.catalogo_externo is None:
+            return
+        offset = self.offset_externo + sentido * self.TAMANHO_PAGINA_EXTERNA
+        if offset < 0 or offset >= self.total_externo:
+            return
+        self.offset_externo = offset
+        self.atualizar_tabela()
+        if self.tree_principal.get_children():
+            self.tree_principal.see(self.tree_principal.get_children()[0])
+
     def _formatar_preco(self, preco_num):
         """
         Formata o preço para o padrão brasileiro (R$ X.XXX,XX).
@@ -337,49 +1148,88 @@ class App:
         Adiciona os itens selecionados da tabela principal para a tabela de selecionados.
         Remove da tabela principal para evitar duplicação e atualiza o total.
         """
-        selecionados = self.tree_principal.selection()
+        self._adicionar_ao_carrinho(self.tree_principal.selection())
+
+    def adicionar_todos(self):
+        """Adiciona ao carrinho todos os itens exibidos na tabela principal (resultado do filtro)."""
+        self._adicionar_ao_carrinho(self.tree_principal.get_children())
+
+    def _adicionar_ao_carrinho(self, item_ids, da_tabela=True):
+        """
+        Move os itens informados (iids da tabela principal) para o carrinho em lote.
         
-        if not selecionados:
+        Os preços são lidos do DataFrame de uma vez (sem um df.loc por item), a tabela
+        principal é atualizada com uma única exclusão e o total recebe a soma dos
+        centavos dos itens novos.
+        
+        Args:
+            item_ids: iids (rótulos do self.df em texto)
+            da_tabela: Se os itens estão na tabela principal (False ao restaurar a sessão,
+                antes de a tabela ser preenchida)
+        """
+        item_ids = [iid for iid in item_ids if iid not in self.itens_selecionados_dados]
+        if not item_ids or self.df.empty:
             return
         
-        for item_id in selecionados:
-            valores = self.tree_principal.item(item_id, 'values')
-            
-            if not valores or len(valores) < 2:
-                continue
+        # Posição de cada item no DataFrame (-1 se não estiver mais no catálogo)
+        try:
+            posicoes = self.df.index.get_indexer([int(iid) for iid in item_ids])
+        except ValueError as e:
+            print(f"Erro ao adicionar itens: {e}")
+            return
+        encontrados = posicoes >= 0
+        item_ids = [iid for iid, ok in zip(item_ids, encontrados) if ok]
+        self.no_carrinho[posicoes[encontrados]] = True
+        
+        # Preço inválido conta como zero, como no cálculo item a item
+        precos = pd.to_numeric(
+            self.df[self.COL_PRECO_VENDA].iloc[posicoes[encontrados]], errors='coerce'
+        ).fillna(0.0).to_numpy(dtype=float)
+        centavos = np.round(precos * 100).astype(np.int64)
+        custos = pd.to_numeric(
+            self.df[self.COL_PRECO].iloc[posicoes[encontrados]], errors='coerce'
+        ).fillna(0.0).to_numpy(dtype=float)
+        
+        selecionados = self.df.iloc[posicoes[encontrados]]
+        categorias = (
+            selecionados[self.COL_ABA] if self.COL_ABA in selecionados.columns 
+            else [None] * len(selecionados)
+        )
+        for item_id, preco, preco_centavos, custo, categoria, valores in zip(
+            item_ids, precos, centavos, custos, categorias, self._valores_linhas(selecionados)
+        ):
+            # Insere na tabela de selecionados
+            self.tree_selecionados.insert('', 'end', iid=item_id, values=valores)
             
-            # Pega o preço numérico do DataFrame original
-            try:
-                index_df = int(item_id)
-                if index_df not in self.df.index:
-                    continue
-                    
-                preco_num = self.df.loc[index_df, self.COL_PRECO]
-                
-                # Converte para float de forma segura
-                try:
-                    preco_float = float(preco_num) if pd.notna(preco_num) else 0.0
-                except (ValueError, TypeError):
-                    preco_float = 0.0
-                
-                # Insere na tabela de selecionados
-                self.tree_selecionados.insert('', 'end', iid=item_id, values=valores)
-                
-                # Salva os dados completos do item
-                self.itens_selecionados_dados[item_id] = {
-                    'preco': preco_float,
-                    'descricao': valores[0],
-                    'preco_formatado': valores[1]
-                }
-                
-                # Remove da tabela principal
-                self.tree_principal.delete(item_id)
-                
-            except (ValueError, KeyError, IndexError) as e:
-                print(f"Erro ao adicionar item {item_id}: {e}")
-                continue
+            # Salva os dados completos do item
+            self.itens_selecionados_dados[item_id] = {
+                'preco': float(preco),
+                'centavos': int(preco_centavos),
+                'descricao': valores[0],
+                'preco_formatado': valores[1],
+                'custo': float(custo),
+                'categoria': categoria
+            }
         
-        self.calcular_total()
+        # Remove da tabela principal (uma chamada só)
+        if item_ids and da_tabela:
+            self.tree_principal.delete(*item_ids)
+        
+        self.total_centavos += int(centavos.sum())
+        self._exibir_total()
+        
+        # O PDF com imagens usa as do cache: busca as que faltam em segundo plano
+        if item_ids and self.incluir_miniaturas_pdf.get():
+            imagem.antecipar_imagens(
+                self, [str(self.itens_selecionados_dados[iid]['descricao']) for iid in item_ids]
+            )
+
+    def _antecipar_imagens_carrinho(self):
+        """Ao marcar 'Incluir imagens', busca em segundo plano as imagens que faltam aos itens do carrinho."""
+        if self.incluir_miniaturas_pdf.get() and self.itens_selecionados_dados:
+            imagem.antecipar_imagens(
+                self, [str(item['descricao']) for item in self.itens_selecionados_dados.values()]
+            )
 
     def remover_selecionado(self, *_):
         """
@@ -391,46 +1241,318 @@ class App:
         if not selecionados:
             return
         
+        # Remove do dicionário de dados (e o valor do total)
         for item_id in selecionados:
-            valores = self.tree_selecionados.item(item_id, 'values')
-            
-            # Remove do dicionário de dados
             if item_id in self.itens_selecionados_dados:
-                del self.itens_selecionados_dados[item_id]
+                self.total_centavos -= self.itens_selecionados_dados.pop(item_id)['centavos']
+        
+        # Remove da tabela de selecionados
+        self.tree_selecionados.delete(*selecionados)
+        
+        self._devolver_a_tabela(selecionados)
+        self._exibir_total()
 
-            # Reinsere na tabela principal se o item existir no DF
-            try:
-                original_index = int(item_id)
-                if original_index in self.df.index:
-                    # Verifica se passa pelo filtro atual
-                    filtro = self.entry_filtro.get().lower().strip()
-                    descricao = self.df.loc[original_index, self.COL_DESCRICAO]
-                    
-                    if not filtro or filtro.lower() in str(descricao).lower():
-                        self.tree_principal.insert('', 'end', iid=item_id, values=valores)
-                        
-            except (ValueError, KeyError):
-                pass
-            
-            # Remove da tabela de selecionados
-            self.tree_selecionados.delete(item_id)
+    def _devolver_a_tabela(self, item_ids):
+        """
+        Tira os itens da máscara do carrinho e os reinsere na tabela principal, na
+        posição da ordenação atual, se passarem no filtro (o mesmo do atualizar_tabela).
+        """
+        try:
+            posicoes = self.df.index.get_indexer([int(iid) for iid in item_ids])
+        except ValueError:
+            return
+        # Itens que já saíram do catálogo não voltam para a grade
+        posicoes = posicoes[posicoes >= 0]
+        if not len(posicoes):
+            return
+        self.no_carrinho[posicoes] = False
+        self._inserir_na_tabela(posicoes)
+
+    def _inserir_na_tabela(self, posicoes):
+        """
+        Insere na tabela principal as linhas (posições do self.df) que passam nos filtros,
+        cada uma no lugar que ocuparia na ordenação atual, sem repopular a grade.
+        """
+        posicoes = self._ordenar(self._filtrar_posicoes(np.asarray(posicoes, dtype=np.int64)))
+        if not len(posicoes):
+            return
         
+        # A grade está na ordem de exibição: o destino de cada linha é a quantidade de
+        # linhas exibidas que vêm antes dela (+ as já inseridas antes desta)
+        posto = self._posto_exibicao()
+        exibidas = self.df.index.get_indexer([int(iid) for iid in self.tree_principal.get_children()])
+        chaves_exibidas = np.sort(posto[exibidas]) if posto is not None else np.sort(exibidas)
+        chaves = posto[posicoes] if posto is not None else posicoes
+        destinos = np.searchsorted(chaves_exibidas, chaves) + np.arange(len(posicoes))
+        
+        inseridas = self.df.iloc[posicoes]
+        for destino, index, valores in zip(destinos, inseridas.index, self._valores_linhas(inseridas)):
+            self.tree_principal.insert('', int(destino), iid=str(index), values=valores)
+
+    # ---------------- Filtro, Faixa de Preço e Ordenação ---------------- #
+    
+    def _ordens(self):
+        """Cache de permutações de ordenação do catálogo atual (recriado quando o self.df muda)."""
+        if self._ordens_catalogo is None or self._ordens_catalogo.df is not self.df:
+            self._ordens_catalogo = database.OrdensCatalogo(self.df)
+        return self._ordens_catalogo
+
+    def _codigos(self):
+        """Índice de hash dos códigos do catálogo atual (recriado quando o self.df muda)."""
+        if self._indice_codigos is None or self._indice_codigos.df is not self.df:
+            self._indice_codigos = database.IndiceCodigos(self.df, self.COL_CODIGO)
+        return self._indice_codigos
+
+    def _ao_digitar_filtro(self, event=None):
+        """
+        Atualiza a tabela a cada tecla no filtro. Quando o texto parece um código, a busca
+        espera uma pausa entre as teclas: o leitor de código de barras digita o código
+        inteiro em poucos milissegundos e a tabela é atualizada uma vez só, com o código completo.
+        """
+        if event is not None and event.keysym in ('Return', 'KP_Enter'):
+            return
+        if self._id_busca_codigo is not None:
+            self.root.after_cancel(self._id_busca_codigo)
+            self._id_busca_codigo = None
+        if len(self._codigos()) and database.parece_codigo(self.entry_filtro.get()):
+            self._id_busca_codigo = self.root.after(self.INTERVALO_LEITOR_MS, self._buscar_codigo_digitado)
+        else:
+            self.atualizar_tabela()
+
+    def _buscar_codigo_digitado(self, *_):
+        """
+        Busca imediata (Enter, enviado pelo leitor ao fim de cada leitura): seleciona o
+        produto encontrado e deixa o texto do filtro selecionado, para a próxima leitura substituí-lo.
+        """
+        if self._id_busca_codigo is not None:
+            self.root.after_cancel(self._id_busca_codigo)
+            self._id_busca_codigo = None
+        self.atualizar_tabela()
+        
+        if self._codigos().buscar(self.entry_filtro.get()) is not None:
+            encontrados = self.tree_principal.get_children()
+            if encontrados:
+                self.tree_principal.selection_set(encontrados)
+                self.tree_principal.see(encontrados[0])
+            self.entry_filtro.select_range(0, tk.END)
+
+    @staticmethod
+    def _ler_valor(texto):
+        """Converte o valor digitado ('1.234,50' ou '1234.5') em float; vazio ou inválido vale None."""
+        texto = texto.strip().replace('R$', '').strip()
+        if ',' in texto:
+            texto = texto.replace('.', '').replace(',', '.')
+        try:
+            return float(texto) if texto else None
+        except ValueError:
+            return None
+
+    def _faixa_preco(self):
+        """Faixa de preço digitada no filtro: (mínimo, máximo), com None para limite em aberto."""
+        return self._ler_valor(self.entry_preco_min.get()), self._ler_valor(self.entry_preco_max.get())
+
+    def _filtrar_posicoes(self, posicoes=None):
+        """
+        Posições do self.df (todas, ou só as informadas) que passam no filtro de texto e
+        na faixa de preço e que não estão no carrinho.
+        """
+        if posicoes is None:
+            df = self.df
+            excluir = self.no_carrinho.copy()
+        else:
+            df = self.df.iloc[posicoes]
+            excluir = self.no_carrinho[posicoes]
+        
+        # Faixa de preço (de venda): busca binária sobre os preços ordenados
+        preco_min, preco_max = self._faixa_preco()
+        if preco_min is not None or preco_max is not None:
+            faixa = self._ordens().mascara_faixa(self.COL_PRECO_VENDA, preco_min, preco_max)
+            excluir |= ~(faixa if posicoes is None else faixa[posicoes])
+        
+        # No catálogo externo o filtro de texto já foi aplicado pela consulta
+        filtro = self.entry_filtro.get() if self.catalogo_externo is None else ''
+        
+        # Código exato (EAN/SKU): busca no índice de hash, sem varrer as descrições
+        encontrados = self._codigos().buscar(filtro) if filtro else None
+        if encontrados is not None:
+            fora = np.ones(len(self.df), dtype=bool)
+            fora[encontrados] = False
+            excluir |= fora if posicoes is None else fora[posicoes]
+            filtro = ''
+        
+        mascara = database.mascara_filtro(df, filtro, self.COL_DESCRICAO, excluir=excluir)
+        if posicoes is None:
+            return np.arange(len(df)) if mascara is None else np.flatnonzero(mascara)
+        return posicoes if mascara is None else posicoes[mascara]
+
+    def _coluna_ordenacao(self):
+        """Coluna do DataFrame correspondente à coluna da grade escolhida para ordenar."""
+        coluna = {
+            "Descrição": self.COL_DESCRICAO, 
+            "Preço": self.COL_PRECO_VENDA, 
+            "Custo": self.COL_PRECO, 
+            "Fornecedor": self.COL_FORNECEDOR, 
+            "Aba": self.COL_ABA, 
+            "Código": self.COL_CODIGO
+        }[self.ordenacao[0]]
+        return coluna if coluna in self.df.columns else None
+
+    def _ordenar(self, posicoes):
+        """Coloca as posições na ordem escolhida no cabeçalho (coleta sobre a ordem em cache)."""
+        if self.ordenacao is None or self._coluna_ordenacao() is None:
+            return np.sort(posicoes)
+        return self._ordens().ordenar(posicoes, self._coluna_ordenacao(), self.ordenacao[1])
+
+    def _posto_exibicao(self):
+        """Posição de exibição de cada linha do self.df na ordenação atual (None = ordem da planilha)."""
+        if self.ordenacao is None or self._coluna_ordenacao() is None:
+            return None
+        return self._ordens().posto(self._coluna_ordenacao(), self.ordenacao[1])
+
+    def ordenar_por(self, coluna):
+        """
+        Ordena a grade pela coluna clicada no cabeçalho; clicar de novo inverte o sentido.
+        
+        Args:
+            coluna: Nome da coluna da grade
+        """
+        if self.ordenacao is not None and self.ordenacao[0] == coluna:
+            self.ordenacao = (coluna, not self.ordenacao[1])
+        else:
+            self.ordenacao = (coluna, False)
+        
+        self._marcar_ordenacao()
+        self.atualizar_tabela()
+
+    def _marcar_ordenacao(self):
+        """Indica a coluna e o sentido da ordenação no cabeçalho."""
+        for nome, titulo in self.TITULOS_COLUNAS.items():
+            if self.ordenacao is not None and nome == self.ordenacao[0]:
+                titulo += " ▼" if self.ordenacao[1] else " ▲"
+            self.tree_principal.heading(nome, text=titulo)
+
+    def remover_todos(self):
+        """Esvazia o carrinho e devolve os itens à tabela principal."""
+        if not self.itens_selecionados_dados:
+            return
+        if not messagebox.askyesno(
+            "Remover Todos", 
+            f"Remover os {len(self.itens_selecionados_dados)} itens da lista de selecionados?"
+        ):
+            return
+        
+        self._limpar_carrinho()
+        self.atualizar_tabela()
+
+    def _limpar_carrinho(self):
+        """Esvazia o carrinho (dados, tabela, máscara e total) de uma vez."""
+        self.itens_selecionados_dados.clear()
+        self.no_carrinho = np.zeros(len(self.df), dtype=bool)
+        self.tree_selecionados.delete(*self.tree_selecionados.get_children())
+        self.total_centavos = 0
+        self._exibir_total()
+
+    def aplicar_regras_preco(self, rotulos=None):
+        """
+        Recalcula o preço de venda e atualiza a grade, o carrinho e o total.
+        
+        Args:
+            rotulos: Rótulos já recalculados pelas regras (ex.: mudança de margem de uma
+                categoria). Se None, recalcula o catálogo inteiro (mudança de regra geral).
+        """
+        # Os preços de venda mudaram: a ordem por preço precisa ser recalculada
+        self._ordens().descartar(self.COL_PRECO_VENDA)
+        
+        if rotulos is None:
+            self.regras_preco.precificar(self.df)
+            vendas = self.df[self.COL_PRECO_VENDA] if not self.df.empty else pd.Series(dtype=float)
+        else:
+            vendas = self.df.loc[rotulos, self.COL_PRECO_VENDA]
+        
+        # Ordenada por preço ou com faixa de preço, a grade é refeita (ordem e linhas mudam);
+        # senão, basta trocar os preços das linhas exibidas
+        refazer_grade = self._grade_depende_de(self.COL_PRECO_VENDA)
+        if not vendas.empty and not refazer_grade:
+            for iid in self.tree_principal.get_children():
+                preco = vendas.get(int(iid))
+                if preco is not None:
+                    self.tree_principal.set(iid, "Preço", self._formatar_preco(preco))
+        
+        # O carrinho é reprecificado pelo custo guardado em cada item (não pelo self.df)
+        self._reprecificar_carrinho()
+        self._ajustar_colunas_extras()
+        if refazer_grade:
+            self.atualizar_tabela()
+
+    def _grade_depende_de(self, *colunas):
+        """
+        Indica se a ordenação ou a faixa de preço (sobre o preço de venda) da grade usam
+        alguma das colunas: nesse caso, uma mudança nelas exige refazer a grade.
+        """
+        preco_min, preco_max = self._faixa_preco()
+        if self.COL_PRECO_VENDA in colunas and (preco_min is not None or preco_max is not None):
+            return True
+        return bool(self.ordenacao) and self._coluna_ordenacao() in colunas
+
+    def _sincronizar_mascara_carrinho(self):
+        """Recria a máscara do carrinho para o self.df atual (após trocar ou alterar o catálogo)."""
+        if self.itens_selecionados_dados:
+            self.no_carrinho = self.df.index.isin([int(iid) for iid in self.itens_selecionados_dados])
+        else:
+            self.no_carrinho = np.zeros(len(self.df), dtype=bool)
+
+    def _reprecificar_carrinho(self):
+        """
+        Recalcula o preço de venda de todos os itens do carrinho a partir do custo e da
+        categoria guardados em cada item (vale também para os itens de outras páginas do
+        catálogo externo) e refaz o total em centavos.
+        """
+        if self.itens_selecionados_dados:
+            iids = list(self.itens_selecionados_dados)
+            itens = [self.itens_selecionados_dados[iid] for iid in iids]
+            carrinho = pd.DataFrame({
+                self.COL_PRECO: [item['custo'] for item in itens],
+                self.COL_ABA: [item['categoria'] for item in itens],
+            })
+            self.regras_preco.precificar(carrinho)
+            for iid, preco in zip(iids, carrinho[self.COL_PRECO_VENDA]):
+                self._atualizar_preco_item(iid, preco)
         self.calcular_total()
 
+    def _atualizar_preco_item(self, iid, preco):
+        """Troca o preço de um item do carrinho, ajustando o total pela diferença em centavos."""
+        item = self.itens_selecionados_dados[iid]
+        centavos = int(round(float(preco) * 100))
+        self.total_centavos += centavos - item['centavos']
+        item['preco'] = float(preco)
+        item['centavos'] = centavos
+        item['preco_formatado'] = self._formatar_preco(preco)
+        self.tree_selecionados.set(iid, "Preço", item['preco_formatado'])
+
     def limpar_filtro(self):
-        """Limpa o campo de filtro e atualiza a tabela."""
+        """Limpa o campo de filtro e a faixa de preço e atualiza a tabela."""
         self.entry_filtro.delete(0, tk.END)
+        self.entry_preco_min.delete(0, tk.END)
+        self.entry_preco_max.delete(0, tk.END)
         self.atualizar_tabela()
 
     def calcular_total(self):
-        """Calcula e exibe o total dos itens selecionados."""
-        total = sum(
-            item['preco'] 
+        """
+        Recalcula do zero e exibe o total dos itens selecionados.
+        
+        As operações do carrinho já mantêm o total em dia (self.total_centavos);
+        este recálculo completo serve para ressincronizar depois de mudanças externas.
+        """
+        self.total_centavos = sum(
+            item['centavos'] 
             for item in self.itens_selecionados_dados.values()
         )
-        
-        # Formatação do total
-        total_formatado = self._formatar_preco(total)
+        self._exibir_total()
+
+    def _exibir_total(self):
+        """Exibe o total acumulado do carrinho."""
+        # Formatação do total (centavos inteiros -> reais só na exibição)
+        total_formatado = self._formatar_preco(self.total_centavos / 100)
         self.label_total_valor.config(text=total_formatado)
 
     # ---------------- Função Google ---------------- #
@@ -523,6 +1645,48 @@ class App:
         )
         self.btn_carregar_dados.grid(row=0, column=2, padx=(5, 0))
 
+        # Monitoramento da planilha carregada
+        frame_monitoramento = tk.Frame(frame_carregamento)
+        frame_monitoramento.grid(row=1, column=0, pady=(5, 0), sticky="w")
+        
+        tk.Checkbutton(
+            frame_monitoramento, 
+            text="Monitorar arquivo", 
+            variable=self.monitorar_arquivo, 
+            command=self.alternar_monitoramento
+        ).grid(row=0, column=0)
+        
+        self.label_monitoramento = tk.Label(frame_monitoramento, text="", fg="gray")
+        self.label_monitoramento.grid(row=0, column=1, padx=(5, 0))
+
+        # Catálogo SQLite: importar a planilha uma vez e reabrir instantaneamente
+        frame_catalogo = tk.Frame(frame_carregamento)
+        frame_catalogo.grid(row=1, column=1, columnspan=2, pady=(5, 0), sticky="e")
+        
+        ttk.Button(
+            frame_catalogo, 
+            text="Importar p/ Catálogo", 
+            command=self.importar_catalogo
+        ).grid(row=0, column=0, padx=5)
+        
+        ttk.Button(
+            frame_catalogo, 
+            text="Abrir Catálogo", 
+            command=self.abrir_catalogo
+        ).grid(row=0, column=1, padx=5)
+        
+        ttk.Button(
+            frame_catalogo, 
+            text="Comparar Versões...", 
+            command=lambda: comparacao.abrir_comparacao(self)
+        ).grid(row=0, column=2, padx=5)
+        
+        ttk.Button(
+            frame_catalogo, 
+            text="Vários Fornecedores...", 
+            command=lambda: fornecedores.abrir_fornecedores(self)
+        ).grid(row=0, column=3, padx=(5, 0))
+
         # --- FRAME SELEÇÃO DAS COLUNAS ---
         frame_colunas = tk.Frame(content_frame)
         frame_colunas.grid(row=1, column=0, pady=(5, 10), sticky="ew")
@@ -549,6 +1713,32 @@ class App:
         )
         self.combo_preco.grid(row=0, column=3, sticky="ew", padx=(5, 0))
 
+        # Abas da pasta de trabalho (habilitado quando o Excel tem mais de uma)
+        tk.Label(frame_colunas, text="Abas:").grid(
+            row=1, column=0, sticky="w", padx=(0, 5), pady=(5, 0)
+        )
+        self.label_abas = tk.Label(frame_colunas, text="", fg="gray")
+        self.label_abas.grid(row=1, column=1, sticky="w", padx=5, pady=(5, 0))
+        
+        self.btn_abas = ttk.Button(
+            frame_colunas, 
+            text="Escolher Abas...", 
+            command=self.escolher_abas, 
+            state=tk.DISABLED
+        )
+        self.btn_abas.grid(row=1, column=2, sticky="w", padx=(15, 5), pady=(5, 0))
+
+        # Código do produto (EAN/SKU): opcional, permite a busca exata pelo leitor de código de barras
+        tk.Label(frame_colunas, text="Coluna Código:").grid(
+            row=2, column=0, sticky="w", padx=(0, 5), pady=(5, 0)
+        )
+        self.combo_codigo = ttk.Combobox(
+            frame_colunas, 
+            textvariable=self.nome_coluna_codigo, 
+            state="readonly"
+        )
+        self.combo_codigo.grid(row=2, column=1, sticky="ew", padx=5, pady=(5, 0))
+
         # --- FRAME FILTRO ---
         frame_filtro = tk.Frame(content_frame)
         frame_filtro.grid(row=2, column=0, pady=(5, 10), sticky="ew")
@@ -559,24 +1749,58 @@ class App:
         )
         self.entry_filtro = tk.Entry(frame_filtro)
         self.entry_filtro.grid(row=0, column=1, sticky="ew", padx=5)
-        self.entry_filtro.bind("<KeyRelease>", self.atualizar_tabela)
+        self.entry_filtro.bind("<KeyRelease>", self._ao_digitar_filtro)
+        self.entry_filtro.bind("<Return>", self._buscar_codigo_digitado)
+        self.entry_filtro.bind("<KP_Enter>", self._buscar_codigo_digitado)
+
+        # Faixa de preço (de venda)
+        tk.Label(frame_filtro, text="Preço de:").grid(row=0, column=2, sticky="w", padx=(10, 5))
+        self.entry_preco_min = tk.Entry(frame_filtro, width=9)
+        self.entry_preco_min.grid(row=0, column=3, padx=5)
+        self.entry_preco_min.bind("<KeyRelease>", self.atualizar_tabela)
+        
+        tk.Label(frame_filtro, text="até:").grid(row=0, column=4, sticky="w", padx=5)
+        self.entry_preco_max = tk.Entry(frame_filtro, width=9)
+        self.entry_preco_max.grid(row=0, column=5, padx=5)
+        self.entry_preco_max.bind("<KeyRelease>", self.atualizar_tabela)
 
         ttk.Button(
             frame_filtro, 
             text="Limpar Filtro", 
             command=self.limpar_filtro
-        ).grid(row=0, column=2, padx=10)
+        ).grid(row=0, column=6, padx=10)
+
+        # Páginas de resultados do catálogo externo (escondido no modo planilha)
+        self.frame_paginacao = tk.Frame(frame_filtro)
+        self.frame_paginacao.grid(row=1, column=0, columnspan=7, sticky="e", pady=(5, 0))
+        self.btn_pagina_anterior = ttk.Button(
+            self.frame_paginacao, 
+            text="◀ Anterior", 
+            command=lambda: self.mudar_pagina(-1)
+        )
+        self.btn_pagina_anterior.grid(row=0, column=0, padx=5)
+        self.label_pagina = tk.Label(self.frame_paginacao, text="", fg="gray")
+        self.label_pagina.grid(row=0, column=1, padx=5)
+        self.btn_pagina_seguinte = ttk.Button(
+            self.frame_paginacao, 
+            text="Próxima ▶", 
+            command=lambda: self.mudar_pagina(1)
+        )
+        self.btn_pagina_seguinte.grid(row=0, column=2, padx=5)
+        self.frame_paginacao.grid_remove()
 
         # --- TREEVIEW PRINCIPAL ---
         self.tree_principal = ttk.Treeview(
             content_frame, 
-            columns=("Descrição", "Preço"), 
+            columns=("Descrição", "Preço", "Fornecedor", "Aba", "Custo", "Código"), 
+            displaycolumns=("Descrição", "Preço"), 
             style='Treeview', 
             show="headings", 
             selectmode="extended"
         )
-        self.tree_principal.heading("Descrição", text="Descrição")
-        self.tree_principal.heading("Preço", text="Preço")
+        # Clique no cabeçalho ordena a grade pela coluna
+        for coluna, titulo in self.TITULOS_COLUNAS.items():
+            self.tree_principal.heading(coluna, text=titulo, command=lambda c=coluna: self.ordenar_por(c))
         self.tree_principal.grid(row=3, column=0, sticky="nsew")
 
         scroll_principal = ttk.Scrollbar(
@@ -590,28 +1814,52 @@ class App:
         # Configuração das colunas - Ambas ajustáveis manualmente
         self.tree_principal.column("Descrição", anchor='w', width=400, minwidth=100, stretch=False)
         self.tree_principal.column("Preço", anchor='e', width=120, minwidth=80, stretch=False)
+        self.tree_principal.column("Fornecedor", anchor='w', width=140, minwidth=80, stretch=False)
+        self.tree_principal.column("Aba", anchor='w', width=140, minwidth=80, stretch=False)
+        self.tree_principal.column("Custo", anchor='e', width=120, minwidth=80, stretch=False)
+        self.tree_principal.column("Código", anchor='w', width=130, minwidth=80, stretch=False)
 
         # Bindings
-        self.tree_principal.bind("<ButtonRelease-1>", lambda e: mostrar_imagem(self))
+        self.tree_principal.bind("<ButtonRelease-1>", lambda e: imagem.mostrar_imagem(self))
         self.tree_principal.bind("<Double-1>", self.abrir_google_imagens)
 
-        # --- BOTÃO ADICIONAR ---
+        # --- BOTÕES DO CARRINHO ---
+        frame_botoes_carrinho = tk.Frame(content_frame)
+        frame_botoes_carrinho.grid(row=4, column=0, pady=10, padx=10, sticky="n")
+        
         ttk.Button(
-            content_frame, 
+            frame_botoes_carrinho, 
             text="Adicionar Selecionados", 
             command=self.adicionar_selecionados
-        ).grid(row=4, column=0, pady=10, padx=10, sticky="n")
+        ).grid(row=0, column=0, padx=5)
+        
+        ttk.Button(
+            frame_botoes_carrinho, 
+            text="Adicionar Todos", 
+            command=self.adicionar_todos
+        ).grid(row=0, column=1, padx=5)
+        
+        ttk.Button(
+            frame_botoes_carrinho, 
+            text="Remover Todos", 
+            command=self.remover_todos
+        ).grid(row=0, column=2, padx=5)
 
         # --- TREEVIEW SELECIONADOS ---
         self.tree_selecionados = ttk.Treeview(
             content_frame, 
-            columns=("Descrição", "Preço"), 
+            columns=("Descrição", "Preço", "Fornecedor", "Aba", "Custo", "Código"), 
+            displaycolumns=("Descrição", "Preço"), 
             style='Treeview', 
             show="headings", 
             selectmode="browse"
         )
         self.tree_selecionados.heading("Descrição", text="Descrição")
         self.tree_selecionados.heading("Preço", text="Preço")
+        self.tree_selecionados.heading("Fornecedor", text="Fornecedor")
+        self.tree_selecionados.heading("Aba", text="Categoria")
+        self.tree_selecionados.heading("Custo", text="Custo")
+        self.tree_selecionados.heading("Código", text="Código")
         self.tree_selecionados.grid(row=5, column=0, sticky="nsew")
 
         scroll_sel = ttk.Scrollbar(
@@ -625,14 +1873,34 @@ class App:
         # Configuração das colunas - Ambas ajustáveis manualmente
         self.tree_selecionados.column("Descrição", anchor='w', width=400, minwidth=100, stretch=False)
         self.tree_selecionados.column("Preço", anchor='e', width=120, minwidth=80, stretch=False)
+        self.tree_selecionados.column("Fornecedor", anchor='w', width=140, minwidth=80, stretch=False)
+        self.tree_selecionados.column("Aba", anchor='w', width=140, minwidth=80, stretch=False)
+        self.tree_selecionados.column("Custo", anchor='e', width=120, minwidth=80, stretch=False)
+        self.tree_selecionados.column("Código", anchor='w', width=130, minwidth=80, stretch=False)
         self.tree_selecionados.bind("<Double-1>", self.remover_selecionado)
 
         # --- BOTÃO GERAR PDF ---
+        frame_pdf = tk.Frame(content_frame)
+        frame_pdf.grid(row=6, column=0, pady=10, padx=10, sticky="n")
+        
         tk.Button(
-            content_frame, 
+            frame_pdf, 
             text="Gerar PDF", 
-            command=lambda: gerar_pdf(self)
-        ).grid(row=6, column=0, pady=10, padx=10, sticky="n")
+            command=lambda: pdf_generator.gerar_pdf(self)
+        ).grid(row=0, column=0)
+        
+        tk.Checkbutton(
+            frame_pdf, 
+            text="Incluir imagens", 
+            variable=self.incluir_miniaturas_pdf,
+            command=self._antecipar_imagens_carrinho
+        ).grid(row=0, column=1, padx=(10, 0))
+        
+        ttk.Button(
+            frame_pdf, 
+            text="Regras de Preço...", 
+            command=lambda: precificacao.abrir_regras_preco(self)
+        ).grid(row=0, column=2, padx=(20, 0))
 
         # --- FRAME TOTAL ---
         frame_total = tk.Frame(content_frame)
@@ -669,13 +1937,25 @@ class App:
         self.frame_miniaturas = tk.Frame(frame_img)
         self.frame_miniaturas.pack(pady=5, padx=10)
 
+        # Consultas de imagem usadas no dia (cota da API do Google)
+        self.label_cota = tk.Label(frame_img, text="", fg="gray")
+        self.label_cota.pack(padx=10)
+
         # Botão atualizar imagem
         ttk.Button(
             frame_img, 
             text="Atualizar Imagem", 
-            command=lambda: atualizar_imagem(self)
+            command=lambda: imagem.atualizar_imagem(self)
         ).pack(pady=5, padx=10)
 
+        # Painel de diagnóstico de desempenho (também pelo atalho F12)
+        ttk.Button(
+            frame_img, 
+            text="Diagnóstico", 
+            command=lambda: abrir_painel_diagnostico(self)
+        ).pack(side="bottom", pady=10, padx=10)
+        self.root.bind("<F12>", lambda e: abrir_painel_diagnostico(self))
+
 
 if __name__ == "__main__":
     root = tk.Tk()
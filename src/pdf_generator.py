@@ -1,15 +1,56 @@
 import tkinter as tk
 from tkinter import messagebox, filedialog
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import (
+    SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Flowable, KeepTogether
+)
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.lib.utils import ImageReader
+from PIL import Image
+from io import BytesIO
+from xml.sax.saxutils import escape
+from functools import lru_cache
+import hashlib
 import time
 import os
 import platform
 
+from desempenho import cronometrado, registrar_cache
+
+
+# Larguras das colunas da tabela: '#', 'Descrição do Produto', 'Preço Unitário'
+LARGURAS_COLUNAS = [0.5*inch, 4.5*inch, 1.5*inch]
+
+# Larguras com a coluna de miniaturas: '#', 'Imagem', 'Descrição do Produto', 'Preço Unitário'
+LARGURAS_COLUNAS_MINIATURAS = [0.5*inch, 0.6*inch, 3.9*inch, 1.5*inch]
+
+# Larguras do relatório de comparação: 'Situação', 'Descrição', 'Anterior', 'Novo', 'Variação'
+LARGURAS_COLUNAS_COMPARACAO = [0.9*inch, 3.2*inch, 1.0*inch, 1.0*inch, 0.8*inch]
+
+# Miniaturas: lado máximo no PDF, resolução alvo e qualidade do JPEG embutido
+LADO_MINIATURA = 0.5*inch
+DPI_MINIATURA = 150
+QUALIDADE_JPEG_MINIATURA = 70
+
+# A partir desta quantidade de itens o PDF é montado no modo "cotação grande"
+# (tabelas paginadas com alturas pré-calculadas)
+LIMITE_COTACAO_GRANDE = 300
+
+# Métricas padrão das células do ReportLab (fonte Helvetica 10, leading 12, padding 3/6)
+FONTE_CELULA = 'Helvetica'
+TAMANHO_FONTE_CELULA = 10
+LEADING_CELULA = 12
+PADDING_VERTICAL = 3
+PADDING_HORIZONTAL = 6
+PADDING_CABECALHO_INFERIOR = 8
+
+# Margem de segurança (em pontos) ao encaixar as linhas em uma página
+FOLGA_PAGINA = 2
+
 
 def abrir_pdf_automaticamente(caminho_arquivo):
     """
@@ -33,6 +74,425 @@ def abrir_pdf_automaticamente(caminho_arquivo):
         print(f"Aviso: Não foi possível abrir o PDF automaticamente. Erro: {e}")
 
 
+@lru_cache(maxsize=None)
+def _estilos():
+    """
+    Cria uma única vez os estilos de parágrafo e de tabela do relatório.
+    
+    Returns:
+        dict: Estilos 'normal', 'titulo', 'tabela' e 'total'
+    """
+    styles = getSampleStyleSheet()
+    
+    # Cria um estilo personalizado para título centralizado
+    titulo_style = ParagraphStyle(
+        'TituloCentralizado',
+        parent=styles['Heading1'],
+        alignment=TA_CENTER,
+        fontSize=16,
+        spaceAfter=12
+    )
+    
+    estilo_tabela = TableStyle([
+        # Cabeçalho
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('ALIGN', (-1, 0), (-1, -1), 'RIGHT'),  # Preços à direita
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), PADDING_CABECALHO_INFERIOR),
+        
+        # Linhas de dados
+        ('LINEBELOW', (0, 0), (-1, -1), 0.5, colors.grey),
+    ])
+    
+    # Linha do Total: merge de todas as colunas exceto a do preço
+    estilo_total = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LINEABOVE', (0, 0), (-1, -1), 1.5, colors.black),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+        ('SPAN', (0, 0), (-2, 0)),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ])
+    
+    # Relatório de comparação: as três colunas numéricas à direita
+    estilo_comparacao = TableStyle(
+        estilo_tabela.getCommands() + [('ALIGN', (2, 0), (-1, -1), 'RIGHT')]
+    )
+    
+    return {
+        'normal': styles['Normal'],
+        'titulo': titulo_style,
+        'tabela': estilo_tabela,
+        'total': estilo_total,
+        'comparacao': estilo_comparacao,
+    }
+
+
+def _formatar_total(total_geral):
+    """Formata o total no padrão brasileiro (R$ X.XXX,XX)."""
+    total_formatado = f"{total_geral:,.2f}"
+    total_formatado = total_formatado.replace(",", "TEMP")
+    total_formatado = total_formatado.replace(".", ",")
+    total_formatado = total_formatado.replace("TEMP", ".")
+    return f"R$ {total_formatado}"
+
+
+class _ParagrafoMedido(Paragraph):
+    """Paragraph que reaproveita a quebra de linhas já calculada para a mesma largura."""
+    
+    def wrap(self, availWidth, availHeight):
+        if getattr(self, '_largura_medida', None) != availWidth:
+            self._medida = Paragraph.wrap(self, availWidth, availHeight)
+            self._largura_medida = availWidth
+        return self._medida
+
+
+class _Miniatura(Flowable):
+    """
+    Miniatura de produto desenhada a partir de um ImageReader compartilhado.
+    
+    Várias linhas com a mesma imagem usam o mesmo ImageReader; o ReportLab
+    identifica o conteúdo repetido e embute a imagem uma única vez no PDF.
+    """
+    
+    def __init__(self, leitor, largura, altura):
+        Flowable.__init__(self)
+        self.leitor = leitor
+        self.largura = largura
+        self.altura = altura
+    
+    def wrap(self, availWidth, availHeight):
+        return self.largura, self.altura
+    
+    def draw(self):
+        self.canv.drawImage(self.leitor, 0, 0, self.largura, self.altura)
+
+
+def _comprimir_miniatura(dados_imagem, dpi):
+    """
+    Reduz uma imagem do cache para o tamanho da miniatura e a recomprime em JPEG.
+    
+    Args:
+        dados_imagem: Bytes da imagem original (como baixada pelo imagem.py)
+        dpi: Resolução alvo da miniatura no PDF
+        
+    Returns:
+        tuple: (ImageReader, largura, altura) em pontos, ou None se a imagem for inválida
+    """
+    lado_px = max(1, round(LADO_MINIATURA / inch * dpi))
+    try:
+        img = Image.open(BytesIO(dados_imagem))
+        # Para JPEGs, decodifica já em escala reduzida (bem mais rápido)
+        img.draft('RGB', (lado_px, lado_px))
+        img.thumbnail((lado_px, lado_px), Image.Resampling.LANCZOS)
+        
+        # JPEG não tem transparência: aplica o fundo branco
+        if img.mode in ('RGBA', 'LA', 'P'):
+            img = img.convert('RGBA')
+            fundo = Image.new('RGB', img.size, 'white')
+            fundo.paste(img, mask=img.getchannel('A'))
+            img = fundo
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        buffer = BytesIO()
+        img.save(buffer, format='JPEG', quality=QUALIDADE_JPEG_MINIATURA, optimize=True)
+        buffer.seek(0)
+    except Exception as e:
+        print(f"Aviso: Não foi possível preparar a miniatura para o PDF. Erro: {e}")
+        return None
+    
+    largura_px, altura_px = img.size
+    return ImageReader(buffer), largura_px / dpi * inch, altura_px / dpi * inch
+
+
+def _preparar_miniaturas(descricoes, imagens, dpi):
+    """
+    Prepara as miniaturas de cada descrição usando somente as imagens já em cache.
+    
+    Imagens idênticas (mesmo conteúdo) são processadas uma única vez.
+    
+    Args:
+        descricoes: Descrições dos itens da cotação
+        imagens: Dicionário {descricao: bytes da imagem}
+        dpi: Resolução alvo das miniaturas
+        
+    Returns:
+        dict: {descricao: (ImageReader, largura, altura)} para as descrições com imagem
+    """
+    por_conteudo = {}
+    miniaturas = {}
+    for descricao in set(descricoes):
+        dados_imagem = imagens.get(descricao)
+        registrar_cache('miniaturas_pdf', bool(dados_imagem))
+        if not dados_imagem:
+            continue
+        chave = hashlib.sha1(dados_imagem).digest()
+        if chave not in por_conteudo:
+            por_conteudo[chave] = _comprimir_miniatura(dados_imagem, dpi)
+        if por_conteudo[chave] is not None:
+            miniaturas[descricao] = por_conteudo[chave]
+    return miniaturas
+
+
+def _celula_descricao(descricao, largura_util):
+    """
+    Retorna o conteúdo da célula de descrição.
+    
+    Descrições que cabem em uma linha seguem como texto simples (caminho rápido,
+    sem o custo de um Paragraph); as demais viram Paragraph para quebrar a linha.
+    
+    Args:
+        descricao: Texto da descrição do produto
+        largura_util: Largura disponível dentro da célula (em pontos)
+        
+    Returns:
+        str ou Paragraph
+    """
+    descricao = str(descricao)
+    if '\n' not in descricao:
+        # Nenhum caractere da Helvetica passa de ~1.02 em: se couber nesse pior caso,
+        # nem é preciso medir a string
+        if len(descricao) * TAMANHO_FONTE_CELULA * 1.02 <= largura_util:
+            return descricao
+        if stringWidth(descricao, FONTE_CELULA, TAMANHO_FONTE_CELULA) <= largura_util:
+            return descricao
+    return _ParagrafoMedido(escape(descricao), _estilos()['normal'])
+
+
+def _altura_linha(linha, largura_util):
+    """Calcula a altura (em pontos) de uma linha de dados da tabela."""
+    altura_conteudo = LEADING_CELULA
+    for celula in linha:
+        if isinstance(celula, Flowable):
+            altura_conteudo = max(altura_conteudo, celula.wrap(largura_util, 1e6)[1])
+    return altura_conteudo + 2 * PADDING_VERTICAL
+
+
+def _tabelas_paginadas(cabecalho, linhas, alturas, larguras, altura_primeira, altura_pagina,
+                       estilo_tabela=None, rodape=None):
+    """
+    Divide as linhas em uma tabela por página, com o cabeçalho repetido em cada uma.
+    
+    Como as alturas das linhas já são conhecidas, o ReportLab não precisa medir
+    nem dividir uma tabela gigante: cada tabela cabe inteira na sua página.
+    
+    Args:
+        cabecalho: Linha de cabeçalho da tabela
+        linhas: Linhas de dados (sem o cabeçalho)
+        alturas: Altura de cada linha de dados
+        larguras: Larguras das colunas
+        altura_primeira: Espaço disponível na primeira página (abaixo do título)
+        altura_pagina: Espaço disponível nas demais páginas
+        estilo_tabela: TableStyle das tabelas (padrão: o da cotação)
+        rodape: Flowable opcional (ex.: linha de total) mantido na mesma página da última tabela
+        
+    Returns:
+        list: Flowables (tabelas separadas por quebras de página)
+    """
+    if estilo_tabela is None:
+        estilo_tabela = _estilos()['tabela']
+    altura_cabecalho = LEADING_CELULA + PADDING_VERTICAL + PADDING_CABECALHO_INFERIOR
+    # A última linha só entra numa página se o rodapé couber junto com ela
+    altura_rodape = rodape.wrap(sum(larguras), altura_pagina)[1] if rodape is not None else 0
+    
+    flowables = []
+    inicio = 0
+    disponivel = altura_primeira
+    total_linhas = len(linhas)
+    
+    while inicio < total_linhas:
+        # Acumula linhas até preencher a página (sempre pelo menos uma linha)
+        ocupado = altura_cabecalho + alturas[inicio]
+        fim = inicio + 1
+        while fim < total_linhas:
+            reserva = altura_rodape if fim == total_linhas - 1 else 0
+            if ocupado + alturas[fim] + reserva > disponivel - FOLGA_PAGINA:
+                break
+            ocupado += alturas[fim]
+            fim += 1
+        
+        # Cada tabela cabe inteira na sua página: não há cabeçalho a repetir
+        tabela = Table(
+            [cabecalho] + linhas[inicio:fim],
+            colWidths=larguras,
+            rowHeights=[altura_cabecalho] + alturas[inicio:fim]
+        )
+        tabela.setStyle(estilo_tabela)
+        
+        if flowables:
+            flowables.append(PageBreak())
+        if fim == total_linhas and rodape is not None:
+            flowables.append(KeepTogether([tabela, rodape]))
+        else:
+            flowables.append(tabela)
+        
+        inicio = fim
+        disponivel = altura_pagina
+    
+    if not total_linhas and rodape is not None:
+        flowables.append(rodape)
+    return flowables
+
+
+@cronometrado('gerar_pdf')
+def montar_pdf(nome_arquivo, itens, modo_grande=None, imagens=None, dpi_miniaturas=DPI_MINIATURA):
+    """
+    Monta e grava o relatório PDF de cotação.
+    
+    Args:
+        nome_arquivo: Caminho do arquivo PDF a ser gerado
+        itens: Lista de tuplas (descricao, preco_formatado, preco_num)
+        modo_grande: Força (True) ou desativa (False) o modo de cotação grande.
+            Se None, é ativado automaticamente acima de LIMITE_COTACAO_GRANDE itens.
+        imagens: Dicionário {descricao: bytes da imagem} com as imagens já em cache.
+            Se informado, o relatório ganha uma coluna de miniaturas.
+        dpi_miniaturas: Resolução alvo das miniaturas embutidas
+    """
+    if modo_grande is None:
+        modo_grande = len(itens) > LIMITE_COTACAO_GRANDE
+    
+    # 1. Configuração do Documento
+    doc = _documento(nome_arquivo)
+    
+    estilos = _estilos()
+    flowables = []
+    
+    # 2. Título do Relatório
+    titulo = Paragraph(
+        f"Relatório de Cotação - Data: {time.strftime('%d/%m/%Y')}", 
+        estilos['titulo']
+    )
+    espacador = Spacer(1, 0.25*inch)
+    flowables.append(titulo)
+    flowables.append(espacador)
+    
+    # 3. Preparação dos Dados da Tabela
+    com_miniaturas = imagens is not None
+    if com_miniaturas:
+        cabecalho = ['#', 'Imagem', 'Descrição do Produto', 'Preço Unitário']
+        larguras = LARGURAS_COLUNAS_MINIATURAS
+        miniaturas = _preparar_miniaturas([item[0] for item in itens], imagens, dpi_miniaturas)
+    else:
+        cabecalho = ['#', 'Descrição do Produto', 'Preço Unitário']
+        larguras = LARGURAS_COLUNAS
+    largura_util = larguras[-2] - 2 * PADDING_HORIZONTAL
+    linhas = []
+    # Soma em centavos inteiros, como o total do carrinho na tela (sem erro de ponto flutuante)
+    total_centavos = 0
+
+    for i, (descricao, preco_formatado, preco_num) in enumerate(itens):
+        total_centavos += int(round(preco_num * 100))
+        linha = [str(i + 1)]
+        if com_miniaturas:
+            miniatura = miniaturas.get(descricao)
+            linha.append(_Miniatura(*miniatura) if miniatura else '')
+        linha.append(_celula_descricao(descricao, largura_util))
+        linha.append(preco_formatado)
+        linhas.append(linha)
+
+    # 4. Linha de Total
+    total_formatado = _formatar_total(total_centavos / 100)
+    tabela_total = Table(
+        [[''] * (len(larguras) - 2) + [
+            Paragraph('<b>TOTAL GERAL</b>', estilos['normal']), 
+            Paragraph(f'<b>{total_formatado}</b>', estilos['normal'])]],
+        colWidths=larguras
+    )
+    tabela_total.setStyle(estilos['total'])
+    
+    # 5. Cria a(s) Tabela(s), com o total junto da última
+    if modo_grande:
+        # O frame do SimpleDocTemplate tem 6pt de padding em cada borda
+        altura_pagina = doc.height - 12
+        altura_titulo = titulo.wrap(doc.width - 12, altura_pagina)[1]
+        altura_primeira = (
+            altura_pagina - altura_titulo - estilos['titulo'].spaceAfter - espacador.height
+        )
+        alturas = [_altura_linha(linha, largura_util) for linha in linhas]
+        flowables.extend(_tabelas_paginadas(
+            cabecalho, linhas, alturas, larguras, altura_primeira, altura_pagina, 
+            rodape=tabela_total
+        ))
+    else:
+        tabela = Table([cabecalho] + linhas, colWidths=larguras, repeatRows=1)
+        tabela.setStyle(estilos['tabela'])
+        flowables.append(tabela)
+        flowables.append(tabela_total)
+    
+    # 6. Gera o PDF
+    doc.build(flowables)
+
+
+def _documento(nome_arquivo):
+    """Cria o documento A4 com as margens padrão dos relatórios."""
+    return SimpleDocTemplate(
+        nome_arquivo, 
+        pagesize=A4, 
+        leftMargin=0.5*inch, 
+        rightMargin=0.5*inch,
+        topMargin=0.5*inch, 
+        bottomMargin=0.5*inch
+    )
+
+
+@cronometrado('gerar_pdf_comparacao')
+def montar_pdf_comparacao(nome_arquivo, relatorio, resumo=''):
+    """
+    Monta e grava o PDF do relatório de comparação de preços.
+    
+    Args:
+        nome_arquivo: Caminho do arquivo PDF a ser gerado
+        relatorio: DataFrame retornado por database.comparar_catalogos
+        resumo: Linha de resumo exibida abaixo do título
+    """
+    doc = _documento(nome_arquivo)
+    estilos = _estilos()
+    
+    titulo = Paragraph(
+        f"Comparação de Preços - Data: {time.strftime('%d/%m/%Y')}", 
+        estilos['titulo']
+    )
+    texto_resumo = Paragraph(escape(resumo), estilos['normal'])
+    espacador = Spacer(1, 0.25*inch)
+    flowables = [titulo, texto_resumo, espacador]
+    
+    def formatar(valor):
+        return '' if valor != valor else _formatar_total(valor)  # NaN != NaN
+    
+    def formatar_variacao(valor):
+        return '' if valor != valor else f"{valor:+.1f}%".replace('.', ',')
+    
+    larguras = LARGURAS_COLUNAS_COMPARACAO
+    largura_util = larguras[1] - 2 * PADDING_HORIZONTAL
+    cabecalho = ['Situação', 'Descrição', 'Anterior', 'Novo', 'Variação']
+    linhas = [
+        [situacao, _celula_descricao(descricao, largura_util), 
+         formatar(anterior), formatar(novo), formatar_variacao(variacao)]
+        for situacao, descricao, anterior, novo, variacao in zip(
+            relatorio['Situação'], relatorio['Descrição'], relatorio['Preço Anterior'],
+            relatorio['Preço Novo'], relatorio['Variação (%)']
+        )
+    ]
+    
+    if linhas:
+        altura_pagina = doc.height - 12
+        altura_cabecalho_pagina = (
+            titulo.wrap(doc.width - 12, altura_pagina)[1] + estilos['titulo'].spaceAfter
+            + texto_resumo.wrap(doc.width - 12, altura_pagina)[1] + espacador.height
+        )
+        alturas = [_altura_linha(linha, largura_util) for linha in linhas]
+        flowables.extend(_tabelas_paginadas(
+            cabecalho, linhas, alturas, larguras, 
+            altura_pagina - altura_cabecalho_pagina, altura_pagina, 
+            estilos['comparacao']
+        ))
+    
+    doc.build(flowables)
+
+
 def gerar_pdf(app):
     """
     Gera um relatório PDF com os itens selecionados e o preço total.
@@ -63,101 +523,20 @@ def gerar_pdf(app):
         return
 
     try:
-        # 2. Configuração do Documento
-        doc = SimpleDocTemplate(
-            nome_arquivo, 
-            pagesize=A4, 
-            leftMargin=0.5*inch, 
-            rightMargin=0.5*inch,
-            topMargin=0.5*inch, 
-            bottomMargin=0.5*inch
-        )
-        
-        styles = getSampleStyleSheet()
-        flowables = []
-        
-        # 3. Título do Relatório - CORREÇÃO AQUI
-        # Cria um estilo personalizado para título centralizado
-        titulo_style = ParagraphStyle(
-            'TituloCentralizado',
-            parent=styles['Heading1'],
-            alignment=TA_CENTER,
-            fontSize=16,
-            spaceAfter=12
-        )
-        
-        titulo = Paragraph(
-            f"Relatório de Cotação - Data: {time.strftime('%d/%m/%Y')}", 
-            titulo_style
-        )
-        flowables.append(titulo)
-        flowables.append(Spacer(1, 0.25*inch))
-        
-        # 4. Preparação dos Dados da Tabela
-        tabela_data = [['#', 'Descrição do Produto', 'Preço Unitário']]
-        total_geral = 0.0
-
-        # Iterar sobre os itens selecionados
-        for i, item_id in enumerate(itens_selecionados):
+        # 2. Coleta os itens na ordem da tabela de selecionados
+        itens = []
+        for item_id in itens_selecionados:
             valores_tabela = app.tree_selecionados.item(item_id, 'values')
-            descricao = valores_tabela[0]
-            preco_formatado = valores_tabela[1]
             
             # Pega o preço numérico do dicionário de dados
             preco_num = app.itens_selecionados_dados.get(item_id, {}).get('preco', 0.0)
-            total_geral += preco_num
-
-            tabela_data.append([
-                str(i + 1), 
-                Paragraph(descricao, styles['Normal']),
-                preco_formatado
-            ])
-
-        # 5. Adiciona a linha de Total
-        # Formata o total no padrão brasileiro
-        total_formatado = f"{total_geral:,.2f}"
-        total_formatado = total_formatado.replace(",", "TEMP")
-        total_formatado = total_formatado.replace(".", ",")
-        total_formatado = total_formatado.replace("TEMP", ".")
-        total_formatado = f"R$ {total_formatado}"
-        
-        # Linha do Total: merge das duas primeiras colunas
-        tabela_data.append([
-            '', 
-            Paragraph('<b>TOTAL GERAL</b>', styles['Normal']), 
-            Paragraph(f'<b>{total_formatado}</b>', styles['Normal'])
-        ])
-        
-        # 6. Cria a Tabela
-        tabela = Table(tabela_data, colWidths=[0.5*inch, 4.5*inch, 1.5*inch])
-        
-        # 7. Estilo da Tabela
-        tabela.setStyle(TableStyle([
-            # Cabeçalho
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (2, 0), (2, -1), 'RIGHT'),  # Preços à direita
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            
-            # Linhas de dados
-            ('LINEBELOW', (0, 0), (-1, -2), 0.5, colors.grey),
-            
-            # Estilo da linha do Total
-            ('LINEABOVE', (0, -1), (-1, -1), 1.5, colors.black),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('SPAN', (0, -1), (1, -1)),
-            ('ALIGN', (0, -1), (1, -1), 'RIGHT'),
-            ('TOPPADDING', (0, -1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, -1), (-1, -1), 4),
-        ]))
-
-        flowables.append(tabela)
+            itens.append((valores_tabela[0], valores_tabela[1], preco_num))
         
-        # 8. Gera o PDF
-        doc.build(flowables)
+        # 3. Gera o PDF (com miniaturas vindas apenas do cache de imagens, se marcado)
+        imagens = app.cache_bytes_imagens if app.incluir_miniaturas_pdf.get() else None
+        montar_pdf(nome_arquivo, itens, imagens=imagens)
         
-        # 9. Feedback e Abertura Automática
+        # 4. Feedback e Abertura Automática
         messagebox.showinfo(
             "Sucesso", 
             f"PDF gerado com sucesso!\n\nArquivo salvo em:\n{nome_arquivo}"
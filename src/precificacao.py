@@ -0,0 +1,226 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from desempenho import cronometrado, ModuloAdiado
+
+# Importados no primeiro cálculo: as regras são criadas junto com a janela, antes do pandas
+np = ModuloAdiado('numpy')
+pd = ModuloAdiado('pandas')
+
+# Colunas do catálogo usadas pelas regras
+COL_CUSTO = 'Preço'
+COL_VENDA = 'Preço Venda'
+COL_CATEGORIA = 'Aba'
+
+
+def arredondar_final_90(precos):
+    """
+    Arredonda para cima até o próximo valor terminado em ,90 (10,00 -> 10,90; 10,95 -> 11,90).
+    Preços zerados continuam zerados.
+
+    Args:
+        precos: Array (ou Series) de preços
+
+    Returns:
+        np.ndarray: Preços arredondados
+    """
+    precos = np.asarray(precos, dtype=float)
+    # As contas são feitas em centavos inteiros para não errar por causa do ponto flutuante
+    centavos = np.round(precos * 100)
+    arredondados = (np.ceil((centavos - 90) / 100) * 100 + 90) / 100
+    return np.where(precos > 0, arredondados, precos)
+
+
+class RegrasPreco:
+    """
+    Regras de precificação aplicadas sobre o custo da planilha (coluna 'Preço').
+
+    Preço de venda = custo x (1 + markup) x (1 + imposto), arredondado para ,90 se marcado.
+    O markup padrão pode ser substituído por categoria (aba da planilha).
+
+    O resultado fica guardado no próprio catálogo, na coluna 'Preço Venda': as regras
+    são aplicadas ao catálogo inteiro de uma vez, com operações vetorizadas, e uma
+    mudança de margem de categoria recalcula apenas as linhas daquela categoria.
+    """
+
+    def __init__(self, markup=0.0, imposto=0.0, arredondar_90=False, margens_categoria=None):
+        self.markup = float(markup)
+        self.imposto = float(imposto)
+        self.arredondar_90 = bool(arredondar_90)
+        self.margens_categoria = dict(margens_categoria or {})
+
+    def ativa(self):
+        """Indica se alguma regra altera o preço (sem regras, venda = custo)."""
+        return bool(self.markup or self.imposto or self.arredondar_90 or self.margens_categoria)
+
+    def _markups(self, df):
+        """Markup (%) de cada linha: o da categoria, se houver, ou o padrão."""
+        markups = np.full(len(df), self.markup)
+        if self.margens_categoria and COL_CATEGORIA in df.columns:
+            categorias = df[COL_CATEGORIA].to_numpy()
+            for categoria, markup in self.margens_categoria.items():
+                markups[categorias == categoria] = markup
+        return markups
+
+    def calcular(self, df):
+        """
+        Calcula o preço de venda de todas as linhas do DataFrame.
+
+        Returns:
+            np.ndarray: Preços de venda, na ordem das linhas
+        """
+        custos = df[COL_CUSTO].to_numpy(dtype=float)
+        if not self.ativa():
+            return custos.copy()
+        vendas = custos * (1 + self._markups(df) / 100) * (1 + self.imposto / 100)
+        if self.arredondar_90:
+            vendas = arredondar_final_90(vendas)
+        return vendas
+
+    @cronometrado('precificar')
+    def precificar(self, df, rotulos=None):
+        """
+        Grava a coluna 'Preço Venda' no catálogo.
+
+        Args:
+            df: Catálogo (alterado no próprio objeto)
+            rotulos: Rótulos das linhas a recalcular (padrão: todas)
+        """
+        if df.empty:
+            df[COL_VENDA] = pd.Series(dtype=float)
+            return
+        if rotulos is None or COL_VENDA not in df.columns:
+            df[COL_VENDA] = self.calcular(df)
+        elif len(rotulos):
+            df.loc[rotulos, COL_VENDA] = self.calcular(df.loc[rotulos])
+
+    def definir_margem_categoria(self, df, categoria, markup):
+        """
+        Define (ou remove, com markup None) o markup de uma categoria e
+        recalcula apenas as linhas dela.
+
+        Returns:
+            pd.Index: Rótulos das linhas recalculadas
+        """
+        if markup is None:
+            self.margens_categoria.pop(categoria, None)
+        else:
+            self.margens_categoria[categoria] = float(markup)
+
+        if COL_CATEGORIA not in df.columns:
+            return df.index[:0]
+        rotulos = df.index[(df[COL_CATEGORIA] == categoria).to_numpy()]
+        self.precificar(df, rotulos)
+        return rotulos
+
+
+# ---------------- Janela de Regras ---------------- #
+
+def _ler_percentual(texto):
+    """Converte o texto digitado ('12,5' ou '12.5') em float; vazio vale 0."""
+    texto = texto.strip().replace('%', '').replace(',', '.')
+    return float(texto) if texto else 0.0
+
+
+def abrir_regras_preco(app):
+    """
+    Abre a janela de regras de precificação (markup, imposto, arredondamento e margens por categoria).
+
+    Args:
+        app: Instância da aplicação principal
+    """
+    regras = app.regras_preco
+
+    janela = tk.Toplevel(app.root)
+    janela.title("Regras de Preço")
+    janela.minsize(420, 380)
+    janela.grid_columnconfigure(1, weight=1)
+    janela.grid_rowconfigure(4, weight=1)
+
+    markup = tk.StringVar(value=f"{regras.markup:g}")
+    imposto = tk.StringVar(value=f"{regras.imposto:g}")
+    arredondar = tk.BooleanVar(value=regras.arredondar_90)
+
+    # --- Regras gerais ---
+    tk.Label(janela, text="Markup padrão (%):").grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
+    tk.Entry(janela, textvariable=markup, width=10).grid(row=0, column=1, sticky="w", padx=5, pady=(10, 5))
+    tk.Label(janela, text="Imposto (%):").grid(row=1, column=0, sticky="w", padx=10, pady=5)
+    tk.Entry(janela, textvariable=imposto, width=10).grid(row=1, column=1, sticky="w", padx=5, pady=5)
+    tk.Checkbutton(
+        janela, text="Arredondar para final ,90", variable=arredondar
+    ).grid(row=2, column=0, columnspan=2, sticky="w", padx=10, pady=5)
+
+    def aplicar_gerais():
+        try:
+            regras.markup = _ler_percentual(markup.get())
+            regras.imposto = _ler_percentual(imposto.get())
+        except ValueError:
+            messagebox.showerror("Erro", "Informe percentuais numéricos (ex.: 35 ou 12,5).", parent=janela)
+            return
+        regras.arredondar_90 = arredondar.get()
+        # Regra geral vale para todas as linhas
+        app.aplicar_regras_preco()
+
+    ttk.Button(janela, text="Aplicar", command=aplicar_gerais).grid(row=0, column=2, rowspan=3, padx=10)
+
+    # --- Margens por categoria (abas da planilha) ---
+    tk.Label(janela, text="Markup por categoria:", font=('Arial', 10, 'bold')).grid(
+        row=3, column=0, columnspan=3, sticky="w", padx=10, pady=(15, 5)
+    )
+    tree = ttk.Treeview(janela, columns=("Categoria", "Markup (%)"), show="headings", height=8)
+    tree.heading("Categoria", text="Categoria")
+    tree.heading("Markup (%)", text="Markup (%)")
+    tree.column("Categoria", anchor='w', width=220)
+    tree.column("Markup (%)", anchor='e', width=100)
+    tree.grid(row=4, column=0, columnspan=3, sticky="nsew", padx=10)
+
+    if COL_CATEGORIA in app.df.columns:
+        categorias = [str(c) for c in pd.unique(app.df[COL_CATEGORIA])]
+    else:
+        categorias = []
+    # Categorias com margem definida continuam na lista mesmo fora do catálogo atual
+    categorias += [c for c in regras.margens_categoria if c not in categorias]
+
+    def preencher():
+        for categoria in categorias:
+            valor = regras.margens_categoria.get(categoria)
+            texto = f"{valor:g}" if valor is not None else "(padrão)"
+            if tree.exists(categoria):
+                tree.item(categoria, values=(categoria, texto))
+            else:
+                tree.insert('', 'end', iid=categoria, values=(categoria, texto))
+
+    frame_categoria = tk.Frame(janela)
+    frame_categoria.grid(row=5, column=0, columnspan=3, pady=10)
+    markup_categoria = tk.StringVar()
+    tk.Entry(frame_categoria, textvariable=markup_categoria, width=10).grid(row=0, column=0, padx=5)
+
+    def definir_categoria(remover=False):
+        selecionadas = tree.selection()
+        if not selecionadas:
+            messagebox.showwarning("Aviso", "Selecione uma categoria na lista.", parent=janela)
+            return
+        try:
+            valor = None if remover else _ler_percentual(markup_categoria.get())
+        except ValueError:
+            messagebox.showerror("Erro", "Informe um percentual numérico (ex.: 35 ou 12,5).", parent=janela)
+            return
+        for categoria in selecionadas:
+            # Só as linhas da categoria são recalculadas
+            rotulos = regras.definir_margem_categoria(app.df, categoria, valor)
+            app.aplicar_regras_preco(rotulos)
+        preencher()
+
+    ttk.Button(
+        frame_categoria, text="Definir Markup", command=definir_categoria
+    ).grid(row=0, column=1, padx=5)
+    ttk.Button(
+        frame_categoria, text="Usar Padrão", command=lambda: definir_categoria(remover=True)
+    ).grid(row=0, column=2, padx=5)
+
+    if not categorias:
+        tk.Label(
+            janela, text="Carregue um Excel com várias abas para definir margens por categoria.", fg="gray"
+        ).grid(row=6, column=0, columnspan=3, padx=10, pady=(0, 10))
+
+    preencher()
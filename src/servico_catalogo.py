@@ -0,0 +1,292 @@
+"""
+Serviço compartilhado de consulta de catálogos.
+
+Carrega as planilhas dos fornecedores uma única vez (com database.carregar_dados),
+mantém o índice de busca em memória e responde às consultas de filtro e preço das
+mesas de venda por uma API HTTP local. Cada mesa usa o App em modo cliente
+(variável CATALOGO_SERVIDOR no .env) em vez de carregar a planilha inteira.
+
+Uso:
+    python src/servico_catalogo.py --catalogo padrao planilha.xlsx Descrição Preço
+
+O serviço não tem autenticação: por padrão escuta só em 127.0.0.1. Para atender as
+outras mesas da rede, informe a interface com --host (ex.: --host 0.0.0.0).
+
+Rotas (todas GET, respostas em JSON):
+    /catalogos                  Lista os catálogos carregados
+    /buscar?catalogo=&q=&preco_min=&preco_max=&limite=&offset=
+                                Filtro fuzzy (mesmo do App) + faixa de preço, paginado
+                                (limite de no máximo LIMITE_RESULTADOS linhas)
+    /itens?catalogo=&ids=1,2,3  Consulta de itens (e preços) pelo id
+"""
+import argparse
+import json
+import re
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+import pandas as pd
+import requests
+
+from database import carregar_dados
+from desempenho import medir, registrar_cache
+
+PORTA_PADRAO = 8765
+# Só a própria máquina: expor o catálogo na rede exige --host explícito
+HOST_PADRAO = '127.0.0.1'
+
+# Máximo de linhas devolvidas por consulta (o Treeview não precisa de mais que isso)
+LIMITE_RESULTADOS = 1000
+
+# Quantidade de filtros recentes mantidos em cache por catálogo
+TAMANHO_CACHE_CONSULTAS = 256
+
+
+class IndiceCatalogo:
+    """
+    Catálogo carregado em memória com o índice de busca pronto para consultas.
+
+    As descrições ficam pré-convertidas para minúsculas e os resultados dos filtros
+    recentes ficam em cache. Como o filtro de uma tecla a mais é sempre um
+    subconjunto do filtro anterior ("ssd" -> "ssd k"), a busca é refeita apenas
+    sobre as linhas do maior filtro em cache que seja prefixo do novo.
+    """
+
+    def __init__(self, nome, df, caminho_arquivo=''):
+        self.nome = nome
+        self.caminho_arquivo = caminho_arquivo
+        self.df = df
+        self.ids = df.index.to_numpy()
+        self.descricoes = df['Descrição'].astype(str).to_numpy()
+        self.descricoes_minusculas = df['Descrição'].astype(str).str.lower().reset_index(drop=True)
+        self.precos = df['Preço'].to_numpy(dtype=float)
+        self._cache = OrderedDict()
+        self._trava = threading.Lock()
+
+    def _posicoes_filtro(self, filtro):
+        """Retorna as posições (np.ndarray) das linhas que passam no filtro fuzzy."""
+        filtro = filtro.lower().strip()
+        if not filtro:
+            return np.arange(len(self.ids))
+
+        with self._trava:
+            if filtro in self._cache:
+                self._cache.move_to_end(filtro)
+                registrar_cache('consultas_servico', True)
+                return self._cache[filtro]
+            # Maior filtro em cache que é prefixo do novo (resultado é um superconjunto)
+            base = max((f for f in self._cache if filtro.startswith(f)), key=len, default=None)
+            candidatas = self._cache[base] if base is not None else None
+        registrar_cache('consultas_servico', False)
+
+        pattern = '.*'.join(map(re.escape, filtro.split()))
+        if candidatas is None:
+            mascara = self.descricoes_minusculas.str.contains(pattern, regex=True).to_numpy()
+            posicoes = np.flatnonzero(mascara)
+        else:
+            subconjunto = self.descricoes_minusculas.iloc[candidatas]
+            mascara = subconjunto.str.contains(pattern, regex=True).to_numpy()
+            posicoes = candidatas[mascara]
+
+        with self._trava:
+            self._cache[filtro] = posicoes
+            if len(self._cache) > TAMANHO_CACHE_CONSULTAS:
+                self._cache.popitem(last=False)
+        return posicoes
+
+    def buscar(self, filtro='', preco_min=None, preco_max=None, limite=LIMITE_RESULTADOS, offset=0):
+        """
+        Executa o filtro de descrição e a faixa de preço.
+
+        Returns:
+            dict: {'total': int, 'itens': [{'id', 'descricao', 'preco'}, ...]}
+        """
+        with medir('servico_buscar'):
+            posicoes = self._posicoes_filtro(filtro)
+            if preco_min is not None or preco_max is not None:
+                precos = self.precos[posicoes]
+                mascara = np.ones(len(posicoes), dtype=bool)
+                if preco_min is not None:
+                    mascara &= precos >= preco_min
+                if preco_max is not None:
+                    mascara &= precos <= preco_max
+                posicoes = posicoes[mascara]
+
+            pagina = posicoes[offset:offset + limite]
+            return {'total': int(len(posicoes)), 'itens': self._itens(pagina)}
+
+    def obter(self, ids):
+        """Retorna os itens (com preço) correspondentes aos ids informados."""
+        posicoes = pd.Index(self.ids).get_indexer(ids)
+        return {'itens': self._itens(posicoes[posicoes >= 0])}
+
+    def _itens(self, posicoes):
+        return [
+            {'id': int(i), 'descricao': d, 'preco': float(p)}
+            for i, d, p in zip(self.ids[posicoes], self.descricoes[posicoes], self.precos[posicoes])
+        ]
+
+
+class _ManipuladorHTTP(BaseHTTPRequestHandler):
+    """Atende as rotas da API; os catálogos ficam em self.server.catalogos."""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parametros = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            if url.path == '/catalogos':
+                resposta = {'catalogos': [
+                    {'nome': c.nome, 'linhas': len(c.ids), 'arquivo': c.caminho_arquivo}
+                    for c in self.server.catalogos.values()
+                ]}
+            elif url.path == '/buscar':
+                resposta = self._catalogo(parametros).buscar(
+                    parametros.get('q', ''),
+                    _float_ou_none(parametros.get('preco_min')),
+                    _float_ou_none(parametros.get('preco_max')),
+                    _limite(parametros.get('limite')),
+                    _offset(parametros.get('offset')),
+                )
+            elif url.path == '/itens':
+                ids = [int(i) for i in parametros.get('ids', '').split(',') if i]
+                resposta = self._catalogo(parametros).obter(ids)
+            else:
+                self._responder(404, {'erro': f'Rota desconhecida: {url.path}'})
+                return
+        except KeyError as e:
+            self._responder(404, {'erro': str(e)})
+            return
+        except ValueError as e:
+            self._responder(400, {'erro': f'Parâmetro inválido: {e}'})
+            return
+        self._responder(200, resposta)
+
+    def _catalogo(self, parametros):
+        nome = parametros.get('catalogo') or next(iter(self.server.catalogos), '')
+        if nome not in self.server.catalogos:
+            raise KeyError(f"Catálogo '{nome}' não carregado no serviço.")
+        return self.server.catalogos[nome]
+
+    def _responder(self, status, dados):
+        corpo = json.dumps(dados, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, format, *args):
+        # Evita uma linha no console para cada tecla digitada nas mesas
+        pass
+
+
+def _float_ou_none(valor):
+    return float(valor) if valor not in (None, '') else None
+
+
+def _limite(valor):
+    """Tamanho da página pedido, limitado a LIMITE_RESULTADOS (uma consulta não devolve o catálogo inteiro)."""
+    limite = int(valor) if valor not in (None, '') else LIMITE_RESULTADOS
+    if limite < 0:
+        raise ValueError(f"limite={limite}")
+    return min(limite, LIMITE_RESULTADOS)
+
+
+def _offset(valor):
+    offset = int(valor) if valor not in (None, '') else 0
+    if offset < 0:
+        raise ValueError(f"offset={offset}")
+    return offset
+
+
+def criar_servidor(catalogos, host=HOST_PADRAO, porta=PORTA_PADRAO):
+    """
+    Cria o servidor HTTP (multithread) para os catálogos já carregados.
+
+    Args:
+        catalogos: Lista de IndiceCatalogo
+        host: Interface de rede a escutar (padrão: só a própria máquina)
+        porta: Porta TCP
+
+    Returns:
+        ThreadingHTTPServer: Servidor pronto para serve_forever()
+    """
+    servidor = ThreadingHTTPServer((host, porta), _ManipuladorHTTP)
+    servidor.daemon_threads = True
+    servidor.catalogos = {c.nome: c for c in catalogos}
+    return servidor
+
+
+# ---------------- Cliente (usado pelo App) ---------------- #
+
+class ClienteCatalogo:
+    """Cliente do serviço de catálogo; devolve DataFrames no mesmo formato do carregar_dados."""
+
+    def __init__(self, url_servidor, catalogo='', timeout=10):
+        self.url_servidor = url_servidor.rstrip('/')
+        self.catalogo = catalogo
+        self.timeout = timeout
+        # Sessão HTTP reaproveita a conexão entre as consultas (uma por tecla)
+        self._sessao = requests.Session()
+
+    def _get(self, rota, **parametros):
+        parametros['catalogo'] = self.catalogo
+        response = self._sessao.get(f"{self.url_servidor}{rota}", params=parametros, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _para_dataframe(itens):
+        df = pd.DataFrame(itens, columns=['id', 'descricao', 'preco'])
+        df = df.rename(columns={'descricao': 'Descrição', 'preco': 'Preço'})
+        return df.set_index('id')
+
+    def buscar(self, filtro='', preco_min=None, preco_max=None, limite=LIMITE_RESULTADOS, offset=0):
+        """
+        Consulta o serviço com o filtro fuzzy e a faixa de preço.
+
+        Args:
+            limite: Tamanho da página (o serviço não devolve mais que LIMITE_RESULTADOS)
+            offset: Quantos resultados pular (página seguinte = offset + limite)
+
+        Returns:
+            tuple: (DataFrame com 'Descrição' e 'Preço' indexado pelo id, total de resultados)
+        """
+        dados = self._get(
+            '/buscar', q=filtro, preco_min=preco_min, preco_max=preco_max, limite=limite, offset=offset
+        )
+        return self._para_dataframe(dados['itens']), dados['total']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalogo', nargs=4, action='append', required=True,
+                        metavar=('NOME', 'ARQUIVO', 'COL_DESCRICAO', 'COL_PRECO'),
+                        help='Catálogo a carregar (pode ser repetido)')
+    parser.add_argument('--host', default=HOST_PADRAO,
+                        help='Interface a escutar (padrão: 127.0.0.1; use 0.0.0.0 para atender a rede)')
+    parser.add_argument('--porta', type=int, default=PORTA_PADRAO)
+    args = parser.parse_args()
+
+    catalogos = []
+    for nome, caminho, col_descricao, col_preco in args.catalogo:
+        print(f"Carregando catálogo '{nome}' de {caminho}...")
+        df = carregar_dados(caminho, col_descricao, col_preco)
+        catalogos.append(IndiceCatalogo(nome, df, caminho))
+        print(f"  {len(df)} linhas carregadas.")
+
+    servidor = criar_servidor(catalogos, args.host, args.porta)
+    print(f"Serviço de catálogo escutando em http://{args.host}:{args.porta}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+import json
+import os
+
+from desempenho import cronometrado, ModuloAdiado
+
+# Importado só ao ler ou gravar o cache do catálogo
+pd = ModuloAdiado('pandas')
+
+# Versão do formato do arquivo de sessão (sessões de outra versão são ignoradas)
+VERSAO_SESSAO = 1
+ARQUIVO_SESSAO = 'sessao.json'
+ARQUIVO_CACHE = 'catalogo.pkl'
+
+
+def diretorio_sessao() -> str:
+    """Pasta da sessão: SESSAO_DIR do .env ou ~/.consulta_precos."""
+    return os.getenv('SESSAO_DIR') or os.path.join(os.path.expanduser('~'), '.consulta_precos')
+
+
+def _gravar_substituindo(caminho_arquivo: str, gravar):
+    """Grava em um arquivo temporário e o troca pelo definitivo (nunca deixa um arquivo pela metade)."""
+    temporario = caminho_arquivo + '.tmp'
+    gravar(temporario)
+    os.replace(temporario, caminho_arquivo)
+
+
+@cronometrado('salvar_sessao')
+def salvar_sessao(estado: dict, df=None):
+    """
+    Grava a sessão (estado da tela) e, se informado, o catálogo já interpretado.
+
+    Args:
+        estado (dict): Estado da sessão (arquivo, colunas, filtro, carrinho...), serializável em JSON.
+        df (pd.DataFrame): Catálogo a guardar no cache. Se None, mantém o cache anterior
+            (o estado deve dizer se ele continua valendo, na chave 'cache').
+    """
+    diretorio = diretorio_sessao()
+    os.makedirs(diretorio, exist_ok=True)
+
+    # O cache vai primeiro: a sessão só passa a apontar para ele depois de gravado
+    if df is not None:
+        _gravar_substituindo(os.path.join(diretorio, ARQUIVO_CACHE), df.to_pickle)
+
+    estado = dict(estado, versao=VERSAO_SESSAO)
+
+    def gravar_json(caminho):
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(estado, f, ensure_ascii=False, indent=2)
+    _gravar_substituindo(os.path.join(diretorio, ARQUIVO_SESSAO), gravar_json)
+
+
+def carregar_sessao() -> dict:
+    """
+    Lê a sessão gravada no último fechamento.
+
+    Returns:
+        dict: O estado gravado, ou None se não houver sessão (ou ela for inválida).
+    """
+    try:
+        with open(os.path.join(diretorio_sessao(), ARQUIVO_SESSAO), encoding='utf-8') as f:
+            estado = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return estado if estado.get('versao') == VERSAO_SESSAO else None
+
+
+@cronometrado('carregar_cache_sessao')
+def carregar_cache():
+    """
+    Lê o catálogo guardado pela última sessão (sem reinterpretar a planilha).
+
+    Returns:
+        pd.DataFrame: O catálogo, ou None se o cache não existir ou não puder ser lido
+        (ex.: gravado por outra versão do pandas).
+    """
+    try:
+        return pd.read_pickle(os.path.join(diretorio_sessao(), ARQUIVO_CACHE))
+    except Exception as e:
+        print(f"Aviso: cache da sessão ignorado ({e}).")
+        return None
+
+
+def apagar_sessao():
+    """Remove a sessão e o cache (ex.: o catálogo em uso não veio de uma planilha)."""
+    for nome in (ARQUIVO_SESSAO, ARQUIVO_CACHE):
+        try:
+            os.remove(os.path.join(diretorio_sessao(), nome))
+        except FileNotFoundError:
+            pass
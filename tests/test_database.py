@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pandas as pd
+
+# Permite importar os módulos da aplicação (src/) sem instalação
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from database import COLUNAS_COMPARACAO, comparar_catalogos  # noqa: E402
+
+
+def test_comparar_catalogos_iguais_gera_relatorio_vazio():
+    catalogo = pd.DataFrame({'Descrição': ['SSD A', 'HD B'], 'Preço': [10.0, 20.0]})
+    
+    relatorio = comparar_catalogos(catalogo, catalogo.copy())
+    
+    assert relatorio.empty
+    assert list(relatorio.columns) == COLUNAS_COMPARACAO
+
+
+def test_comparar_catalogos_com_diferencas():
+    antigo = pd.DataFrame({'Descrição': ['SSD A', 'HD B'], 'Preço': [10.0, 20.0]})
+    novo = pd.DataFrame({'Descrição': ['SSD A', 'Mouse C'], 'Preço': [12.0, 30.0]})
+    
+    relatorio = comparar_catalogos(antigo, novo)
+    
+    assert list(relatorio['Situação']) == ['Aumentou', 'Novo', 'Removido']
+    assert list(relatorio.columns) == COLUNAS_COMPARACAO